@@ -18,6 +18,7 @@ from src.screen.mystic_info_state import MysticInfoState
 from src.screen.celestial_info_state import CelestialInfoState
 from src.screen.how_to_play_state import HowToPlayState
 from src.screen.battle_state import BattleState
+from src.utils import player
 
 
 # ตัวแปรสำหรับเก็บข้อมูลเกม
@@ -51,7 +52,8 @@ def save_player_data():
     global game, current_player
     
     if game and hasattr(game, 'current_player_slot') and game.current_player_slot:
-        if game.save_game():
+        # รอ thread บันทึกเขียนทุกอย่างที่ค้างให้เสร็จก่อนปิดโปรแกรม
+        if game.save_game(wait=True) and player.flush_all():
             print(f"Save Player {game.current_player_slot} Successfully")
         else:
             print("Save Player Fail")
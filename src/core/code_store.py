@@ -0,0 +1,354 @@
+"""CodeStore - ที่เก็บโค้ดแลกรางวัลแบบมี index (SQLite) รองรับโค้ดหลักล้าน
+
+    - โค้ดทั้งหมดอยู่ในตาราง codes (PRIMARY KEY = code) ค้นหา 1 โค้ด = 1 index lookup
+    - data/json/codes.json ยังแก้ด้วยมือได้ - จะถูกนำเข้าใหม่เฉพาะตอนไฟล์เปลี่ยน (ดู mtime/size)
+    - ผลการค้นหาเก็บใน LRU ในหน่วยความจำ (ล้างเมื่อข้อมูลเปลี่ยน) ขนาดคงที่ไม่ขึ้นกับจำนวนโค้ด
+    - import_codes() นำเข้าโค้ดทีละชุดใหญ่ใน transaction เดียว
+    - Bloom filter ของโค้ดทั้งหมดในหน่วยความจำ: โค้ดที่ไม่มีแน่นอน (กรณีส่วนใหญ่ = คนเดาโค้ด)
+      ถูกปฏิเสธโดยไม่ต้องค้นฐานข้อมูล filter ถูกเก็บใน meta พร้อม generation
+      (เลขที่เพิ่มทุกครั้งที่โค้ดเปลี่ยน) process อื่นที่เห็น generation ใหม่จะโหลด filter ใหม่
+      (หรือสร้างใหม่จากตาราง ถ้า filter ที่เก็บไว้เก่ากว่า) - add() ทีละโค้ดแค่เพิ่ม generation
+      ไม่เขียน filter ทั้งก้อน filter ถูกเขียนตอนนำเข้าจำนวนมากและตอน close()
+      (เกมเรียก close_code_store() ตอนปิดเกม)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.core.config import CODES_DB_PATH, CODES_JSON_PATH, CODE_CACHE_SIZE, CODE_BLOOM_ERROR_RATE
+from src.utils import bloom
+
+
+# source ของโค้ดที่มาจาก codes.json (นำเข้าใหม่ทั้งชุดเมื่อไฟล์เปลี่ยน)
+JSON_SOURCE = 'json'
+
+_MISSING = object()
+
+
+class CodeStore:
+    """โค้ดแลกรางวัลทั้งหมด (SQLite + Bloom filter + LRU cache)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS codes (
+            code        TEXT PRIMARY KEY,
+            coins       INTEGER NOT NULL,
+            description TEXT NOT NULL,
+            source      TEXT NOT NULL
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_codes_source ON codes (source);
+
+        CREATE TABLE IF NOT EXISTS meta (
+            key   TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db_path: str = CODES_DB_PATH, json_path: Optional[str] = CODES_JSON_PATH,
+                 cache_size: int = CODE_CACHE_SIZE):
+        """
+        Args:
+            db_path: ไฟล์ฐานข้อมูล
+            json_path: codes.json ที่นำเข้าอัตโนมัติ (None = ไม่ใช้)
+            cache_size: จำนวนโค้ดที่จำผลการค้นหาไว้
+        """
+        self.db_path = db_path
+        self.json_path = json_path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()  # code -> dict หรือ None (ไม่มีโค้ดนี้)
+        self._json_stamp = None
+        self._bloom = None
+        self._bloom_generation = None
+        self._bloom_dirty = False  # filter ในหน่วยความจำใหม่กว่าที่เก็บใน meta
+        self._data_version = None
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0  # จำนวนโค้ดที่ Bloom filter ปฏิเสธ (ไม่ได้ค้นฐานข้อมูล)
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(self.SCHEMA)
+
+    # ---------- codes.json ----------
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.json_path)
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def sync_json(self, default_codes: Optional[dict] = None) -> bool:
+        """
+        นำเข้า codes.json ใหม่ถ้าไฟล์เปลี่ยนตั้งแต่ครั้งก่อน (เช็คแค่ stat ไม่ได้อ่านไฟล์)
+
+        Args:
+            default_codes: โค้ดเริ่มต้น (ใช้สร้าง codes.json ถ้ายังไม่มีไฟล์)
+
+        Returns:
+            bool: มีการนำเข้าใหม่หรือไม่
+        """
+        if not self.json_path:
+            return False
+
+        stamp = self._stamp()
+        if stamp is None and default_codes is not None:
+            Path(self.json_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(self.json_path, 'w') as f:
+                json.dump(default_codes, f, indent=2)
+            stamp = self._stamp()
+        if stamp is None or stamp == self._json_stamp:
+            return False
+
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'json_stamp'").fetchone()
+        if row is not None and row[0] == stamp:
+            self._json_stamp = stamp
+            return False
+
+        try:
+            with open(self.json_path, 'r') as f:
+                codes = json.load(f)
+        except Exception as e:
+            print(f"Error loading codes: {e}")
+            return False
+
+        rows = [(code.strip().upper(), data.get('coins', 0), data.get('description', 'Bonus'))
+                for code, data in codes.items()]
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM codes WHERE source = ?", (JSON_SOURCE,))
+            # โค้ดใน codes.json แทนที่โค้ดชื่อเดียวกันจากแหล่งอื่น
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO codes (code, coins, description, source) VALUES (?, ?, ?, ?)",
+                [row + (JSON_SOURCE,) for row in rows]
+            )
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_stamp', ?)", (stamp,))
+            self._bloom_add(code for code, _, _ in rows)
+            self._commit_generation(persist=True)
+        self._json_stamp = stamp
+        self._cache.clear()
+        return True
+
+    # ---------- Bloom filter / การเปลี่ยนแปลงจาก process อื่น ----------
+
+    def _meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _refresh(self):
+        """
+        ตรวจว่ามี process อื่นแก้โค้ดหรือไม่ (PRAGMA data_version ไม่อ่านไฟล์) แล้วเตรียม filter
+
+        ต้องถือ self.lock อยู่
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._cache.clear()
+            if int(self._meta('generation') or 0) != self._bloom_generation:
+                self._bloom = None
+
+        if self._bloom is None or bloom.is_saturated(self._bloom):
+            self._load_bloom()
+
+    def _load_bloom(self):
+        """โหลด filter ที่เก็บไว้ (ถ้าตรง generation) ไม่งั้นสร้างใหม่จากทุกโค้ดแล้วเก็บไว้"""
+        generation = int(self._meta('generation') or 0)
+        blob = self._meta('bloom')
+        if blob is not None and int(self._meta('bloom_generation') or -1) == generation:
+            self._bloom = bloom.from_bytes(blob)
+        else:
+            count = self.conn.execute("SELECT COUNT(*) FROM codes").fetchone()[0]
+            cursor = self.conn.execute("SELECT code FROM codes")
+            self._bloom = bloom.build((code for (code,) in cursor), count, CODE_BLOOM_ERROR_RATE)
+            with self.conn:
+                self._store_bloom(generation)
+        self._bloom_generation = generation
+        self._bloom_dirty = False
+
+    def _store_bloom(self, generation):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bloom', ?)",
+                          (bloom.to_bytes(self._bloom),))
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('bloom_generation', ?)",
+                          (str(generation),))
+
+    def _bloom_add(self, codes):
+        """ใส่โค้ดใหม่ลง filter (ถ้าโหลดไว้แล้ว) - ต้องถือ self.lock อยู่"""
+        if self._bloom is not None:
+            bloom.add_all(self._bloom, codes)
+
+    def _commit_generation(self, persist=False):
+        """
+        เพิ่ม generation (เรียกใน transaction เดียวกับที่แก้โค้ด)
+
+        Args:
+            persist: เก็บ filter ที่อัปเดตแล้วลง meta ด้วย (ใช้กับการนำเข้าจำนวนมาก - ไฟล์ filter
+                ใหญ่หลาย MB ไม่ควรเขียนทุกครั้งที่เพิ่มโค้ดทีละตัว)
+
+        โค้ดที่ถูกลบยังค้างใน filter ได้ (แค่ตอบ "อาจมี" แล้วไปค้นฐานข้อมูล) จึงไม่ต้องสร้างใหม่
+        """
+        generation = int(self._meta('generation') or 0) + 1
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('generation', ?)", (str(generation),))
+        if self._bloom is not None and not bloom.is_saturated(self._bloom) \
+                and self._bloom_generation == generation - 1:
+            self._bloom_generation = generation
+            self._bloom_dirty = True
+            if persist:
+                self._store_bloom(generation)
+                self._bloom_dirty = False
+        else:
+            # filter เก่ากว่าฐานข้อมูล/เต็มแล้ว - สร้างใหม่ตอนใช้ครั้งถัดไป
+            self._bloom = None
+
+    # ---------- ค้นหา ----------
+
+    def get(self, code: str) -> Optional[dict]:
+        """
+        ข้อมูลของโค้ด
+
+        Returns:
+            dict: {'coins', 'description'} หรือ None ถ้าไม่มีโค้ดนี้
+        """
+        code = code.strip().upper()
+        with self.lock:
+            self._refresh()
+            if not bloom.might_contain(self._bloom, code):
+                self.rejected += 1
+                return None
+
+        cached = self._cache.get(code, _MISSING)
+        if cached is not _MISSING:
+            self._cache.move_to_end(code)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT coins, description FROM codes WHERE code = ?", (code,)
+            ).fetchone()
+        result = {'coins': row[0], 'description': row[1]} if row else None
+
+        self._cache[code] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def __contains__(self, code: str) -> bool:
+        return self.get(code) is not None
+
+    def count(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM codes").fetchone()[0]
+
+    def all_codes(self) -> dict:
+        """โค้ดทั้งหมด {code: {'coins', 'description'}} (อ่านทั้งตาราง - ใช้กับ admin เท่านั้น)"""
+        with self.lock:
+            rows = self.conn.execute("SELECT code, coins, description FROM codes").fetchall()
+        return {code: {'coins': coins, 'description': description} for code, coins, description in rows}
+
+    # ---------- เพิ่มโค้ด ----------
+
+    def add(self, code: str, coins: int, description: str = "Bonus", source: str = 'admin') -> bool:
+        """
+        เพิ่มโค้ด 1 ตัว (1 INSERT ไม่เขียนไฟล์ทั้งไฟล์ใหม่)
+
+        Returns:
+            bool: สำเร็จหรือไม่ (False = มีโค้ดนี้อยู่แล้ว)
+        """
+        code = code.strip().upper()
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO codes (code, coins, description, source) VALUES (?, ?, ?, ?)",
+                (code, coins, description, source)
+            )
+            if cursor.rowcount == 1:
+                self._bloom_add([code])
+                self._commit_generation()
+        self._cache.pop(code, None)
+        return cursor.rowcount == 1
+
+    def import_codes(self, rows: Iterable[tuple], source: str = 'batch', batch_size: int = 50_000) -> int:
+        """
+        นำเข้าโค้ดจำนวนมาก (โค้ดที่มีอยู่แล้วจะถูกข้าม)
+
+        Args:
+            rows: (code, coins, description) ทีละแถว - เป็น generator ได้ (ไม่ต้องโหลดทั้งหมดในหน่วยความจำ)
+            source: ชื่อชุดโค้ด (ใช้ลบทั้งชุดภายหลังได้)
+            batch_size: จำนวนแถวต่อการ executemany 1 ครั้ง
+
+        Returns:
+            int: จำนวนโค้ดที่เพิ่มจริง
+        """
+        added = 0
+        batch = []
+        with self.lock, self.conn:
+            for code, coins, description in rows:
+                batch.append((code.strip().upper(), int(coins), description, source))
+                if len(batch) >= batch_size:
+                    added += self._insert_batch(batch)
+                    batch = []
+            if batch:
+                added += self._insert_batch(batch)
+            if added:
+                self._commit_generation(persist=True)
+        self._cache.clear()
+        return added
+
+    def _insert_batch(self, batch):
+        before = self.conn.total_changes
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO codes (code, coins, description, source) VALUES (?, ?, ?, ?)", batch
+        )
+        self._bloom_add(row[0] for row in batch)
+        return self.conn.total_changes - before
+
+    def remove_source(self, source: str) -> int:
+        """ลบโค้ดทั้งชุดที่นำเข้าด้วย source นี้"""
+        with self.lock, self.conn:
+            cursor = self.conn.execute("DELETE FROM codes WHERE source = ?", (source,))
+            if cursor.rowcount:
+                self._commit_generation(persist=True)
+        self._cache.clear()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """ปิดฐานข้อมูล (เก็บ filter ที่ยังไม่ได้เขียนก่อน ถ้ายังตรงกับ generation ล่าสุด)"""
+        with self.lock:
+            if self._bloom_dirty:
+                with self.conn:
+                    # ล็อกก่อนเช็ค ไม่ให้ process อื่นเพิ่มโค้ดระหว่างเช็คกับเขียน
+                    self.conn.execute("BEGIN IMMEDIATE")
+                    if int(self._meta('generation') or 0) == self._bloom_generation:
+                        self._store_bloom(self._bloom_generation)
+            self._bloom_dirty = False
+            self.conn.close()
+
+
+_store = None
+
+
+def get_code_store() -> CodeStore:
+    """CodeStore ที่ใช้ในเกม (สร้างครั้งแรกครั้งเดียว)"""
+    global _store
+
+    if _store is None:
+        _store = CodeStore()
+    return _store
+
+
+def close_code_store() -> None:
+    """ปิด CodeStore ของเกม (เรียกตอนปิดเกม - เก็บ filter ที่ add() ค้างไว้ลงฐานข้อมูล)"""
+    global _store
+
+    if _store is not None:
+        _store.close()
+        _store = None
@@ -5,6 +5,30 @@ FPS = 60
 GAME_TITLE = "Gacha Legends: Tee Noi Edition"
 GAME_LOGO_PATH = 'assets/ui/logo.png'
 
+# cache รูป - ดู src/utils/assets.py
+IMAGE_CACHE_BYTES = 256 * 1024 * 1024   # ขนาดรวมของรูปใน cache (เกินแล้วทิ้งรูปที่ไม่ได้ใช้นานสุด)
+DERIVED_CACHE_BYTES = 64 * 1024 * 1024  # ขนาดรวมของรูปที่แปลงแล้ว (ย่อ/ขาวดำ/คูณสี) - assets.derive
+ASSET_PACK_PATH = 'data/assets.pack'   # รูปที่ถอดรหัสไว้แล้ว (สร้างด้วย src.tools.build_asset_pack) ไม่มีไฟล์ = โหลด PNG
+PRELOAD_WORKERS = 2                     # จำนวน thread ที่ถอดรหัสรูปล่วงหน้า
+
+# รูปย่อที่สร้างไว้ล่วงหน้า (smoothscale) เก็บบนดิสก์ - ดู src/utils/variants.py
+# load_image(path, 'ชื่อ variant') หรือ load_image(path, (w, h)) ที่ตรงกับ 'size' ได้รูปจากที่นี่
+VARIANT_CACHE_DIR = 'data/variants'
+IMAGE_VARIANTS = {
+    'assets/cards/': {
+        'card_thumb': {'size': (60, 84)},      # หน้า info / รูปย่อผลสุ่ม
+        'card_chest': {'size': (100, 140)},    # หน้ากล่องสุ่ม
+        'card_battle': {'size': (120, 160)},   # หน้า battle
+    },
+    'assets/portraits/': {
+        'lobby_small': {'factor': 0.3},        # lobby ตัวข้าง
+        'lobby_large': {'factor': 0.4},        # lobby ตัวกลาง
+        'book_list': {'height': 300},          # หน้าสมุด (รายการ)
+        'book_info': {'height': 350},          # หน้าสมุด (รายละเอียด)
+        'new_hero': {'height': 400},           # ได้ฮีโร่ใหม่
+    },
+}
+
 # สี
 COLOR_WHITE = (255, 255, 255)
 COLOR_BLACK = (0, 0, 0)
@@ -17,6 +41,33 @@ STARTING_COINS = 1000  # เหรียญเริ่มต้น
 DAILY_BONUS = 100      # โบนัสรายวัน
 TOTAL_HEROES = 21      # จำนวนฮีโร่ทั้งหมด
 
+# ไฟล์ตั้งค่ากล่องสุ่ม (อัตรา + ราคา) แก้ได้ระหว่างเล่น เกมจะโหลดใหม่เอง
+# ค่าด้านล่าง (SUMMON_COSTS, RARITY_RATES, MYSTIC_RATES) ใช้เมื่อไม่มีไฟล์นี้
+BANNER_CONFIG_PATH = 'data/json/banners.json'
+BANNER_RELOAD_INTERVAL = 1.0  # วินาทีระหว่างการเช็ค mtime ของไฟล์
+
+# บันทึกเหตุการณ์ (summon / redeem / battle) - ดู src/utils/journal.py
+JOURNAL_PATH = 'data/journal/events.jsonl'
+JOURNAL_FLUSH_BYTES = 64 * 1024        # เขียนลงไฟล์เมื่อ buffer เกินขนาดนี้
+JOURNAL_FLUSH_SECONDS = 2.0            # หรือเมื่อค้างใน buffer นานเกินนี้
+JOURNAL_MAX_BYTES = 8 * 1024 * 1024    # หมุนไฟล์เมื่อใหญ่เกินนี้
+JOURNAL_KEEP = 5                       # จำนวนไฟล์เก่าที่เก็บไว้
+
+# บันทึกข้อมูลผู้เล่น - ดู src/core/storage.py
+STORAGE_BACKEND = 'json'       # 'json' (ไฟล์แยกต่อ slot) หรือ 'sqlite' (ผู้เล่นจำนวนมาก)
+SAVE_DIR = 'data/json'
+SQLITE_PATH = 'data/game.db'
+SAVE_FORMAT = 'json'           # (json backend) 'json' หรือ 'binary' (ไฟล์ .sav กะทัดรัด โหลดเร็ว)
+SAVE_COMPACT_RECORDS = 64      # (json) รวม log เป็น snapshot ใหม่ทุกๆ กี่ครั้งที่ save
+SAVE_IN_BACKGROUND = True      # บันทึกใน thread แยก (ไม่กระตุกระหว่างเล่น) - False = บันทึกทันที
+LEADERBOARD_SIZE = 4           # จำนวนอันดับที่แสดงในหน้า leaderboard
+
+# โค้ดแลกรางวัล - ดู src/core/code_store.py
+CODES_JSON_PATH = 'data/json/codes.json'   # แก้ด้วยมือได้ นำเข้าใหม่อัตโนมัติเมื่อไฟล์เปลี่ยน
+CODES_DB_PATH = 'data/codes.db'
+CODE_CACHE_SIZE = 4096                      # จำนวนโค้ดที่จำผลการค้นหาไว้ในหน่วยความจำ
+CODE_BLOOM_ERROR_RATE = 0.01                # โอกาสที่โค้ดผิดหลุด Bloom filter ไปค้นฐานข้อมูล
+
 # ราคาสุ่ม
 SUMMON_COSTS = {
     'mystic_x1': 100,
@@ -25,7 +76,7 @@ SUMMON_COSTS = {
     'celestial_x10': 1500
 }
 
-# อัตราความหายาก
+# อัตราความหายาก (Celestial Chest)
 RARITY_RATES = {
     'rare': 0.70,   # 70% 
     'epic': 0.25,   # 25%
@@ -33,6 +84,13 @@ RARITY_RATES = {
     'extreme': 0.01  # 1%  
 }
 
+# อัตราความหายาก Mystic Chest (ไม่มี EXTREME)
+MYSTIC_RATES = {
+    'rare': 0.80,   # 80%
+    'epic': 0.19,   # 19%
+    'legendary': 0.01  # 1%
+}
+
 # path ของ assets
 ASSET_PATHS = {
     'backgrounds': {
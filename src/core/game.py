@@ -3,6 +3,8 @@
 import pygame
 import sys
 from src.core.state_manager import StateManager
+from src.data import banner_data
+from src.utils import assets, journal
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, GAME_LOGO_PATH
 
 
@@ -22,6 +24,9 @@ class Game:
         self.state_manager = StateManager()
         self.current_player_slot = None  # เก็บ slot ของผู้เล่นปัจจุบัน (1 หรือ 2)
         
+        # โหลดตั้งค่ากล่องสุ่มใหม่อัตโนมัติเมื่อไฟล์เปลี่ยน (ทำใน thread แยก)
+        banner_data.start_watcher()
+        
         # ระบบเพลง
         self.music_loaded = False
         # ไม่โหลดเพลงตอน init แล้ว จะโหลดตอนเลือกผู้เล่น
@@ -37,12 +42,17 @@ class Game:
     def quit(self):
         self.running = False
 
-    def save_game(self, filepath=None):
-        """บันทึกข้อมูลผู้เล่นปัจจุบัน"""
+    def save_game(self, filepath=None, wait=False):
+        """
+        บันทึกข้อมูลผู้เล่นปัจจุบัน
+
+        Args:
+            wait: False = เขียนใน thread แยก (ไม่บล็อกเฟรม), True = รอจนเขียนเสร็จ
+        """
         from src.utils import player
         
         if hasattr(self, 'player_data') and hasattr(self, 'current_player_slot'):
-            return player.save_player_data(self.player_data, self.current_player_slot)
+            return player.save_player_data(self.player_data, self.current_player_slot, wait=wait)
         return False
     
     def load_player_data(self, player_slot):
@@ -138,5 +148,20 @@ class Game:
             self.state_manager.draw(self.screen)
             pygame.display.flip()
 
+            # เอารูปที่ preload เสร็จแล้วเข้า cache (convert ต้องทำบน main thread)
+            assets.process_preloaded()
+
+            # เขียน journal ที่ค้างเกินเวลาที่กำหนด
+            journal.flush_if_due()
+
+        # บันทึกข้อมูลผู้เล่นทุก slot ที่ยังค้าง แล้วรอ thread บันทึกเขียนให้เสร็จ
+        from src.utils import player
+        player.flush_all()
+
+        # เก็บ Bloom filter ของโค้ด (add() ทีละโค้ดไม่เขียน filter - ครั้งหน้าไม่ต้องสร้างใหม่)
+        from src.core.code_store import close_code_store
+        close_code_store()
+
+        journal.flush()
         pygame.quit()
         sys.exit()
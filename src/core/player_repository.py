@@ -0,0 +1,149 @@
+"""PlayerRepository - cache ข้อมูลผู้เล่นในหน่วยความจำ ใช้ร่วมกันทุกหน้าจอ
+
+ทุกหน้าจอที่ขอข้อมูล slot เดียวกันจะได้ dict ตัวเดียวกัน (live object)
+การแก้ไขต้องบอก repository ผ่าน touch/mark_dirty แล้วจะถูกเขียนลง storage ตอน flush เท่านั้น
+ถ้ามี SaveWorker การเขียนจะทำใน thread แยก (flush คัดลอกข้อมูลบน main thread แล้วส่งไปเขียน)
+ถ้า worker เขียนไม่สำเร็จ slot นั้นจะกลับมา dirty อีกครั้ง (flush ครั้งหน้าจะลองใหม่)
+"""
+
+import copy
+from typing import Callable, Optional
+
+from src.core.save_worker import SaveWorker
+from src.core.storage import Storage
+
+
+class PlayerRepository:
+    """cache ของ player_data แยกตาม slot + ติดตาม field ที่เปลี่ยน"""
+
+    # field=None ใน dirty set = ไม่รู้ว่าเปลี่ยนอะไร (บันทึกทั้งหมด)
+    ALL = None
+
+    def __init__(self, storage: Storage, loader: Callable[[int], dict],
+                 worker: Optional[SaveWorker] = None):
+        """
+        Args:
+            storage: backend ที่ใช้อ่าน/เขียน
+            loader: ฟังก์ชันโหลดข้อมูลผู้เล่นจาก storage (เติมค่าที่ขาด/สร้างใหม่ถ้าไม่มี)
+            worker: thread สำหรับเขียนเบื้องหลัง (None = เขียนทันทีใน thread ที่เรียก)
+        """
+        self.storage = storage
+        self.loader = loader
+        self.worker = worker
+        self._profiles: dict[int, dict] = {}
+        self._slots_by_id: dict[int, int] = {}  # id(dict) -> slot
+        self._dirty: dict[int, set] = {}
+
+    def get(self, slot: int) -> dict:
+        """ข้อมูลผู้เล่นของ slot (โหลดจาก storage ครั้งแรกครั้งเดียว)"""
+        data = self._profiles.get(slot)
+        if data is None:
+            data = self.loader(slot)
+            self._remember(slot, data)
+        return data
+
+    def adopt(self, slot: int, data: dict) -> dict:
+        """ใช้ dict นี้เป็นข้อมูลของ slot แทนของเดิม (ทั้งหมดถือว่าเปลี่ยน)"""
+        old = self._profiles.get(slot)
+        if old is not None:
+            self._slots_by_id.pop(id(old), None)
+        self._remember(slot, data)
+        self.mark_dirty(slot)
+        return data
+
+    def _remember(self, slot, data):
+        self._profiles[slot] = data
+        self._slots_by_id[id(data)] = slot
+
+    def slot_of(self, data: dict) -> Optional[int]:
+        """slot ของ dict นี้ (None ถ้าไม่ได้มาจาก repository)"""
+        slot = self._slots_by_id.get(id(data))
+        if slot is not None and self._profiles.get(slot) is data:
+            return slot
+        return None
+
+    def is_loaded(self, slot: int) -> bool:
+        return slot in self._profiles
+
+    def mark_dirty(self, slot: int, *fields: str) -> None:
+        """บอกว่าข้อมูลของ slot เปลี่ยน (ไม่ระบุ field = ทั้งหมด)"""
+        dirty = self._dirty.setdefault(slot, set())
+        dirty.update(fields or (self.ALL,))
+
+    def touch(self, data: dict, *fields: str) -> None:
+        """เหมือน mark_dirty แต่ระบุด้วย dict (ใช้ในฟังก์ชันที่ไม่รู้ slot)"""
+        slot = self.slot_of(data)
+        if slot is not None:
+            self.mark_dirty(slot, *fields)
+
+    def _restore_failed(self) -> None:
+        """นำ slot ที่ worker เขียนไม่สำเร็จกลับมาเป็น dirty (ไม่ให้การเปลี่ยนแปลงหาย)"""
+        if self.worker is None:
+            return
+        for slot, fields in self.worker.take_failed().items():
+            if fields is None:
+                self.mark_dirty(slot)
+            else:
+                self.mark_dirty(slot, *fields)
+
+    def dirty_fields(self, slot: int) -> set:
+        self._restore_failed()
+        return set(self._dirty.get(slot, ()))
+
+    def is_dirty(self, slot: Optional[int] = None) -> bool:
+        self._restore_failed()
+        if slot is None:
+            return any(self._dirty.values())
+        return bool(self._dirty.get(slot))
+
+    def flush(self, slot: Optional[int] = None, wait: bool = True) -> bool:
+        """
+        เขียนข้อมูลที่เปลี่ยนลง storage
+
+        Args:
+            slot: slot ที่ต้องการ (ไม่ระบุ = ทุก slot ที่เปลี่ยน)
+            wait: (มี worker) รอจนเขียนเสร็จหรือไม่ - False = ส่ง snapshot ไปแล้วกลับทันที
+
+        Returns:
+            bool: สำเร็จทั้งหมดหรือไม่ (wait=False = ส่งเข้าคิวสำเร็จ)
+        """
+        self._restore_failed()
+        slots = [slot] if slot is not None else list(self._dirty)
+        ok = True
+        for s in slots:
+            fields = self._dirty.get(s)
+            if not fields or s not in self._profiles:
+                continue
+            fields = None if self.ALL in fields else fields
+            if self.worker is not None:
+                # snapshot บน main thread - หลังจากนี้แก้ข้อมูลต่อได้โดยไม่กระทบสิ่งที่กำลังเขียน
+                self.worker.submit(s, copy.deepcopy(self._profiles[s]), fields)
+            else:
+                try:
+                    self.storage.save_player(s, self._profiles[s], fields)
+                except Exception as e:
+                    print(f"Error saving player {s}: {e}")
+                    ok = False
+                    continue
+            del self._dirty[s]
+
+        if self.worker is not None and wait:
+            ok = self.worker.drain() and ok
+            self._restore_failed()
+        return ok
+
+    def leaderboard(self, order: str = 'rank', limit: Optional[int] = None) -> list[dict]:
+        """อันดับผู้เล่นทุก slot (ใช้ข้อมูลใน cache ไม่ parse ไฟล์ซ้ำ)"""
+        self.flush(wait=True)
+        return self.storage.leaderboard(order, limit, load=self.get)
+
+    def invalidate(self, slot: Optional[int] = None) -> None:
+        """ทิ้ง cache (ครั้งหน้าจะโหลดจาก storage ใหม่) - flush ก่อนถ้ามีข้อมูลค้าง"""
+        slots = [slot] if slot is not None else list(self._profiles)
+        for s in slots:
+            self.flush(s, wait=True)
+            if self.is_dirty(s):
+                continue  # เขียนไม่สำเร็จ - เก็บไว้ใน cache ก่อน (ไม่ให้ข้อมูลหาย)
+            data = self._profiles.pop(s, None)
+            if data is not None:
+                self._slots_by_id.pop(id(data), None)
@@ -0,0 +1,109 @@
+"""SaveWorker - เขียนข้อมูลผู้เล่นลง storage ใน thread แยก
+
+main thread ส่งสำเนาข้อมูล (snapshot ณ ตอนสั่ง save) มาให้ แล้วเล่นต่อได้ทันที
+ถ้าสั่ง save slot เดิมซ้ำก่อนเขียนเสร็จ จะรวมเป็นครั้งเดียว (เขียนแค่ snapshot ล่าสุด)
+ตอนปิดเกมต้องเรียก drain() เพื่อรอให้เขียนครบ
+ถ้าเขียนไม่สำเร็จ slot/field นั้นจะถูกเก็บไว้ให้เจ้าของข้อมูลดึงไปสั่ง save ใหม่ (take_failed)
+"""
+
+import threading
+from typing import Optional
+
+from src.core.storage import Storage
+
+
+class SaveWorker:
+    """คิวการ save แยกตาม slot + thread เขียนไฟล์ 1 ตัว"""
+
+    def __init__(self, storage: Storage):
+        self.storage = storage
+        self._pending: dict[int, tuple] = {}  # slot -> (snapshot, fields)
+        self._cond = threading.Condition()
+        self._busy = False
+        self._errors: list[tuple] = []
+        self._failed: dict[int, Optional[set]] = {}  # slot -> field ที่เขียนไม่สำเร็จ (None = ทั้งหมด)
+        self._thread = None
+        self.saves = 0       # จำนวนครั้งที่เขียนจริง
+        self.coalesced = 0   # จำนวนครั้งที่ถูกรวมกับครั้งก่อน
+
+    def submit(self, slot: int, snapshot: dict, fields: Optional[set] = None) -> None:
+        """
+        ส่งข้อมูลไปเขียน (ไม่รอ)
+
+        Args:
+            slot: slot ของผู้เล่น
+            snapshot: สำเนาข้อมูลผู้เล่น (ห้ามแก้หลังส่ง)
+            fields: key ที่เปลี่ยน (None = ทั้งหมด)
+        """
+        with self._cond:
+            previous = self._pending.get(slot)
+            if previous is not None:
+                # ยังไม่ได้เขียนครั้งก่อน - ใช้ snapshot ใหม่ + รวม field ที่เปลี่ยน
+                old_fields = previous[1]
+                fields = None if old_fields is None or fields is None else old_fields | fields
+                self.coalesced += 1
+            self._pending[slot] = (snapshot, fields)
+            self._ensure_thread()
+            self._cond.notify_all()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='save-worker', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                slot = next(iter(self._pending))
+                snapshot, fields = self._pending.pop(slot)
+                self._busy = True
+
+            try:
+                self.storage.save_player(slot, snapshot, fields)
+                self.saves += 1
+            except Exception as e:
+                print(f"Error saving player {slot}: {e}")
+                with self._cond:
+                    self._errors.append((slot, e))
+                    if slot in self._failed:
+                        old_fields = self._failed[slot]
+                        fields = None if old_fields is None or fields is None else old_fields | fields
+                    self._failed[slot] = fields
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def take_failed(self) -> dict:
+        """
+        slot ที่เขียนไม่สำเร็จตั้งแต่เรียกครั้งก่อน (ดึงแล้วล้าง - drain ครั้งต่อไปจะไม่นับ error เหล่านี้อีก)
+
+        Returns:
+            dict: slot -> set ของ field ที่ยังไม่ได้เขียน (None = ทั้งหมด)
+        """
+        with self._cond:
+            failed, self._failed = self._failed, {}
+            self._errors = []
+        return failed
+
+    def pending(self) -> int:
+        """จำนวน slot ที่รอเขียน (รวมที่กำลังเขียน)"""
+        with self._cond:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        รอจนเขียนครบทุก slot
+
+        Args:
+            timeout: เวลารอสูงสุด (วินาที) ไม่ระบุ = รอจนเสร็จ
+
+        Returns:
+            bool: เขียนครบและไม่มี error ตั้งแต่ drain ครั้งก่อน
+        """
+        with self._cond:
+            done = self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+            errors, self._errors = self._errors, []
+        return done and not errors
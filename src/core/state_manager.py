@@ -1,6 +1,7 @@
 """State manager for handling game state transitions"""
 import pygame
 from src.ui.animation import FadeTransition
+from src.utils import assets
 
 
 class StateManager:
@@ -49,15 +50,17 @@ class StateManager:
         self._perform_state_change(name)
 
     def _perform_state_change(self, name):
-        # ออกจาก state เดิม
+        # ออกจาก state เดิม (ปล่อยรูปที่ pin ไว้ตอนอยู่หน้านั้น)
         if self.current_state:
             self.current_state.exit()
+            assets.end_pin_scope(self.current_state_name)
 
         # เปลี่ยนเป็น state ใหม่
         self.current_state_name = name
         self.current_state = self.states[name]
 
-        # เข้า state ใหม่
+        # เข้า state ใหม่ - รูปที่โหลดระหว่างอยู่หน้านี้ถูก pin ไว้ไม่ให้หลุดจาก cache
+        assets.begin_pin_scope(name)
         self.current_state.enter()
 
         # สำหรับ flow เดิม (เฟดออก->เข้า): จบขั้นออกแล้วเริ่มเข้า
@@ -0,0 +1,458 @@
+"""ที่เก็บข้อมูลผู้เล่น (Storage backend) - เลือกได้ระหว่างไฟล์ JSON และ SQLite
+
+ทุก backend มี interface เดียวกัน:
+    load_player / save_player / list_slots    - ข้อมูลผู้เล่นกี่ slot ก็ได้
+    load_used_codes / add_used_code / is_code_used - โค้ดที่ใช้แล้ว
+    claim_code                                  - ใช้โค้ดแบบ atomic (หลาย process พร้อมกันได้)
+    leaderboard                                 - อันดับตามแต้มชนะหรือพลังรวม
+
+เลือก backend ด้วย STORAGE_BACKEND ใน config ('json' หรือ 'sqlite')
+backend 'json' เก็บข้อมูลผู้เล่นเป็น JSON + WAL หรือไฟล์ binary (.sav) ตาม SAVE_FORMAT
+"""
+
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from src.core.config import STORAGE_BACKEND, SAVE_DIR, SQLITE_PATH, SAVE_FORMAT
+from src.data.hero_collection import HeroCollection
+from src.data.hero_data import get_hero
+from src.utils import filelock, save_format, wal
+
+
+# คอลัมน์ที่ใช้เรียงอันดับได้
+LEADERBOARD_ORDERS = ('rank', 'total_power')
+
+
+def total_power(data: dict) -> int:
+    """พลังรวมของฮีโร่ทั้งหมดในข้อมูลผู้เล่น"""
+    owned = data.get('owned_heroes', [])
+    if isinstance(owned, HeroCollection):
+        return owned.total_power
+    total = 0
+    for hero_id in owned:
+        hero = get_hero(hero_id)
+        if hero:
+            total += hero.power
+    return total
+
+
+def leaderboard_entry(slot: int, data: dict) -> dict:
+    """สรุปข้อมูลผู้เล่น 1 คนสำหรับหน้า leaderboard"""
+    return {
+        'slot': slot,
+        'name': f'Player {slot}',
+        'rank': data.get('rank', 0),
+        'heroes': len(data.get('owned_heroes', [])),
+        'coins': data.get('coins', 0),
+        'total_power': total_power(data),
+    }
+
+
+class Storage:
+    """interface ของ backend (JsonStorage / SqliteStorage)"""
+
+    name = 'base'
+    # เวอร์ชันของข้อมูลที่ load_player คืนมา (0 = JSON เดิม key อาจไม่ครบ ดู save_format.upgrade)
+    schema_version = 0
+
+    def load_player(self, slot: int) -> Optional[dict]:
+        raise NotImplementedError
+
+    def save_player(self, slot: int, data: dict, fields: Optional[set] = None) -> None:
+        """บันทึกข้อมูลผู้เล่น (fields = key ที่เปลี่ยน ถ้ารู้ - backend ใช้ลดงานได้)"""
+        raise NotImplementedError
+
+    def list_slots(self) -> list[int]:
+        raise NotImplementedError
+
+    def load_used_codes(self, slot: int) -> set:
+        raise NotImplementedError
+
+    def add_used_code(self, slot: int, code: str) -> None:
+        raise NotImplementedError
+
+    def is_code_used(self, slot: int, code: str) -> bool:
+        return code in self.load_used_codes(slot)
+
+    def claim_code(self, slot: int, code: str) -> bool:
+        """
+        ตรวจและบันทึกว่าใช้โค้ดแล้วในขั้นตอนเดียว (check-and-set)
+
+        Returns:
+            bool: True = ครั้งนี้ได้ใช้โค้ด, False = เคยใช้ไปแล้ว
+        """
+        if self.is_code_used(slot, code):
+            return False
+        self.add_used_code(slot, code)
+        return True
+
+    def leaderboard(self, order: str = 'rank', limit: Optional[int] = None, load=None) -> list[dict]:
+        """
+        เรียงผู้เล่นทุก slot ตาม order (มากไปน้อย)
+
+        Args:
+            load: ฟังก์ชันโหลดข้อมูลผู้เล่นตาม slot (เช่น PlayerRepository.get) ไม่ระบุ = load_player
+        """
+        if order not in LEADERBOARD_ORDERS:
+            raise ValueError(f"Unknown leaderboard order: {order!r}")
+        load = load or self.load_player
+        entries = []
+        for slot in self.list_slots():
+            data = load(slot)
+            if data is not None:
+                entries.append(leaderboard_entry(slot, data))
+        entries.sort(key=lambda entry: (-entry[order], entry['slot']))
+        return entries[:limit] if limit else entries
+
+    def close(self) -> None:
+        pass
+
+
+class JsonStorage(Storage):
+    """
+    เก็บเป็นไฟล์ JSON แยกต่อ slot (save_data_player{slot}.json + .wal)
+
+    โค้ดที่ใช้แล้ว: used_codes_player{slot}.json + used_codes_player{slot}.log
+    (โค้ดใหม่ต่อท้าย .log ทีละบรรทัด ไม่เขียนไฟล์ทั้งไฟล์ใหม่)
+    การเขียนทุกครั้งล็อกไฟล์ (filelock) - หลาย process ใช้โฟลเดอร์เดียวกันได้ไม่ทับกัน
+    """
+
+    name = 'json'
+
+    def __init__(self, directory: str = SAVE_DIR):
+        self.directory = directory
+        self._used_cache = {}  # slot -> (stat ของไฟล์, set ของโค้ด)
+
+    def player_path(self, slot: int) -> str:
+        return os.path.join(self.directory, f"save_data_player{slot}.json")
+
+    def used_codes_path(self, slot: int) -> str:
+        return os.path.join(self.directory, f"used_codes_player{slot}.json")
+
+    def load_player(self, slot):
+        return wal.load(self.player_path(slot))
+
+    def save_player(self, slot, data, fields=None):
+        # diff กับที่ save ล่าสุดอยู่แล้ว ไม่ต้องใช้ fields
+        wal.save(self.player_path(slot), data)
+
+    def list_slots(self):
+        slots = set()
+        for path in glob.glob(os.path.join(self.directory, 'save_data_player*.json*')):
+            match = re.search(r'save_data_player(\d+)\.json(\.wal)?$', path)
+            if match:
+                slots.add(int(match.group(1)))
+        return sorted(slots)
+
+    def used_codes_log_path(self, slot: int) -> str:
+        return os.path.join(self.directory, f"used_codes_player{slot}.log")
+
+    def _used_codes_stamp(self, slot):
+        stamp = []
+        for path in (self.used_codes_path(slot), self.used_codes_log_path(slot)):
+            try:
+                stat = os.stat(path)
+                stamp.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def _read_used_codes(self, slot):
+        used_codes = set()
+        filepath = self.used_codes_path(slot)
+        if os.path.exists(filepath):
+            try:
+                with open(filepath, 'r') as f:
+                    used_codes.update(json.load(f).get('codes', []))
+            except Exception as e:
+                print(f"Error loading used codes: {e}")
+
+        log_path = self.used_codes_log_path(slot)
+        if os.path.exists(log_path):
+            with open(log_path, 'r') as f:
+                # บรรทัดสุดท้ายที่ไม่มี newline = เขียนไม่จบ ข้ามไป
+                used_codes.update(line.strip() for line in f if line.endswith('\n') and line.strip())
+        return used_codes
+
+    def load_used_codes(self, slot):
+        # อ่านไฟล์ใหม่เฉพาะตอนไฟล์เปลี่ยน (mtime/size) - ไม่งั้นใช้ชุดเดิมในหน่วยความจำ
+        stamp = self._used_codes_stamp(slot)
+        cached = self._used_cache.get(slot)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, self._read_used_codes(slot))
+            self._used_cache[slot] = cached
+        return set(cached[1])
+
+    def is_code_used(self, slot, code):
+        self.load_used_codes(slot)
+        return code in self._used_cache[slot][1]
+
+    def add_used_code(self, slot, code):
+        with filelock.locked(self.used_codes_path(slot)):
+            self._append_used_code(slot, code)
+
+    def claim_code(self, slot, code):
+        # ล็อกไว้ระหว่างตรวจ + ต่อท้าย - process อื่นต้องรอ จึงเห็นโค้ดนี้แล้วเสมอ
+        with filelock.locked(self.used_codes_path(slot)):
+            if self.is_code_used(slot, code):
+                return False
+            self._append_used_code(slot, code)
+            return True
+
+    def _append_used_code(self, slot, code):
+        log_path = self.used_codes_log_path(slot)
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(code + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BinaryStorage(JsonStorage):
+    """
+    เหมือน JsonStorage แต่ข้อมูลผู้เล่นเป็นไฟล์ binary save_data_player{slot}.sav (ดู save_format)
+
+    ไฟล์ JSON เดิมของ slot ที่ยังไม่มี .sav จะถูกแปลงตอนโหลดครั้งแรก (ไฟล์เดิมไม่ถูกลบ)
+    โค้ดที่ใช้แล้วยังเก็บแบบเดียวกับ JsonStorage
+    """
+
+    name = 'binary'
+    schema_version = save_format.SCHEMA_VERSION
+
+    def player_path(self, slot):
+        return os.path.join(self.directory, f"save_data_player{slot}.sav")
+
+    def json_player_path(self, slot):
+        return super().player_path(slot)
+
+    def load_player(self, slot):
+        filepath = self.player_path(slot)
+        if os.path.exists(filepath):
+            with open(filepath, 'rb') as f:
+                return save_format.decode(f.read())
+
+        # ยังไม่มี .sav - แปลงจาก JSON เดิม (ถ้ามี)
+        data = wal.load(self.json_player_path(slot))
+        if data is None:
+            return None
+        data = save_format.upgrade(data)
+        self.save_player(slot, data)
+        print(f"Converted Player {slot} save to {filepath}")
+        return data
+
+    def save_player(self, slot, data, fields=None):
+        # snapshot เต็มทุกครั้ง (ไฟล์เล็ก) - เขียนไฟล์ชั่วคราว -> fsync -> os.replace
+        filepath = self.player_path(slot)
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{filepath}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(save_format.encode(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+
+    def list_slots(self):
+        slots = set(super().list_slots())
+        for path in glob.glob(os.path.join(self.directory, 'save_data_player*.sav')):
+            match = re.search(r'save_data_player(\d+)\.sav$', path)
+            if match:
+                slots.add(int(match.group(1)))
+        return sorted(slots)
+
+
+class SqliteStorage(Storage):
+    """เก็บใน SQLite (WAL mode) - รองรับผู้เล่นหลายพันคน มี index สำหรับ leaderboard"""
+
+    name = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS players (
+            slot        INTEGER PRIMARY KEY,
+            coins       INTEGER NOT NULL,
+            rank        INTEGER NOT NULL,
+            total_power INTEGER NOT NULL,
+            hero_count  INTEGER NOT NULL,
+            settings    TEXT NOT NULL,
+            extra       TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_players_rank ON players (rank DESC, slot);
+        CREATE INDEX IF NOT EXISTS idx_players_power ON players (total_power DESC, slot);
+
+        CREATE TABLE IF NOT EXISTS owned_heroes (
+            slot    INTEGER NOT NULL,
+            pos     INTEGER NOT NULL,
+            hero_id INTEGER NOT NULL,
+            PRIMARY KEY (slot, pos)
+        );
+
+        CREATE TABLE IF NOT EXISTS used_codes (
+            slot INTEGER NOT NULL,
+            code TEXT NOT NULL,
+            PRIMARY KEY (slot, code)
+        );
+    """
+
+    # คอลัมน์ที่แยกออกมา (ที่เหลือใน player_data เก็บรวมใน extra)
+    COLUMNS = ('coins', 'rank', 'owned_heroes', 'settings')
+
+    def __init__(self, filepath: str = SQLITE_PATH):
+        self.filepath = filepath
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        # ใช้ได้จากหลาย thread (save worker) - ล็อกเองทุกครั้งที่ใช้
+        # timeout: รอ process อื่นที่กำลังเขียนอยู่แทนที่จะ error ทันที
+        self.conn = sqlite3.connect(filepath, timeout=30, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(self.SCHEMA)
+
+    def load_player(self, slot):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT coins, rank, settings, extra FROM players WHERE slot = ?", (slot,)
+            ).fetchone()
+            if row is None:
+                return None
+            heroes = self.conn.execute(
+                "SELECT hero_id FROM owned_heroes WHERE slot = ? ORDER BY pos", (slot,)
+            ).fetchall()
+
+        coins, rank, settings, extra = row
+        data = json.loads(extra)
+        data.update({
+            'coins': coins,
+            'owned_heroes': [hero_id for (hero_id,) in heroes],
+            'settings': json.loads(settings),
+            'rank': rank,
+        })
+        return data
+
+    def save_player(self, slot, data, fields=None):
+        heroes = list(data.get('owned_heroes', []))
+        extra = {key: value for key, value in data.items() if key not in self.COLUMNS}
+
+        with self.lock, self.conn:
+            self.conn.execute(
+                """INSERT INTO players (slot, coins, rank, total_power, hero_count, settings, extra)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(slot) DO UPDATE SET
+                       coins = excluded.coins, rank = excluded.rank,
+                       total_power = excluded.total_power, hero_count = excluded.hero_count,
+                       settings = excluded.settings, extra = excluded.extra""",
+                (slot, data.get('coins', 0), data.get('rank', 0), total_power(data), len(heroes),
+                 json.dumps(data.get('settings', {})), json.dumps(extra))
+            )
+
+            # ฮีโร่: ข้ามถ้ารู้ว่าไม่เปลี่ยน / ถ้าต่อท้ายอย่างเดียว (กรณีปกติ) เพิ่มเฉพาะตัวใหม่
+            if fields is not None and 'owned_heroes' not in fields:
+                return
+            stored = [hero_id for (hero_id,) in self.conn.execute(
+                "SELECT hero_id FROM owned_heroes WHERE slot = ? ORDER BY pos", (slot,))]
+            if heroes[:len(stored)] != stored:
+                self.conn.execute("DELETE FROM owned_heroes WHERE slot = ?", (slot,))
+                stored = []
+            self.conn.executemany(
+                "INSERT INTO owned_heroes (slot, pos, hero_id) VALUES (?, ?, ?)",
+                [(slot, pos, hero_id) for pos, hero_id in enumerate(heroes) if pos >= len(stored)]
+            )
+
+    def list_slots(self):
+        with self.lock:
+            return [slot for (slot,) in self.conn.execute("SELECT slot FROM players ORDER BY slot")]
+
+    def load_used_codes(self, slot):
+        with self.lock:
+            return {code for (code,) in self.conn.execute(
+                "SELECT code FROM used_codes WHERE slot = ?", (slot,))}
+
+    def add_used_code(self, slot, code):
+        with self.lock, self.conn:
+            self.conn.execute("INSERT OR IGNORE INTO used_codes (slot, code) VALUES (?, ?)", (slot, code))
+
+    def is_code_used(self, slot, code):
+        with self.lock:
+            return self.conn.execute(
+                "SELECT 1 FROM used_codes WHERE slot = ? AND code = ?", (slot, code)
+            ).fetchone() is not None
+
+    def claim_code(self, slot, code):
+        # PRIMARY KEY (slot, code) ทำให้ INSERT สำเร็จได้ครั้งเดียว แม้หลาย process พร้อมกัน
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO used_codes (slot, code) VALUES (?, ?)", (slot, code))
+        return cursor.rowcount == 1
+
+    def leaderboard(self, order='rank', limit=None, load=None):
+        # ข้อมูลอยู่ในฐานข้อมูลแล้ว (PlayerRepository flush ก่อนเรียก) ไม่ต้องใช้ load
+        if order not in LEADERBOARD_ORDERS:
+            raise ValueError(f"Unknown leaderboard order: {order!r}")
+        # ใช้ index ของคอลัมน์ที่เรียง (order มาจาก LEADERBOARD_ORDERS เท่านั้น)
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT slot, rank, hero_count, coins, total_power FROM players "
+                f"ORDER BY {order} DESC, slot LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        return [
+            {'slot': slot, 'name': f'Player {slot}', 'rank': rank,
+             'heroes': heroes, 'coins': coins, 'total_power': power}
+            for slot, rank, heroes, coins, power in rows
+        ]
+
+    def import_from(self, other: Storage) -> int:
+        """
+        คัดลอกผู้เล่นและโค้ดที่ใช้แล้วทั้งหมดจาก backend อื่น
+
+        Returns:
+            int: จำนวนผู้เล่นที่คัดลอก
+        """
+        slots = other.list_slots()
+        for slot in slots:
+            data = other.load_player(slot)
+            if data is not None:
+                self.save_player(slot, data)
+            for code in other.load_used_codes(slot):
+                self.add_used_code(slot, code)
+        return len(slots)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+_storage = None
+
+
+def get_storage() -> Storage:
+    """
+    backend ที่ใช้ในเกม (สร้างครั้งแรกครั้งเดียวตาม STORAGE_BACKEND)
+
+    ถ้าใช้ sqlite ครั้งแรกแล้วฐานข้อมูลยังว่าง จะคัดลอกข้อมูลจากไฟล์ JSON เดิมเข้าไป
+    """
+    global _storage
+
+    if _storage is None:
+        if STORAGE_BACKEND == 'sqlite':
+            storage = SqliteStorage()
+            if not storage.list_slots():
+                count = storage.import_from(JsonStorage())
+                if count:
+                    print(f"Imported {count} player(s) from JSON saves into {SQLITE_PATH}")
+            _storage = storage
+        elif STORAGE_BACKEND == 'json':
+            if SAVE_FORMAT == 'binary':
+                _storage = BinaryStorage()
+            elif SAVE_FORMAT == 'json':
+                _storage = JsonStorage()
+            else:
+                raise ValueError(f"Unknown SAVE_FORMAT: {SAVE_FORMAT!r}")
+        else:
+            raise ValueError(f"Unknown STORAGE_BACKEND: {STORAGE_BACKEND!r}")
+    return _storage
@@ -0,0 +1,258 @@
+"""ข้อมูลกล่องสุ่ม (Banner) - อัตรา, pool ฮีโร่ และราคา ของแต่ละกล่อง
+
+อ่านจาก data/json/banners.json (ถ้าไม่มีไฟล์ใช้ค่าใน config)
+ระหว่างเล่น thread ของ watcher เช็ค mtime ของไฟล์ ถ้าเปลี่ยนจะสร้างกล่องชุดใหม่ทั้งหมด
+(compile sampler + pool) นอก game loop แล้วสลับ BANNERS ทีเดียว
+"""
+import json
+import os
+import random
+import threading
+import time
+from typing import Optional
+
+from src.core.config import (RARITY_RATES, MYSTIC_RATES, SUMMON_COSTS,
+                             BANNER_CONFIG_PATH, BANNER_RELOAD_INTERVAL)
+from src.data.hero_data import Character, get_heroes_by_rarity
+from src.utils import gacha, collection_odds
+
+
+class Banner:
+    """กล่องสุ่ม 1 แบบ: sampler ที่ compile แล้ว + pool ฮีโร่แยกตาม rarity + ราคา"""
+
+    def __init__(self, key: str, name: str, rates: dict[str, float],
+                 costs: Optional[dict[int, int]] = None):
+        self.key = key
+        self.name = name
+        self.rates = dict(rates)
+
+        # compile ตาราง alias ครั้งเดียว (ตรวจสอบว่าอัตรารวมเท่ากับ 1)
+        self.sampler = gacha.get_sampler(self.rates)
+
+        # pool ฮีโร่ของแต่ละ rarity ที่กล่องนี้สุ่มได้ (rarity ที่ไม่มีฮีโร่ใช้ rare แทน)
+        self.pools: dict[str, tuple[Character, ...]] = {}
+        for rarity in self.sampler['rarities']:
+            pool = tuple(get_heroes_by_rarity(rarity)) or tuple(get_heroes_by_rarity('rare'))
+            self.pools[rarity] = pool
+
+        # ราคาต่อจำนวนครั้ง {1: 100, 10: 1000}
+        # ถ้าไม่ระบุใช้ SUMMON_COSTS ('{key}_x1', '{key}_x10', ...)
+        if costs is None:
+            costs = {
+                int(cost_key[len(key) + 2:]): price
+                for cost_key, price in SUMMON_COSTS.items()
+                if cost_key.startswith(f'{key}_x')
+            }
+        self.costs: dict[int, int] = dict(costs)
+
+    @property
+    def rarities(self) -> tuple[str, ...]:
+        """rarity ที่กล่องนี้สุ่มได้ เรียงจากหายากที่สุด"""
+        return tuple(r for r in reversed(gacha.RARITY_ORDER) if r in self.pools)
+
+    @property
+    def pull_counts(self) -> tuple[int, ...]:
+        """จำนวนครั้งที่ซื้อได้ (เช่น (1, 10))"""
+        return tuple(sorted(self.costs))
+
+    def cost(self, count: int) -> int:
+        """
+        ราคาของการสุ่ม count ครั้ง
+
+        ถ้าไม่มีราคาของจำนวนนี้ตรงๆ (เช่น x100) คิดเป็นชุดใหญ่ที่สุดก่อน
+        (x100 = x10 สิบชุด, x25 = x10 สองชุด + x1 ห้าครั้ง)
+
+        Raises:
+            ValueError: ถ้าแบ่งเป็นชุดที่มีราคาไม่ได้
+        """
+        if count in self.costs:
+            return self.costs[count]
+
+        total = 0
+        remaining = count
+        for pack in sorted(self.costs, reverse=True):
+            total += (remaining // pack) * self.costs[pack]
+            remaining %= pack
+        if count <= 0 or remaining:
+            raise ValueError(f"Cannot price x{count} for banner {self.key!r}")
+        return total
+
+    def pull(self, count: int, rng=random) -> list[Character]:
+        """สุ่มฮีโร่ count ตัว (O(1) ต่อครั้ง)"""
+        heroes = []
+        for _ in range(count):
+            pool = self.pools[gacha.draw_rarity(self.sampler, rng)]
+            heroes.append(pool[int(rng.random() * len(pool))])
+        return heroes
+
+    def pull_ids(self, count: int, rng=None):
+        """สุ่มแบบ batch ด้วย NumPy - คืน array ของ hero id (สำหรับ simulation)"""
+        return gacha.summon_batch(count, self.rates, rng=rng)
+
+    def __repr__(self):
+        return f"Banner(key='{self.key}', name='{self.name}', rates={self.rates})"
+
+
+# ค่าเริ่มต้นเมื่อไม่มีไฟล์ตั้งค่า
+DEFAULT_BANNERS = {
+    'mystic': {'name': 'Mystic Chest', 'rates': MYSTIC_RATES},
+    'celestial': {'name': 'Celestial Chest', 'rates': RARITY_RATES},
+}
+
+
+# จำนวนครั้งที่ทุกกล่องต้องมีราคา (ปุ่ม x1 / x10 ในหน้ากล่องสุ่ม)
+REQUIRED_PULL_COUNTS = (1, 10)
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def build_banners(specs: dict) -> dict[str, Banner]:
+    """
+    สร้างกล่องทั้งหมดจาก dict ของไฟล์ตั้งค่า
+
+    Args:
+        specs: {key: {'name': str, 'rates': {...}, 'costs': {"1": int, ...}}}
+
+    Returns:
+        dict: {key: Banner}
+
+    Raises:
+        ValueError: ถ้าอัตราหรือราคาไม่ถูกต้อง (รวมถึงชนิดข้อมูลผิด เช่นอัตราเป็น string)
+                    หรือคิดราคา REQUIRED_PULL_COUNTS ไม่ได้
+    """
+    # ตรวจชนิดข้อมูลก่อน - ไฟล์ที่แก้ด้วยมือผิดชนิดต้องได้ ValueError เสมอ
+    # (ไม่งั้น TypeError/AttributeError หลุดไปถึง watcher หรือทำให้เกมเปิดไม่ได้)
+    if not isinstance(specs, dict):
+        raise ValueError("Banner config must be an object of banners")
+
+    banners = {}
+    for key, spec in specs.items():
+        if not isinstance(spec, dict):
+            raise ValueError(f"Banner {key!r} must be an object")
+        if 'rates' not in spec:
+            raise ValueError(f"Banner {key!r} has no rates")
+        rates = spec['rates']
+        if not isinstance(rates, dict) or not all(_is_number(rate) for rate in rates.values()):
+            raise ValueError(f"Rates of banner {key!r} must be an object of numbers: {rates!r}")
+        name = spec.get('name', key.title())
+        if not isinstance(name, str):
+            raise ValueError(f"Name of banner {key!r} must be a string: {name!r}")
+
+        costs = spec.get('costs')
+        if costs is not None:
+            if not isinstance(costs, dict) or not all(_is_number(price) for price in costs.values()):
+                raise ValueError(f"Costs of banner {key!r} must be an object of numbers: {costs!r}")
+            costs = {int(count): int(price) for count, price in costs.items()}
+            for count, price in costs.items():
+                if count <= 0 or price < 0:
+                    raise ValueError(f"Invalid cost for banner {key!r}: x{count} = {price}")
+
+        banner = Banner(key, name, rates, costs)
+        # หน้ากล่องสุ่มแสดงราคา x1, x10 และ xN (bulk) ทุก frame - ต้องคิดราคาได้ทุกจำนวน
+        # (มีราคา x1 แล้วจำนวนใดๆ ก็แบ่งเป็นชุดได้เสมอ) ไม่งั้น reload จะใช้ชุดเดิมต่อ
+        for count in REQUIRED_PULL_COUNTS:
+            banner.cost(count)
+        banners[key] = banner
+    return banners
+
+
+def load_banners(filepath: str = BANNER_CONFIG_PATH) -> dict[str, Banner]:
+    """
+    โหลดกล่องจากไฟล์ตั้งค่า (ถ้าไม่มีไฟล์ใช้ DEFAULT_BANNERS)
+
+    Raises:
+        ValueError: ถ้าไฟล์เสียหรือค่าไม่ถูกต้อง
+    """
+    if not os.path.exists(filepath):
+        return build_banners(DEFAULT_BANNERS)
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return build_banners(json.load(f))
+
+
+def _initial_banners() -> dict[str, Banner]:
+    try:
+        return load_banners()
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load {BANNER_CONFIG_PATH}, using defaults: {e}")
+        return build_banners(DEFAULT_BANNERS)
+
+
+# สร้างกล่องทั้งหมดตอนเริ่มเกม (watcher จะแทนที่ทั้ง dict เมื่อไฟล์เปลี่ยน)
+BANNERS: dict[str, Banner] = _initial_banners()
+
+
+def get_banner(key: str) -> Optional[Banner]:
+    return BANNERS.get(key)
+
+
+def get_all_banners() -> list[Banner]:
+    return list(BANNERS.values())
+
+
+def reload_banners(filepath: str = BANNER_CONFIG_PATH) -> bool:
+    """
+    โหลดไฟล์ตั้งค่าใหม่แล้วสลับกล่องทั้งหมดทีเดียว (ถ้าไฟล์ผิดจะใช้ชุดเดิมต่อ)
+
+    คำนวณค่าคาดหวังของหน้า info ไว้ก่อนสลับ หน้าจอจะได้ไม่ต้องคำนวณตอนเปิด
+
+    Returns:
+        bool: True ถ้าโหลดสำเร็จ
+    """
+    global BANNERS
+
+    try:
+        banners = load_banners(filepath)
+        for banner in banners.values():
+            collection_odds.expected_pulls(banner.rates)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not reload {filepath}, keeping current banners: {e}")
+        return False
+
+    # แทนที่ทั้ง dict (assignment เดียว) - ผู้อ่านเห็นชุดเก่าหรือชุดใหม่ครบเสมอ
+    BANNERS = banners
+    print(f"Reloaded banners: {', '.join(sorted(banners))}")
+    return True
+
+
+def _file_stamp(filepath: str):
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_watcher = None
+
+
+def start_watcher(filepath: str = BANNER_CONFIG_PATH,
+                  interval: float = BANNER_RELOAD_INTERVAL) -> threading.Thread:
+    """
+    เริ่ม thread (daemon) ที่เช็ค mtime ของไฟล์ตั้งค่าทุก interval วินาที
+    และโหลดกล่องใหม่เมื่อไฟล์เปลี่ยน (เรียกซ้ำได้ จะมี thread เดียว)
+    """
+    global _watcher
+
+    if _watcher is not None and _watcher.is_alive():
+        return _watcher
+
+    def watch():
+        last = _file_stamp(filepath)
+        while True:
+            time.sleep(interval)
+            stamp = _file_stamp(filepath)
+            if stamp != last:
+                last = stamp
+                if stamp is not None:
+                    try:
+                        reload_banners(filepath)
+                    except Exception as e:
+                        # ห้าม thread ตาย - ไม่งั้น hot-reload หยุดไปทั้ง session
+                        print(f"Error reloading {filepath}, keeping current banners: {e}")
+
+    _watcher = threading.Thread(target=watch, name='banner-watcher', daemon=True)
+    _watcher.start()
+    return _watcher
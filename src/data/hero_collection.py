@@ -0,0 +1,199 @@
+"""HeroCollection - รายการฮีโร่ที่ผู้เล่นมี (player_data['owned_heroes'])
+
+เป็น list ของ hero id เหมือนเดิม (json.dump ได้เป็น list ตรงๆ ไฟล์ save เก่าใช้ได้)
+แต่เก็บ bitmask + จำนวนต่อ id ไว้ด้วย ทำให้:
+    - hero_id in collection     -> O(1) (ไม่ต้องไล่ทั้ง list)
+    - collection.count(hero_id) -> O(1)
+    - unique_count()            -> popcount ของ bitmask ("เก็บได้ X / Y")
+    - to_bytes()/from_bytes()   -> bitmask แบบ bytes สำหรับเก็บแบบกะทัดรัด
+
+และค่าสรุปที่อัปเดตตอนเพิ่ม/ลบ (อ่านได้ O(1) ไม่ต้องวนทั้ง collection ทุกเฟรม):
+    - total_power               -> พลังรวม
+    - rarity_counts             -> จำนวนตาม rarity
+    - top(n)                    -> n ตัวที่แรร์สุด (เท่ากันดูพลัง)
+"""
+
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable
+
+from src.data.hero_data import get_hero
+
+
+# ลำดับความแรร์ (มากกว่า = แรร์กว่า)
+RARITY_RANK = {
+    'rare': 1,
+    'epic': 2,
+    'legendary': 3,
+    'extreme': 4
+}
+
+
+def _rank_key(hero):
+    """key สำหรับเรียงแรร์สุด/แรงสุดก่อน"""
+    return (-RARITY_RANK.get(hero.rarity.lower(), 0), -hero.power, hero.id)
+
+
+class HeroCollection(list):
+    """list ของ hero id + ดัชนี (bitmask/จำนวน) และค่าสรุปที่อัปเดตทุกครั้งที่แก้ list"""
+
+    def __init__(self, hero_ids: Iterable[int] = ()):
+        super().__init__()
+        self._reset()
+        self.extend(hero_ids)
+
+    # ---------- ดัชนี ----------
+
+    def _reset(self):
+        self.mask = 0                 # bit ที่ hero_id = มีอย่างน้อย 1 ตัว
+        self._counts: list[int] = []  # จำนวนต่อ id (index = hero_id)
+        self.total_power = 0
+        self.rarity_counts = {rarity: 0 for rarity in RARITY_RANK}
+        self._ranked: list[tuple] = []  # _rank_key ของฮีโร่ที่ไม่ซ้ำ เรียงแรร์สุดก่อน
+
+    def _add(self, hero_id, n=1):
+        if hero_id >= len(self._counts):
+            self._counts.extend([0] * (hero_id + 1 - len(self._counts)))
+        first = not self._counts[hero_id]
+        self._counts[hero_id] += n
+        self.mask |= 1 << hero_id
+
+        hero = get_hero(hero_id)
+        if hero:
+            self.total_power += hero.power * n
+            rarity = hero.rarity.lower()
+            self.rarity_counts[rarity] = self.rarity_counts.get(rarity, 0) + n
+            if first:
+                insort(self._ranked, _rank_key(hero))
+
+    def _discard(self, hero_id):
+        self._counts[hero_id] -= 1
+        if not self._counts[hero_id]:
+            self.mask &= ~(1 << hero_id)
+
+        hero = get_hero(hero_id)
+        if hero:
+            self.total_power -= hero.power
+            self.rarity_counts[hero.rarity.lower()] -= 1
+            if not self._counts[hero_id]:
+                key = _rank_key(hero)
+                del self._ranked[bisect_left(self._ranked, key)]
+
+    def _rebuild(self):
+        self._reset()
+        for hero_id, n in Counter(list.__iter__(self)).items():
+            self._add(hero_id, n)
+
+    @staticmethod
+    def _check(hero_id):
+        if isinstance(hero_id, bool) or not isinstance(hero_id, int) or hero_id < 0:
+            raise TypeError(f"Hero id must be a non-negative int, got {hero_id!r}")
+        return hero_id
+
+    # ---------- อ่าน ----------
+
+    def __contains__(self, hero_id):
+        if isinstance(hero_id, int) and 0 <= hero_id < len(self._counts):
+            return self._counts[hero_id] > 0
+        return False
+
+    def count(self, hero_id):
+        """จำนวนของ hero_id ใน collection (O(1))"""
+        if isinstance(hero_id, int) and 0 <= hero_id < len(self._counts):
+            return self._counts[hero_id]
+        return 0
+
+    def unique_count(self) -> int:
+        """จำนวนฮีโร่ที่ไม่ซ้ำกัน"""
+        return self.mask.bit_count()
+
+    def top(self, n: int) -> list[int]:
+        """
+        hero id ที่แรร์สุด n ตัว (ไม่ซ้ำ, rarity เท่ากันเอาพลังมากกว่าก่อน)
+
+        Args:
+            n: จำนวนที่ต้องการ
+
+        Returns:
+            list: hero id
+        """
+        return [hero_id for _, _, hero_id in self._ranked[:n]]
+
+    def to_bytes(self) -> bytes:
+        """bitmask ของฮีโร่ที่มี (little-endian, bit i = hero id i)"""
+        return self.mask.to_bytes((self.mask.bit_length() + 7) // 8, 'little')
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'HeroCollection':
+        """สร้างจาก to_bytes() (ได้ฮีโร่ละ 1 ตัว เรียงตาม id)"""
+        mask = int.from_bytes(data, 'little')
+        return cls(hero_id for hero_id in range(mask.bit_length()) if mask >> hero_id & 1)
+
+    # ---------- แก้ไข (อัปเดตดัชนีด้วยทุกครั้ง) ----------
+
+    def append(self, hero_id):
+        self._add(self._check(hero_id))
+        super().append(hero_id)
+
+    def extend(self, hero_ids):
+        hero_ids = list(hero_ids)
+        # นับทีละ id ที่ไม่ซ้ำ (collection ใหญ่มีฮีโร่ซ้ำเยอะ)
+        counts = Counter(hero_ids)
+        for hero_id in counts:
+            self._check(hero_id)
+        for hero_id, n in counts.items():
+            self._add(hero_id, n)
+        super().extend(hero_ids)
+
+    def __iadd__(self, hero_ids):
+        self.extend(hero_ids)
+        return self
+
+    def insert(self, index, hero_id):
+        self._add(self._check(hero_id))
+        super().insert(index, hero_id)
+
+    def remove(self, hero_id):
+        super().remove(hero_id)
+        self._discard(hero_id)
+
+    def pop(self, index=-1):
+        hero_id = super().pop(index)
+        self._discard(hero_id)
+        return hero_id
+
+    def clear(self):
+        super().clear()
+        self._reset()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [self._check(hero_id) for hero_id in value]
+        else:
+            value = self._check(value)
+        super().__setitem__(index, value)
+        self._rebuild()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._rebuild()
+
+    def __imul__(self, n):
+        super().__imul__(n)
+        self._rebuild()
+        return self
+
+    # ---------- copy / pickle (สร้างใหม่จาก list ให้ดัชนีถูกต้อง) ----------
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __copy__(self):
+        return type(self)(self)
+
+    def __deepcopy__(self, memo):
+        # hero id เป็น int - คัดลอกตื้นก็พอ
+        return type(self)(self)
+
+    def __repr__(self):
+        return f"HeroCollection({list.__repr__(self)})"
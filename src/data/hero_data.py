@@ -3,6 +3,8 @@ from typing import Optional
 from math import sqrt, pow
 import pygame
 
+from src.utils import assets
+
 
 class Character:
     
@@ -17,9 +19,6 @@ class Character:
         self.portrait_path = portrait_path
         self.card_front_path = card_front_path
         self.card_back_path = card_back_path
-        self._portrait_surface: Optional[pygame.Surface] = None
-        self._card_front_surface: Optional[pygame.Surface] = None
-        self._card_back_surface: Optional[pygame.Surface] = None
     
     @property
     def power(self):
@@ -32,29 +31,15 @@ class Character:
             'DEF': self.defense
         }
     
+    # รูปมาจาก cache ของ assets ทุกครั้ง (ไม่เก็บสำเนาไว้เอง - cache จำกัดขนาดได้จริง)
     def get_portrait(self, asset_manager=None) -> pygame.Surface:
-        if self._portrait_surface is None:
-            if asset_manager:
-                self._portrait_surface = asset_manager.load_image(self.portrait_path)
-            else:
-                self._portrait_surface = pygame.image.load(self.portrait_path).convert_alpha()
-        return self._portrait_surface
+        return (asset_manager or assets).load_image(self.portrait_path)
     
     def get_card_front(self, asset_manager=None) -> pygame.Surface:
-        if self._card_front_surface is None:
-            if asset_manager:
-                self._card_front_surface = asset_manager.load_image(self.card_front_path)
-            else:
-                self._card_front_surface = pygame.image.load(self.card_front_path).convert_alpha()
-        return self._card_front_surface
+        return (asset_manager or assets).load_image(self.card_front_path)
     
     def get_card_back(self, asset_manager=None) -> pygame.Surface:
-        if self._card_back_surface is None:
-            if asset_manager:
-                self._card_back_surface = asset_manager.load_image(self.card_back_path)
-            else:
-                self._card_back_surface = pygame.image.load(self.card_back_path).convert_alpha()
-        return self._card_back_surface
+        return (asset_manager or assets).load_image(self.card_back_path)
     
     def __repr__(self):
         return f"Character(id={self.id}, name='{self.name}', rarity='{self.rarity}', power={self.totalPower})"
@@ -90,7 +90,7 @@ class AddCodeState(GameState):
         
         # โหลดรูปปุ่ม
         try:
-            button_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            button_img = assets.load_image('assets/ui/12.png')
         except Exception as e:
             print(f"Warning: Could not load button image: {e}")
             button_img = pygame.Surface((220, 70), pygame.SRCALPHA)
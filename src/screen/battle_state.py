@@ -1,11 +1,10 @@
 """Battle State - ระบบต่อสู้ระหว่าง Player 1 และ Player 2"""
 import pygame
-import random
 from src.core.game_state import GameState
 from src.utils import assets
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.data.hero_data import get_hero
-from src.utils import player
+from src.utils import player, rng, journal
 from src.ui.animation import CardFlipAnimation
 
 
@@ -39,6 +38,7 @@ class BattleState(GameState):
         # การ์ดที่เลือก
         self.p1_hand = []  # 5 ใบที่สุ่มมา
         self.p2_hand = []
+        self.deal_counters = {}  # {slot: counter ของ stream 'deal'} สำหรับ journal
         self.p1_card_order = []  # ลำดับการ์ดที่เลือก [hero_id1, hero_id2, ...]
         self.p2_card_order = []
         
@@ -88,12 +88,12 @@ class BattleState(GameState):
         
         # โหลดรูปปุ่ม
         try:
-            self.button_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            self.button_img = assets.load_image('assets/ui/12.png')
         except:
             self.button_img = pygame.Surface((220, 70), pygame.SRCALPHA)
             self.button_img.fill((60, 60, 90, 255))
         
-        # โหลดข้อมูลผู้เล่นทั้ง 2 คน
+        # ข้อมูลผู้เล่นทั้ง 2 คน (dict ตัวเดียวกับที่หน้าจออื่นใช้ ไม่อ่านไฟล์ซ้ำ)
         self.player1_data = player.load_player_data(1)
         self.player2_data = player.load_player_data(2)
         
@@ -101,6 +101,7 @@ class BattleState(GameState):
         self.phase = "BET"
         self.bet_amount = 0
         self.bet_input = ""
+        self.deal_counters = {}
         
     def handle_event(self, event):
         if self.phase == "BET":
@@ -153,11 +154,7 @@ class BattleState(GameState):
     def _start_player1_turn(self):
         """เริ่มเทิร์นผู้เล่น 1 - สุ่มการ์ด 5 ใบ"""
         self.phase = "P1_SELECT"
-        owned_heroes = self.player1_data['owned_heroes']
-        if len(owned_heroes) >= 5:
-            self.p1_hand = random.sample(owned_heroes, 5)
-        else:
-            self.p1_hand = owned_heroes.copy()
+        self.p1_hand = self._deal_hand(self.player1_data, 1)
         self.p1_card_order = []  # รีเซ็ตลำดับ
         self._setup_card_rects()
         self._setup_card_animations(self.p1_hand)
@@ -165,15 +162,22 @@ class BattleState(GameState):
     def _start_player2_turn(self):
         """เริ่มเทิร์นผู้เล่น 2 - สุ่มการ์ด 5 ใบ"""
         self.phase = "P2_SELECT"
-        owned_heroes = self.player2_data['owned_heroes']
-        if len(owned_heroes) >= 5:
-            self.p2_hand = random.sample(owned_heroes, 5)
-        else:
-            self.p2_hand = owned_heroes.copy()
+        self.p2_hand = self._deal_hand(self.player2_data, 2)
         self.p2_card_order = []  # รีเซ็ตลำดับ
         self._setup_card_rects()
         self._setup_card_animations(self.p2_hand)
     
+    def _deal_hand(self, player_data, player_slot):
+        """สุ่มการ์ด 5 ใบจากฮีโร่ที่มี (stream ของผู้เล่น สุ่มซ้ำได้จาก seed + slot + counter)"""
+        owned_heroes = list(player_data['owned_heroes'])
+        if len(owned_heroes) < 5:
+            return owned_heroes
+        deal_rng, counter = rng.next_stream(player_data, player_slot, 'deal')
+        self.deal_counters[player_slot] = counter
+        player.touch(player_data, 'rng')
+        picks = deal_rng.choice(len(owned_heroes), 5, replace=False)
+        return [owned_heroes[i] for i in picks.tolist()]
+    
     def _setup_card_rects(self):
         """สร้าง rect สำหรับการ์ด 5 ใบ"""
         self.card_rects = []
@@ -400,9 +404,21 @@ class BattleState(GameState):
         # อัปเดต bet_amount เป็นจำนวนจริงที่ใช้
         self.bet_amount = actual_bet
         
+        journal.log_event(
+            'battle', None,
+            winner=self.winner,
+            bet=actual_bet,
+            wins=[self.p1_wins, self.p2_wins],
+            orders=[list(self.p1_card_order), list(self.p2_card_order)],
+            rounds=[r['winner'] for r in self.round_results],
+            deal_counters=[self.deal_counters.get(1), self.deal_counters.get(2)]
+        )
+        
         # บันทึกข้อมูล
-        player.save_player_data(self.player1_data, 1)
-        player.save_player_data(self.player2_data, 2)
+        player.touch(self.player1_data, 'coins', 'rank')
+        player.touch(self.player2_data, 'coins', 'rank')
+        player.save_player_data(self.player1_data, 1, wait=False)
+        player.save_player_data(self.player2_data, 2, wait=False)
         
         self.phase = "FINAL_RESULT"
         self.result_timer = 0
@@ -541,18 +557,16 @@ class BattleState(GameState):
             is_hover = self.confirm_button_rect.collidepoint(mouse_pos)
             is_enabled = len(card_order) == 5
             button_scale = 1.2
-            scaled_img = pygame.transform.scale(
+            scaled_img = assets.derive(
                 self.button_img,
-                (int(self.button_img.get_width() * button_scale), 
-                 int(self.button_img.get_height() * button_scale))
+                ('scale', (int(self.button_img.get_width() * button_scale),
+                           int(self.button_img.get_height() * button_scale)))
             )
             
             if not is_enabled:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((100, 100, 100, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (100, 100, 100, 255)))
             elif is_hover:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((230, 240, 245, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (230, 240, 245, 255)))
             
             screen.blit(scaled_img, self.confirm_button_rect)
             button_text = self.font_small.render("CONFIRM", True, (255, 255, 255))
@@ -565,15 +579,14 @@ class BattleState(GameState):
         if self.clear_button_rect and self.button_img:
             is_hover = self.clear_button_rect.collidepoint(mouse_pos)
             button_scale = 1.2
-            scaled_img = pygame.transform.scale(
+            scaled_img = assets.derive(
                 self.button_img,
-                (int(self.button_img.get_width() * button_scale), 
-                 int(self.button_img.get_height() * button_scale))
+                ('scale', (int(self.button_img.get_width() * button_scale),
+                           int(self.button_img.get_height() * button_scale)))
             )
             
             if is_hover:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((230, 240, 245, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (230, 240, 245, 255)))
             
             screen.blit(scaled_img, self.clear_button_rect)
             button_text = self.font_small.render("CLEAR", True, (255, 255, 255))
@@ -586,15 +599,14 @@ class BattleState(GameState):
         if self.back_button_rect and self.button_img:
             is_hover = self.back_button_rect.collidepoint(mouse_pos)
             button_scale = 1.2
-            scaled_img = pygame.transform.scale(
+            scaled_img = assets.derive(
                 self.button_img,
-                (int(self.button_img.get_width() * button_scale), 
-                 int(self.button_img.get_height() * button_scale))
+                ('scale', (int(self.button_img.get_width() * button_scale),
+                           int(self.button_img.get_height() * button_scale)))
             )
             
             if is_hover:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((230, 240, 245, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (230, 240, 245, 255)))
             
             screen.blit(scaled_img, self.back_button_rect)
             button_text = self.font_small.render("BACK", True, (255, 255, 255))
@@ -625,8 +637,7 @@ class BattleState(GameState):
             card_y = SCREEN_HEIGHT // 2 - card_height // 2 - 80
             
             try:
-                card_img = hero.get_card_front()
-                card_img = pygame.transform.scale(card_img, (card_width, card_height))
+                card_img = assets.derive(hero.card_front_path, ('scale', (card_width, card_height)))
                 screen.blit(card_img, (card_x, card_y))
             except:
                 pygame.draw.rect(screen, (100, 100, 100), (card_x, card_y, card_width, card_height))
@@ -642,16 +653,15 @@ class BattleState(GameState):
         if self.confirm_button_rect and self.button_img:
             is_hover = self.confirm_button_rect.collidepoint(mouse_pos)
             button_scale = 1.2
-            scaled_img = pygame.transform.scale(
+            scaled_img = assets.derive(
                 self.button_img,
-                (int(self.button_img.get_width() * button_scale), 
-                 int(self.button_img.get_height() * button_scale))
+                ('scale', (int(self.button_img.get_width() * button_scale),
+                           int(self.button_img.get_height() * button_scale)))
             )
             
             # ใช้ color effect ถ้า hover
             if is_hover:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((230, 240, 245, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (230, 240, 245, 255)))
             
             screen.blit(scaled_img, self.confirm_button_rect)
             
@@ -665,16 +675,15 @@ class BattleState(GameState):
         if self.back_button_rect and self.button_img:
             is_hover = self.back_button_rect.collidepoint(mouse_pos)
             button_scale = 1.2
-            scaled_img = pygame.transform.scale(
+            scaled_img = assets.derive(
                 self.button_img,
-                (int(self.button_img.get_width() * button_scale), 
-                 int(self.button_img.get_height() * button_scale))
+                ('scale', (int(self.button_img.get_width() * button_scale),
+                           int(self.button_img.get_height() * button_scale)))
             )
             
             # ใช้ color effect ถ้า hover
             if is_hover:
-                scaled_img = scaled_img.copy()
-                scaled_img.fill((230, 240, 245, 255), special_flags=pygame.BLEND_RGBA_MULT)
+                scaled_img = assets.derive(scaled_img, ('multiply', (230, 240, 245, 255)))
             
             screen.blit(scaled_img, self.back_button_rect)
             
@@ -701,8 +710,7 @@ class BattleState(GameState):
             card_y = SCREEN_HEIGHT // 2 - card_height // 2
             
             try:
-                card_img = hero.get_card_front()
-                card_img = pygame.transform.scale(card_img, (card_width, card_height))
+                card_img = assets.derive(hero.card_front_path, ('scale', (card_width, card_height)))
                 screen.blit(card_img, (card_x, card_y))
             except:
                 pygame.draw.rect(screen, (100, 100, 100), (card_x, card_y, card_width, card_height))
@@ -733,8 +741,7 @@ class BattleState(GameState):
         for hero, rect, player_num in [(hero1, p1_rect, 1), (hero2, p2_rect, 2)]:
             if hero:
                 try:
-                    card_img = hero.get_card_front()
-                    card_img = pygame.transform.scale(card_img, (rect.width, rect.height))
+                    card_img = assets.derive(hero.card_front_path, ('scale', rect.size))
                     screen.blit(card_img, rect)
                 except:
                     pygame.draw.rect(screen, (100, 100, 100), rect)
@@ -888,8 +895,7 @@ class BattleState(GameState):
         for hero, rect, player_num in [(hero1, p1_rect, 1), (hero2, p2_rect, 2)]:
             if hero:
                 try:
-                    card_img = hero.get_card_front()
-                    card_img = pygame.transform.scale(card_img, (rect.width, rect.height))
+                    card_img = assets.derive(hero.card_front_path, ('scale', rect.size))
                     screen.blit(card_img, rect)
                 except:
                     pygame.draw.rect(screen, (100, 100, 100), rect)
@@ -71,7 +71,7 @@ class BookState(GameState):
         try:
             left_img = assets.load_image('assets/ui/left botton.png')
             right_img = assets.load_image('assets/ui/right botton.png')
-            lobby_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            lobby_img = assets.load_image('assets/ui/12.png')
         except Exception as e:
             print(f"Warning: Could not load button images: {e}")
             left_img = pygame.Surface((60, 60), pygame.SRCALPHA)
@@ -220,26 +220,13 @@ class BookState(GameState):
             
             # โหลดและแสดงรูปตัวละคร
             try:
-                portrait = assets.load_image(hero.portrait_path)
-                
-                original_width = portrait.get_width()
-                original_height = portrait.get_height()
-                max_height = 300
-                scale = max_height / original_height
-                new_width = int(original_width * scale)
-                new_height = int(original_height * scale)
-                portrait_scaled = pygame.transform.smoothscale(portrait, (new_width, new_height))
-                
-                # ถ้ายังไม่มี - แปลงเป็นขาวดำ
-                if not is_owned:
-                    # แปลงเป็น grayscale โดยรักษาความโปร่งใส
-                    grayscale = pygame.Surface(portrait_scaled.get_size(), pygame.SRCALPHA)
-                    for px in range(new_width):
-                        for py in range(new_height):
-                            color = portrait_scaled.get_at((px, py))
-                            gray = int(0.299 * color.r + 0.587 * color.g + 0.114 * color.b)
-                            grayscale.set_at((px, py), (gray, gray, gray, color.a))
-                    portrait_scaled = grayscale
+                # สูง 300px (variant 'book_list')
+                if is_owned:
+                    portrait_scaled = assets.load_image(hero.portrait_path, 'book_list')
+                else:
+                    # ถ้ายังไม่มี - แปลงเป็นขาวดำ (รักษาความโปร่งใส, cache ไว้ไม่ต้องแปลงทุก frame)
+                    portrait_scaled = assets.derive((hero.portrait_path, 'book_list'), ('grayscale',))
+                new_width, new_height = portrait_scaled.get_size()
                 
                 # วาดตรงกลาง
                 portrait_x = x - new_width // 2
@@ -292,25 +279,13 @@ class BookState(GameState):
         center_y = SCREEN_HEIGHT // 2 - 20
         
         try:
-            portrait = assets.load_image(hero.portrait_path)
-
-            original_width = portrait.get_width()
-            original_height = portrait.get_height()
-            max_height = 350
-            scale = max_height / original_height
-            new_width = int(original_width * scale)
-            new_height = int(original_height * scale)
-            portrait_scaled = pygame.transform.smoothscale(portrait, (new_width, new_height))
-            
-            # ถ้ายังไม่มี - แปลงเป็นขาวดำ
-            if not is_owned:
-                grayscale = pygame.Surface(portrait_scaled.get_size(), pygame.SRCALPHA)
-                for px in range(new_width):
-                    for py in range(new_height):
-                        color = portrait_scaled.get_at((px, py))
-                        gray = int(0.299 * color.r + 0.587 * color.g + 0.114 * color.b)
-                        grayscale.set_at((px, py), (gray, gray, gray, color.a))
-                portrait_scaled = grayscale
+            # สูง 350px (variant 'book_info')
+            if is_owned:
+                portrait_scaled = assets.load_image(hero.portrait_path, 'book_info')
+            else:
+                # ถ้ายังไม่มี - แปลงเป็นขาวดำ
+                portrait_scaled = assets.derive((hero.portrait_path, 'book_info'), ('grayscale',))
+            new_width, new_height = portrait_scaled.get_size()
             
             # วาด
             portrait_x = left_x - new_width // 2
@@ -3,8 +3,9 @@
 import pygame
 from src.core.game_state import GameState
 from src.utils import assets
-from src.data.hero_data import get_heroes_by_rarity
+from src.data.banner_data import get_banner
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils import collection_odds
 from src.ui.image_button import _ImageButton
 
 from typing import TYPE_CHECKING
@@ -22,16 +23,15 @@ class CelestialInfoState(GameState):
         self.font_small = None
         self.back_button = None
         
+        # ค่าคาดหวังจนสะสมครบ (คำนวณแบบแม่นยำ, cache ตามอัตรา)
+        self.expected_pulls = 0.0
+        self.expected_coins = 0.0
+        
         # ข้อมูลตัวละครแยกตาม rarity
         self.heroes_by_rarity = {}
         
-        # Celestial Chest rates (มี EXTREME)
-        self.rates = {
-            'extreme': 0.01, 
-            'legendary': 0.04, 
-            'epic': 0.25,      
-            'rare': 0.70        
-        }
+        # อัตราของกล่อง (ดึงจาก Banner registry ตอน enter)
+        self.rates = {}
         
         # สีของแต่ละ rarity
         self.rarity_colors = {
@@ -63,17 +63,18 @@ class CelestialInfoState(GameState):
             self.font_normal = pygame.font.Font(None, 18)
             self.font_small = pygame.font.Font(None, 15)
         
-        # โหลดข้อมูลตัวละคร
-        self.heroes_by_rarity = {
-            'extreme': get_heroes_by_rarity('extreme'),
-            'legendary': get_heroes_by_rarity('legendary'),
-            'epic': get_heroes_by_rarity('epic'),
-            'rare': get_heroes_by_rarity('rare')
-        }
+        # โหลดข้อมูลตัวละคร (pool ของกล่องนี้ - อาจเปลี่ยนเมื่อโหลดไฟล์ตั้งค่าใหม่)
+        banner = get_banner('celestial')
+        self.rates = banner.rates
+        self.heroes_by_rarity = dict(banner.pools)
+        
+        # คำนวณจำนวนครั้ง/เหรียญที่คาดว่าต้องใช้จนสะสมครบ
+        self.expected_pulls = collection_odds.expected_pulls(self.rates)
+        self.expected_coins = collection_odds.expected_coins(self.rates, banner.cost(1))
         
         # โหลดรูปปุ่ม
         try:
-            button_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            button_img = assets.load_image('assets/ui/12.png')
         except Exception as e:
             print(f"Warning: Could not load button image: {e}")
             button_img = pygame.Surface((220, 70), pygame.SRCALPHA)
@@ -125,7 +126,7 @@ class CelestialInfoState(GameState):
         
         for rarity in ['extreme', 'legendary', 'epic', 'rare']:
             heroes = self.heroes_by_rarity.get(rarity, [])
-            rate = self.rates[rarity]
+            rate = self.rates.get(rarity, 0.0)
             color = self.rarity_colors[rarity]
             
             # หัวข้อ rarity และ rate
@@ -156,6 +157,13 @@ class CelestialInfoState(GameState):
             
             start_y += 130
         
+        # ค่าคาดหวังจนสะสมครบ (มุมขวาล่าง)
+        if self.font_small:
+            complete_text = f"AVG. TO COMPLETE: {self.expected_pulls:.0f} pulls (~{self.expected_coins:,.0f} coins)"
+            complete_surf = self.font_small.render(complete_text, True, (200, 200, 200))
+            screen.blit(complete_surf, (SCREEN_WIDTH - complete_surf.get_width() - 20,
+                                        SCREEN_HEIGHT - complete_surf.get_height() - 20))
+        
         # ปุ่ม BACK
         if self.back_button:
             self.back_button.draw(screen)
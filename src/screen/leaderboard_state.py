@@ -1,9 +1,9 @@
-"""Leaderboard state - แสดงอันดับ Player 1 และ Player 2"""
+"""Leaderboard state - แสดงอันดับผู้เล่น (ทุก slot)"""
 
 import pygame
 from src.core.game_state import GameState
 from src.utils import assets, player
-from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, LEADERBOARD_SIZE
 from src.ui.image_button import _ImageButton
 
 from typing import TYPE_CHECKING
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 
 
 class LeaderboardState(GameState):
-    """หน้าแสดงอันดับ Player 1 และ Player 2"""
+    """หน้าแสดงอันดับผู้เล่น"""
     
     def __init__(self, game: 'Game'):
         super().__init__(game)
@@ -48,12 +48,12 @@ class LeaderboardState(GameState):
             self.font_normal = pygame.font.Font(None, 24)
             self.font_small = pygame.font.Font(None, 15)
         
-        # โหลดข้อมูล Player 1 และ Player 2
+        # โหลดอันดับผู้เล่น
         self._load_leaderboard_data()
         
         # โหลดรูปปุ่ม
         try:
-            button_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            button_img = assets.load_image('assets/ui/12.png')
         except Exception as e:
             print(f"Warning: Could not load button image: {e}")
             button_img = pygame.Surface((220, 70), pygame.SRCALPHA)
@@ -73,25 +73,8 @@ class LeaderboardState(GameState):
         )
     
     def _load_leaderboard_data(self):
-        """โหลดข้อมูล Player 1 และ Player 2 แล้วเรียงตามแต้มชนะ"""
-        self.leaderboard_data = []
-        
-        for slot in [1, 2]:
-            data = player.load_player_data(slot)
-            rank = data.get('rank', 0)  # แต้มชนะ
-            hero_count = len(data['owned_heroes'])
-            coins = data['coins']
-            
-            self.leaderboard_data.append({
-                'slot': slot,
-                'name': f'Player {slot}',
-                'rank': rank,
-                'heroes': hero_count,
-                'coins': coins
-            })
-        
-        # เรียงตามแต้มชนะ (มากไปน้อย)
-        self.leaderboard_data.sort(key=lambda x: x['rank'], reverse=True)
+        """โหลดอันดับผู้เล่นทุก slot เรียงตามแต้มชนะ (storage เรียงให้)"""
+        self.leaderboard_data = player.get_leaderboard('rank', LEADERBOARD_SIZE)
     
     def on_back_click(self):
         """กลับไปหน้าล็อบบี้"""
@@ -2,6 +2,7 @@ import pygame
 from src.core.game_state import GameState
 from src.utils import assets
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.data.hero_data import get_all_heroes
 from src.ui.image_button import _ImageButton
 from src.ui.text_display import TextDisplay
 from src.utils import player
@@ -27,9 +28,55 @@ class LoadingState(GameState):
         self.BUTTON_BASE_PATH = 'assets/ui/12.png'
         self.BUTTON_SCALE = 1.2
 
+        self.WARMUP_GROUP = 'warmup'
+        self.progress_font = None
+
+    def queue_warmup(self):
+        """สั่ง preload รูปของหน้า lobby, กล่องสุ่ม และการ์ด ระหว่างรอเลือกผู้เล่น"""
+        screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        heroes = get_all_heroes()
+
+        # หน้า lobby (หน้าถัดไปทันทีที่เลือกผู้เล่น)
+        lobby = [
+            ('assets/backgrounds/town_1.png', screen_size),
+            'assets/ui/profile frame.png',
+            'assets/ui/coin.png',
+            'assets/ui/profile.png',
+            'assets/ui/add code.png',
+            ('assets/ui/mystic chest.png', (120, 120)),
+            ('assets/ui/celestial chest.png', (120, 120)),
+            ('assets/ui/collection.png', (120, 120)),
+            ('assets/ui/setting.png', (50, 50)),
+        ]
+        lobby += [(hero.portrait_path, variant) for hero in heroes for variant in ('lobby_small', 'lobby_large')]
+        assets.preload(lobby, assets.PRIORITY_NOW, group=self.WARMUP_GROUP)
+
+        # กล่องสุ่มและการ์ด (ขนาดในหน้ากล่องสุ่ม 100x140 และหน้า battle 120x160) และรูปฮีโร่ใหม่
+        chest = [
+            ('assets/backgrounds/summon_2.png', screen_size),
+            'assets/ui/summon normal1.png',
+            'assets/ui/summon normal10.png',
+            'assets/ui/summon premium1.png',
+            'assets/ui/summon premium10.png',
+        ]
+        card_paths = sorted({hero.card_front_path for hero in heroes} | {hero.card_back_path for hero in heroes})
+        for size in ((100, 140), (120, 160)):
+            chest += [(path, size) for path in card_paths]
+        chest += [(hero.portrait_path, 'new_hero') for hero in heroes]
+        assets.preload(chest, assets.PRIORITY_NEXT, group=self.WARMUP_GROUP)
+
+        # หน้าที่ไม่รีบ (หน้าวิธีเล่นมีรูปเต็มจอ 17 รูป)
+        idle = [('assets/backgrounds/book.png', screen_size),
+                'assets/ui/left botton.png', 'assets/ui/right botton.png']
+        idle += [(f'assets/How_to_play/{i}.png', screen_size) for i in range(1, 18)]
+        assets.preload(idle, assets.PRIORITY_IDLE)
+
     def enter(self):
         # หยุดเพลงในหน้า loading
         pygame.mixer.music.stop()
+
+        self.queue_warmup()
+        self.progress_font = assets.load_font('assets/fonts/Monocraft.ttf', 16)
         
         try:
             self.background = assets.load_image('assets/backgrounds/town_2.png').convert()
@@ -48,12 +95,12 @@ class LoadingState(GameState):
         )
 
         try:
-            base_img = assets.load_image(self.BUTTON_BASE_PATH).convert_alpha()
-            btn_player1 = assets.load_image('assets/ui/player1.png').convert_alpha()
-            btn_player2 = assets.load_image('assets/ui/player2.png').convert_alpha()
-            img_character1 = assets.load_image('assets/portraits/hero21.png').convert_alpha()
-            img_character2 = assets.load_image('assets/portraits/hero17.png').convert_alpha()
-            Btn_battle = assets.load_image('assets/ui/battle_button.png').convert_alpha()
+            base_img = assets.load_image(self.BUTTON_BASE_PATH)
+            btn_player1 = assets.load_image('assets/ui/player1.png')
+            btn_player2 = assets.load_image('assets/ui/player2.png')
+            img_character1 = assets.load_image('assets/portraits/hero21.png')
+            img_character2 = assets.load_image('assets/portraits/hero17.png')
+            Btn_battle = assets.load_image('assets/ui/battle_button.png')
 
         except Exception as e:
             print(f"Error: {e}")
@@ -216,6 +263,21 @@ class LoadingState(GameState):
         if self.btn_question: self.btn_question.draw(screen)
         if self.img_character1: self.img_character1.draw(screen)
         if self.img_character2: self.img_character2.draw(screen)
+        self.draw_progress(screen)
+
+    def draw_progress(self, screen: pygame.Surface):
+        """แถบความคืบหน้าการ preload (หายไปเมื่อโหลดครบ)"""
+        done, total = assets.preload_progress(self.WARMUP_GROUP)
+        if not total or done >= total:
+            return
+        bar_width, bar_height = 300, 8
+        bar_x = (SCREEN_WIDTH - bar_width) // 2
+        bar_y = SCREEN_HEIGHT - 30
+        pygame.draw.rect(screen, (60, 60, 90), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(screen, (228, 162, 31), (bar_x, bar_y, bar_width * done // total, bar_height))
+        if self.progress_font:
+            text = self.progress_font.render(f"Loading assets {done}/{total}", True, (255, 255, 255))
+            screen.blit(text, text.get_rect(midbottom=(SCREEN_WIDTH // 2, bar_y - 4)))
 
     def exit(self):
         pass
@@ -4,7 +4,7 @@ import pygame
 from src.core.game_state import GameState
 from src.ui.button import Button
 from src.ui.text_display import TextDisplay
-from src.utils import assets
+from src.utils import assets, player
 
 from src.data.hero_data import get_hero
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_GOLD
@@ -203,27 +203,8 @@ class MainLobbyState(GameState):
         self.portrait_positions = []
         self.hero_ids_displayed = []
         
-        # ดึงตัวละครที่มีและเรียงตามความแรร์ (แรร์สุดก่อน)
-        owned_hero_ids = list(self.player_data['owned_heroes'])
-        
-        # เรียงตามความแรร์ (จากมากไปน้อย - แรร์สุดก่อน)
-        hero_rarity_map = {
-            'rare': 1,
-            'epic': 2,
-            'legendary': 3,
-            'extreme': 4
-        }
-        
-        def get_hero_rarity_value(hero_id):
-            hero = get_hero(hero_id)
-            if hero:
-                return hero_rarity_map.get(hero.rarity.lower(), 0)
-            return 0
-        
-        owned_hero_ids.sort(key=get_hero_rarity_value, reverse=True)
-        
-        # จำกัดแค่ 3 ตัวแรกสำหรับแสดง
-        owned_hero_ids = owned_hero_ids[:3]
+        # 3 ตัวที่แรร์สุด (collection เรียงไว้แล้วตอนเพิ่มฮีโร่ ไม่ต้อง sort ใหม่)
+        owned_hero_ids = player.top_heroes(self.player_data, 3)
         
         if not owned_hero_ids:
             # ยังไม่มีตัวละคร
@@ -239,26 +220,18 @@ class MainLobbyState(GameState):
             hero = get_hero(hero_id)
             if hero:
                 try:
-                    # Load original image first
-                    original_portrait = assets.load_image(hero.portrait_path)
-                    # Get original dimensions
-                    original_width = original_portrait.get_width()
-                    original_height = original_portrait.get_height()
-                    
-                    # ขนาดต่างกันระหว่างตัวกลางกับข้างๆ
+                    # ขนาดต่างกันระหว่างตัวกลางกับข้างๆ (variant ใน IMAGE_VARIANTS)
                     if len(owned_hero_ids) == 3 and i == 1:
                         # ตัวกลาง - ขนาด 40%
-                        scale = 0.4
+                        variant = 'lobby_large'
                     elif len(owned_hero_ids) == 1:
                         # มีแค่ตัวเดียว - ขนาด 40%
-                        scale = 0.4
+                        variant = 'lobby_large'
                     else:
                         # ตัวข้างๆ - ขนาด 30% (เล็กกว่า)
-                        scale = 0.3
+                        variant = 'lobby_small'
                     
-                    scaled_width = int(original_width * scale)
-                    scaled_height = int(original_height * scale)
-                    portrait = pygame.transform.scale(original_portrait, (scaled_width, scaled_height))
+                    portrait = assets.load_image(hero.portrait_path, variant)
                     temp_portraits.append(portrait)
                     self.hero_ids_displayed.append(hero_id)
                 except Exception as e:
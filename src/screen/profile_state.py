@@ -4,9 +4,9 @@ import pygame
 from src.core.game_state import GameState
 from src.ui.button import Button
 from src.ui.text_display import TextDisplay
-from src.utils import assets
+from src.utils import assets, player
 
-from src.data.hero_data import get_hero, get_all_heroes
+from src.data.hero_data import get_all_heroes
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT, COLOR_GOLD, COLOR_WHITE
 from src.ui.image_button import _ImageButton
 
@@ -66,7 +66,7 @@ class ProfileState(GameState):
         
         # โหลดรูปปุ่ม (ใช้รูปเดียวกับหน้าแรก)
         try:
-            button_img = assets.load_image('assets/ui/12.png').convert_alpha()
+            button_img = assets.load_image('assets/ui/12.png')
         except Exception as e:
             print(f"Warning: Could not load button image: {e}")
             button_img = pygame.Surface((220, 70), pygame.SRCALPHA)
@@ -100,23 +100,8 @@ class ProfileState(GameState):
         self._load_leaderboard_data()
     
     def _load_leaderboard_data(self):
-        """โหลดข้อมูล Player 1 และ Player 2 แล้วเรียงตามแต้มชนะ"""
-        from src.utils import player
-        
-        self.leaderboard_data = []
-        
-        for slot in [1, 2]:
-            data = player.load_player_data(slot)
-            rank = data.get('rank', 0)  # แต้มชนะ
-            
-            self.leaderboard_data.append({
-                'slot': slot,
-                'name': f'Player {slot}',
-                'rank': rank
-            })
-        
-        # เรียงตามแต้มชนะ (มากไปน้อย)
-        self.leaderboard_data.sort(key=lambda x: x['rank'], reverse=True)
+        """โหลดอันดับผู้เล่นทุก slot เรียงตามแต้มชนะ (แสดงสูงสุด 5 อันดับ)"""
+        self.leaderboard_data = player.get_leaderboard('rank', 5)
     
     def on_back_click(self):
         """Callback for Return button - go back to main lobby"""
@@ -164,8 +149,8 @@ class ProfileState(GameState):
             screen.blit(self.background, (0, 0))
         
         # คำนวณข้อมูลผู้เล่น
-        total_power = sum(get_hero(hero_id).power for hero_id in self.player_data['owned_heroes'] if get_hero(hero_id))
-        collected = len(self.player_data['owned_heroes'])
+        total_power = player.get_total_power(self.player_data)
+        collected = player.count_collected(self.player_data)
         total_heroes = 21  # จำนวนฮีโร่ทั้งหมด
         all_gold = self.player_data['coins']
         
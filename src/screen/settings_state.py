@@ -6,7 +6,7 @@ from src.ui.button import Button
 from src.ui.slider import Slider
 from src.ui.text_input import TextInput
 from src.utils import assets
-from src.utils import codes
+from src.utils import codes, player
 from src.core.config import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.ui.image_button import _ImageButton
 
@@ -57,8 +57,8 @@ class SettingsState(GameState):
             self.font_title = assets.load_font('assets/fonts/Monocraft.ttf', 60)
             self.font_normal = assets.load_font('assets/fonts/Monocraft.ttf', 24)
             self.font_small = assets.load_font('assets/fonts/Monocraft.ttf', 20)
-            self.slider_bar = assets.load_image('assets/ui/slider_bar.png').convert_alpha()
-            self.slider_button = assets.load_image('assets/ui/slider_button.png').convert_alpha()
+            self.slider_bar = assets.load_image('assets/ui/slider_bar.png')
+            self.slider_button = assets.load_image('assets/ui/slider_button.png')
         except Exception as e:
             print(f"Warning: Could not load font: {e}")
 
@@ -94,9 +94,9 @@ class SettingsState(GameState):
         
         # โหลดรูปปุ่ม (ใช้รูปเดียวกับหน้าแรก)
         try:
-            button_img = assets.load_image('assets/ui/12.png').convert_alpha()
-            button_save = assets.load_image('assets/ui/save_button.png').convert_alpha()
-            button_logout = assets.load_image('assets/ui/logout.png').convert_alpha()
+            button_img = assets.load_image('assets/ui/12.png')
+            button_save = assets.load_image('assets/ui/save_button.png')
+            button_logout = assets.load_image('assets/ui/logout.png')
 
         except Exception as e:
             print(f"Warning: Could not load button image: {e}")
@@ -135,6 +135,7 @@ class SettingsState(GameState):
         # Update player settings (ถ้ามี player_data)
         if hasattr(self.game, 'player_data') and self.game.player_data:
             self.game.player_data['settings']['volume'] = value
+            player.touch(self.game.player_data, 'settings')
         
         # Adjust pygame mixer volume (0.0 to 1.0)
         volume = value / 100.0
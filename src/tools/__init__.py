@@ -0,0 +1 @@
+# Headless tools (simulation, balance)
@@ -0,0 +1,98 @@
+"""
+สร้าง asset pack (รูปที่ถอดรหัสและปรับขนาดไว้แล้ว) ให้เกมเปิดด้วย mmap แทนการถอดรหัส PNG
+
+ใส่รูปทุกไฟล์ใน assets/ ที่ขนาดเดิม และขนาดที่หน้าจอต่างๆ เรียกด้วย load_image(path, scale)
+ต้องสร้างใหม่เมื่อแก้รูป (ถ้าไม่สร้างใหม่ เกมจะโหลด PNG ของรูปที่เปลี่ยนแทนเอง)
+
+วิธีใช้:
+    python -m src.tools.build_asset_pack
+    python -m src.tools.build_asset_pack --output data/assets.pack --bench
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import pygame
+
+from src.core.config import ASSET_PACK_PATH, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils import asset_pack
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# (pattern, scale) ที่หน้าจอต่างๆ โหลดแบบปรับขนาด
+# (การ์ดและ portrait ขนาดย่อไม่อยู่ใน pack - ใช้ variant ใน IMAGE_VARIANTS แทน)
+SCALED_IMAGES = [
+    ('assets/backgrounds/*.png', (SCREEN_WIDTH, SCREEN_HEIGHT)),
+    ('assets/How_to_play/*.png', (SCREEN_WIDTH, SCREEN_HEIGHT)),
+    ('assets/ui/question.png', (50, 50)),
+    ('assets/ui/setting.png', (50, 50)),
+    ('assets/ui/mystic chest.png', (120, 120)),
+    ('assets/ui/celestial chest.png', (120, 120)),
+    ('assets/ui/collection.png', (120, 120)),
+]
+
+
+def collect_entries(root='assets'):
+    """
+    รายการ (path, scale) ที่จะใส่ใน pack
+
+    Returns:
+        list
+    """
+    entries = []
+    for path in sorted(glob.glob(os.path.join(root, '**', '*'), recursive=True)):
+        if path.lower().endswith(IMAGE_EXTENSIONS):
+            entries.append((path.replace(os.sep, '/'), None))
+
+    for pattern, scale in SCALED_IMAGES:
+        for path in sorted(glob.glob(pattern)):
+            entries.append((path.replace(os.sep, '/'), scale))
+    return entries
+
+
+def bench(entries, pack_path):
+    """เทียบเวลาโหลดทุกรูปจาก PNG กับจาก pack"""
+    start = time.perf_counter()
+    for path, scale in entries:
+        surface = pygame.image.load(path)
+        if scale:
+            surface = pygame.transform.scale(surface, scale)
+    png_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pack = asset_pack.open_pack(pack_path)
+    for path, scale in entries:
+        asset_pack.get_surface(pack, path, scale)
+    pack_time = time.perf_counter() - start
+
+    # pack อ่าน pixel จากดิสก์ตอนวาดครั้งแรก (page fault) เวลานี้คือส่วนที่ตัดออกจากการเข้าหน้าจอ
+    print(f"PNG decode: {png_time * 1000:.1f}ms, pack: {pack_time * 1000:.1f}ms "
+          f"({png_time / pack_time:.0f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the pre-decoded asset pack")
+    parser.add_argument('--output', default=ASSET_PACK_PATH, help="pack file to write")
+    parser.add_argument('--root', default='assets', help="asset directory")
+    parser.add_argument('--bench', action='store_true', help="compare PNG and pack load time afterwards")
+    args = parser.parse_args(argv)
+
+    entries = collect_entries(args.root)
+    start = time.perf_counter()
+    result = asset_pack.build(entries, args.output)
+    print(f"Wrote {result['entries']} images ({result['bytes'] / 1024 / 1024:.1f} MB) to {args.output} "
+          f"in {time.perf_counter() - start:.1f}s")
+    if result['skipped']:
+        print(f"Skipped {len(result['skipped'])}: {', '.join(result['skipped'])}")
+
+    if args.bench:
+        bench([entry for entry in entries if entry[0] not in result['skipped']], args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+สร้างรูปย่อ (variant) ทั้งหมดใน IMAGE_VARIANTS ลง VARIANT_CACHE_DIR ล่วงหน้า
+(ถ้าไม่สร้างไว้ เกมจะสร้างเองครั้งแรกที่ใช้แต่ละรูป)
+
+วิธีใช้:
+    python -m src.tools.build_variants
+    python -m src.tools.build_variants --force --prune
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+
+from src.core.config import IMAGE_VARIANTS
+from src.utils import variants
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+def source_images(prefix):
+    """รูปต้นฉบับทั้งหมดในกลุ่ม (prefix ของ path)"""
+    paths = glob.glob(prefix + '**/*', recursive=True)
+    return sorted(path.replace(os.sep, '/') for path in paths if path.lower().endswith(IMAGE_EXTENSIONS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pre-generate scaled image variants")
+    parser.add_argument('--force', action='store_true', help="regenerate variants that already exist")
+    parser.add_argument('--prune', action='store_true', help="delete variant files of old source versions")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    built = reused = 0
+    keep = set()
+    for prefix, named in IMAGE_VARIANTS.items():
+        for path in source_images(prefix):
+            for variant in named:
+                filepath = variants.cache_path(path, variant)
+                keep.add(filepath)
+                if os.path.exists(filepath) and not args.force:
+                    reused += 1
+                    continue
+                if args.force and os.path.exists(filepath):
+                    os.remove(filepath)
+                if variants.load_variant(path, variant) is not None:
+                    built += 1
+    print(f"Built {built} variants, {reused} up to date, in {time.perf_counter() - start:.1f}s")
+
+    if args.prune:
+        print(f"Removed {variants.prune(keep)} stale variant files")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
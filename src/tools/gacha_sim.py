@@ -0,0 +1,204 @@
+"""
+Monte Carlo simulator - จำลองผู้เล่นสุ่มกล่องจนสะสมฮีโร่ครบ
+
+ใช้กล่องจริงจาก src/data/banner_data.py (อัตรา, pool ฮีโร่ และราคาจาก data/json/banners.json)
+แล้วกระจายงานไปหลาย process (chunk ที่ i ใช้ Philox stream counter i ของ seed เดียวกัน
+ผลลัพธ์จึงเหมือนเดิมไม่ว่าจะใช้กี่ worker และรัน chunk ไหนแยกก็ได้)
+
+วิธีใช้:
+    python -m src.tools.gacha_sim --banner celestial --players 1000000
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.data.banner_data import get_banner, get_all_banners
+from src.utils import rng as rng_streams
+
+
+PERCENTILES = (50, 75, 90, 95, 99, 99.9)
+
+BANNER_KEYS = sorted(banner.key for banner in get_all_banners())
+
+
+def banner_targets(banner):
+    """
+    หา id ของฮีโร่ที่สุ่มได้จากกล่องนี้ (ต้องสะสมครบกี่ตัวถึงจะ "ครบ")
+
+    Args:
+        banner: ชื่อกล่อง ('mystic' หรือ 'celestial')
+
+    Returns:
+        numpy.ndarray: id ของฮีโร่ที่มีโอกาสได้
+    """
+    ids = {hero.id for pool in get_banner(banner).pools.values() for hero in pool}
+    return np.array(sorted(ids), dtype=np.int16)
+
+
+def simulate_chunk(banner, players, seed, chunk_index, block=256):
+    """
+    จำลองผู้เล่นกลุ่มหนึ่งจนทุกคนสะสมครบ
+
+    Args:
+        banner: ชื่อกล่อง
+        players: จำนวนผู้เล่นใน chunk นี้
+        seed: seed ของการ simulation
+        chunk_index: ลำดับ chunk (ใช้เป็น counter ของ stream)
+        block: จำนวนครั้งที่สุ่มต่อรอบของผู้เล่นแต่ละคน
+
+    Returns:
+        numpy.ndarray: จำนวนครั้งที่สุ่มจนครบของผู้เล่นแต่ละคน
+    """
+    rng = rng_streams.stream(seed, 0, 'sim', chunk_index)
+    pull_ids = get_banner(banner).pull_ids
+    targets = banner_targets(banner)
+
+    # แปลง hero id -> column ใน owned (-1 = ไม่ใช่เป้าหมาย)
+    column_of = np.full(int(targets.max()) + 1, -1, dtype=np.int16)
+    column_of[targets] = np.arange(len(targets), dtype=np.int16)
+
+    owned = np.zeros((players, len(targets)), dtype=bool)
+    last_new = np.zeros(players, dtype=np.int64)
+    result = np.zeros(players, dtype=np.int64)
+    active = np.arange(players)
+    base = 0
+
+    while len(active):
+        draws = column_of[pull_ids(len(active) * block, rng=rng)]
+        draws = draws.reshape(len(active), block)
+        owned_active = owned[active]
+        last_active = last_new[active]
+
+        for col in range(len(targets)):
+            hit = draws == col
+            first = hit.argmax(axis=1)
+            newly = hit[np.arange(len(active)), first] & ~owned_active[:, col]
+            owned_active[newly, col] = True
+            np.maximum(last_active, np.where(newly, base + first, 0), out=last_active)
+
+        owned[active] = owned_active
+        last_new[active] = last_active
+
+        done = owned_active.all(axis=1)
+        result[active[done]] = last_active[done] + 1
+        active = active[~done]
+        base += block
+
+    return result
+
+
+def pulls_to_coins(pulls, banner, pack):
+    """
+    แปลงจำนวนครั้งที่สุ่มเป็นเหรียญที่ใช้
+
+    Args:
+        pulls: numpy.ndarray จำนวนครั้งที่สุ่ม
+        banner: ชื่อกล่อง
+        pack: 1 (ซื้อทีละครั้ง) หรือ 10 (ซื้อทีละ 10)
+
+    Returns:
+        numpy.ndarray: เหรียญที่ใช้
+    """
+    cost = get_banner(banner).cost(pack)
+    return -(-pulls // pack) * cost
+
+
+def run(banner, players, workers=None, seed=None, pack=1, chunk_size=50_000):
+    """
+    จำลองผู้เล่นทั้งหมดบน process pool
+
+    Returns:
+        numpy.ndarray: จำนวนครั้งที่สุ่มจนครบของผู้เล่นทุกคน (เรียงตาม chunk)
+    """
+    if seed is None:
+        seed = rng_streams.new_seed()
+    chunks = [chunk_size] * (players // chunk_size)
+    if players % chunk_size:
+        chunks.append(players % chunk_size)
+    indices = range(len(chunks))
+    seeds = [seed] * len(chunks)
+
+    if workers == 1:
+        parts = [simulate_chunk(banner, n, seed, i) for n, i in zip(chunks, indices)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(simulate_chunk, [banner] * len(chunks), chunks, seeds, indices))
+
+    return np.concatenate(parts)
+
+
+def summarize(banner, pulls, pack, seed=None):
+    """สรุปผลเป็น dict (mean/percentile ของจำนวนครั้งและเหรียญ)"""
+    coins = pulls_to_coins(pulls, banner, pack)
+    return {
+        'banner': banner,
+        'seed': seed,
+        'players': int(len(pulls)),
+        'heroes': int(len(banner_targets(banner))),
+        'pack': f'x{pack}',
+        'pulls': {
+            'mean': float(pulls.mean()),
+            'max': int(pulls.max()),
+            **{f'p{p:g}': float(np.percentile(pulls, p)) for p in PERCENTILES}
+        },
+        'coins': {
+            'mean': float(coins.mean()),
+            'max': int(coins.max()),
+            **{f'p{p:g}': float(np.percentile(coins, p)) for p in PERCENTILES}
+        },
+    }
+
+
+def print_summary(summary, elapsed):
+    """แสดงผลเป็นตาราง"""
+    print(f"\n{summary['banner'].upper()} CHEST - {summary['players']:,} players, "
+          f"{summary['heroes']} heroes, pack {summary['pack']} ({elapsed:.2f}s)")
+    print(f"{'':>8} {'pulls':>12} {'coins':>14}")
+    for key in ['mean'] + [f'p{p:g}' for p in PERCENTILES] + ['max']:
+        print(f"{key:>8} {summary['pulls'][key]:>12,.1f} {summary['coins'][key]:>14,.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate players pulling until their collection is complete")
+    parser.add_argument('--banner', choices=BANNER_KEYS + ['all'], default='all')
+    parser.add_argument('--players', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--pack', type=int, choices=(1, 10), default=1,
+                        help="buy pulls one at a time or in x10 packs")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+    if args.players < 1:
+        parser.error("--players must be at least 1")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    banners = BANNER_KEYS if args.banner == 'all' else [args.banner]
+    if args.seed is None:
+        args.seed = rng_streams.new_seed()
+    if not args.json:
+        print(f"seed: {args.seed}")
+    summaries = []
+    for banner in banners:
+        start = time.perf_counter()
+        pulls = run(banner, args.players, args.workers, args.seed, args.pack, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        summary = summarize(banner, pulls, args.pack, args.seed)
+        summaries.append(summary)
+        if not args.json:
+            print_summary(summary, elapsed)
+
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+
+
+if __name__ == '__main__':
+    main()
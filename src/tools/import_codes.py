@@ -0,0 +1,92 @@
+"""
+นำเข้าโค้ดแลกรางวัลจำนวนมากเข้า CodeStore (data/codes.db)
+
+ไฟล์นำเข้าเป็น CSV: code,coins[,description] (อ่านทีละแถว ไฟล์ใหญ่แค่ไหนก็ได้)
+ถ้าไม่ระบุไฟล์แต่ระบุ --generate จะสร้างโค้ดสุ่มให้ (พิมพ์ไว้ใน --out)
+
+วิธีใช้:
+    python -m src.tools.import_codes promo.csv --source promo-2026-10
+    python -m src.tools.import_codes --generate 500000 --coins 100 --source promo-2026-10 --out promo.csv
+    python -m src.tools.import_codes --remove promo-2026-10
+"""
+
+import argparse
+import csv
+import secrets
+import sys
+import time
+
+from src.utils import codes
+
+
+CODE_ALPHABET = 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'  # ไม่มี O/0/I/1 ที่อ่านสับสน
+
+
+def read_csv(filepath, default_description):
+    """อ่านแถว (code, coins, description) จาก CSV ทีละแถว"""
+    with open(filepath, newline='', encoding='utf-8') as f:
+        for line_no, row in enumerate(csv.reader(f), 1):
+            if not row or row[0].startswith('#'):
+                continue
+            if line_no == 1 and row[0].strip().lower() == 'code':
+                continue  # header
+            try:
+                coins = int(row[1])
+            except (IndexError, ValueError):
+                raise SystemExit(f"{filepath}:{line_no}: expected code,coins[,description]")
+            description = row[2] if len(row) > 2 and row[2] else default_description
+            yield row[0], coins, description
+
+
+def generate(count, coins, description, length, out=None):
+    """สร้างโค้ดสุ่ม count ตัว (เขียนลง out ด้วยถ้าระบุ)"""
+    writer = csv.writer(out) if out else None
+    system_random = secrets.SystemRandom()
+    for _ in range(count):
+        code = ''.join(system_random.choices(CODE_ALPHABET, k=length))
+        if writer:
+            writer.writerow((code, coins, description))
+        yield code, coins, description
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import redeem codes into the code store")
+    parser.add_argument('csv', nargs='?', help="CSV file with code,coins[,description] rows")
+    parser.add_argument('--source', default='batch', help="batch name (used by --remove)")
+    parser.add_argument('--description', default='Bonus', help="description for rows without one")
+    parser.add_argument('--generate', type=int, metavar='N', help="generate N random codes instead of reading a CSV")
+    parser.add_argument('--coins', type=int, default=100, help="coins per generated code")
+    parser.add_argument('--length', type=int, default=12, help="length of generated codes")
+    parser.add_argument('--out', help="write generated codes to this CSV file")
+    parser.add_argument('--remove', metavar='SOURCE', help="delete every code imported with SOURCE")
+    args = parser.parse_args(argv)
+
+    store = codes.get_codes()
+    start = time.perf_counter()
+
+    if args.remove:
+        removed = store.remove_source(args.remove)
+        print(f"Removed {removed} code(s) from {args.remove!r}")
+        return 0
+
+    if args.generate:
+        out = open(args.out, 'w', newline='', encoding='utf-8') if args.out else None
+        try:
+            added = store.import_codes(
+                generate(args.generate, args.coins, args.description, args.length, out), args.source)
+        finally:
+            if out:
+                out.close()
+    elif args.csv:
+        added = store.import_codes(read_csv(args.csv, args.description), args.source)
+    else:
+        parser.error("give a CSV file, --generate N or --remove SOURCE")
+
+    elapsed = time.perf_counter() - start
+    print(f"Imported {added} code(s) into {store.db_path} as {args.source!r} "
+          f"({elapsed:.2f}s, {store.count()} total)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""
+ตรวจสอบอัตราดรอปจริงเทียบกับอัตราที่ตั้งไว้ (chi-square + binomial z-test)
+
+อ่านผลการสุ่มแบบ stream (หน่วยความจำคงที่) แล้วนับเป็น bincount ทีละ chunk:
+    - journal: เหตุการณ์ 'summon' จาก data/journal (รวมไฟล์ที่หมุนแล้ว)
+    - simulate: สุ่มด้วย Banner.pull_ids ทีละ chunk (หลาย process) - จำนวนเท่าไหร่ก็ได้
+
+ค่าที่คาดหวังของฮีโร่แต่ละตัว = อัตราของ rarity / จำนวนฮีโร่ใน pool (ตาม pool จริงของกล่อง)
+หมายเหตุ: journal ถูกเทียบกับอัตราปัจจุบันใน banners.json ถ้าเคยแก้อัตราระหว่างทาง ให้ตรวจแยกช่วงเอง
+
+วิธีใช้:
+    python -m src.tools.rate_check --source journal
+    python -m src.tools.rate_check --source simulate --banner celestial --pulls 1000000000
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.data.banner_data import get_banner, get_all_banners
+from src.data.hero_data import get_all_heroes
+from src.utils import journal
+from src.utils import rng as rng_streams
+from src.utils.gacha import RARITY_ORDER
+
+
+BANNER_KEYS = sorted(banner.key for banner in get_all_banners())
+
+# id สูงสุดของฮีโร่ (ความยาวของ bincount)
+MAX_HERO_ID = max(hero.id for hero in get_all_heroes())
+
+# rarity ของฮีโร่แต่ละ id (index ตาม RARITY_ORDER)
+_RARITY_OF = np.zeros(MAX_HERO_ID + 1, dtype=np.int64)
+for _hero in get_all_heroes():
+    _RARITY_OF[_hero.id] = RARITY_ORDER.index(_hero.rarity)
+
+
+# ---------- สถิติ ----------
+
+def gamma_q(a, x):
+    """
+    Regularized upper incomplete gamma Q(a, x) (series / continued fraction)
+
+    ใช้หา p-value ของ chi-square: p = Q(df / 2, chi2 / 2)
+    """
+    if x <= 0:
+        return 1.0
+    log_front = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        # series ของ P(a, x) แล้วคืน 1 - P
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return max(0.0, 1.0 - total * math.exp(log_front))
+
+    # continued fraction (Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    i = 1
+    while True:
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+        i += 1
+    return math.exp(log_front) * h
+
+
+def chi_square(observed, expected_probs):
+    """
+    Chi-square goodness-of-fit
+
+    Args:
+        observed: numpy array จำนวนที่นับได้
+        expected_probs: numpy array ความน่าจะเป็นที่คาดหวัง (รวมเป็น 1)
+
+    Returns:
+        tuple: (chi2, df, p_value)
+    """
+    mask = expected_probs > 0
+    n = observed.sum()
+    expected = expected_probs[mask] * n
+    chi2 = float((((observed[mask] - expected) ** 2) / expected).sum())
+    df = int(mask.sum()) - 1
+    # นับได้ในช่องที่อัตราเป็น 0 = ผิดแน่นอน
+    if observed[~mask].sum() > 0:
+        return math.inf, df, 0.0
+    return chi2, df, gamma_q(df / 2, chi2 / 2) if df > 0 else 1.0
+
+
+def binomial_z(observed, n, p):
+    """
+    Binomial z-test (normal approximation, two-sided)
+
+    Returns:
+        tuple: (z, p_value)
+    """
+    if p <= 0 or p >= 1:
+        ok = (observed == 0) if p <= 0 else (observed == n)
+        return (0.0, 1.0) if ok else (math.inf, 0.0)
+    z = (observed - n * p) / math.sqrt(n * p * (1 - p))
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+# ---------- ค่าที่คาดหวัง ----------
+
+def expected_hero_probs(banner_key):
+    """
+    ความน่าจะเป็นของฮีโร่แต่ละ id จาก pool จริงของกล่อง
+
+    Returns:
+        numpy.ndarray: ยาว MAX_HERO_ID + 1 (index = hero id)
+    """
+    banner = get_banner(banner_key)
+    probs = np.zeros(MAX_HERO_ID + 1, dtype=np.float64)
+    for rarity, pool in banner.pools.items():
+        for hero in pool:
+            probs[hero.id] += banner.rates[rarity] / len(pool)
+    return probs
+
+
+def by_rarity(per_hero):
+    """รวมค่าตาม rarity ของฮีโร่ (index ตาม RARITY_ORDER)"""
+    return np.bincount(_RARITY_OF, weights=per_hero, minlength=len(RARITY_ORDER))
+
+
+# ---------- แหล่งข้อมูล ----------
+
+def count_journal(filepath=journal.JOURNAL_PATH, chunk=1_000_000):
+    """
+    นับฮีโร่จาก journal ทีละ chunk
+
+    Returns:
+        dict: {banner_key: numpy array จำนวนต่อ hero id}
+    """
+    counts = {}
+    pending = {}
+
+    def drain(key):
+        ids = np.fromiter(pending.pop(key), dtype=np.int64)
+        counts[key] = counts.get(key, 0) + np.bincount(ids, minlength=MAX_HERO_ID + 1)
+
+    for record in journal.read_events(filepath, event='summon'):
+        key = record.get('banner')
+        ids = pending.setdefault(key, [])
+        ids.extend(record.get('heroes', ()))
+        if len(ids) >= chunk:
+            drain(key)
+
+    for key in list(pending):
+        drain(key)
+    return counts
+
+
+def count_simulated_chunk(banner_key, pulls, seed, chunk_index):
+    """สุ่ม pulls ครั้งด้วย stream ของ chunk นี้แล้วคืน bincount"""
+    gen = rng_streams.stream(seed, 0, 'sim', chunk_index)
+    ids = get_banner(banner_key).pull_ids(pulls, rng=gen)
+    return np.bincount(ids, minlength=MAX_HERO_ID + 1)
+
+
+def count_simulated(banner_key, pulls, seed, workers=None, chunk=10_000_000):
+    """
+    นับฮีโร่จากการสุ่มจำลอง pulls ครั้ง (แบ่ง chunk ละ chunk ครั้ง กระจายไปหลาย process)
+
+    Returns:
+        numpy.ndarray: จำนวนต่อ hero id
+    """
+    sizes = [chunk] * (pulls // chunk)
+    if pulls % chunk:
+        sizes.append(pulls % chunk)
+    indices = range(len(sizes))
+
+    total = np.zeros(MAX_HERO_ID + 1, dtype=np.int64)
+    if workers == 1:
+        for n, i in zip(sizes, indices):
+            total += count_simulated_chunk(banner_key, n, seed, i)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(count_simulated_chunk, [banner_key] * len(sizes), sizes,
+                                 [seed] * len(sizes), indices):
+                total += part
+    return total
+
+
+# ---------- รายงาน ----------
+
+def check(banner_key, counts, alpha=0.001):
+    """
+    ทดสอบจำนวนที่นับได้ของกล่องเทียบกับอัตราที่ตั้งไว้
+
+    ทดสอบ binomial ทุก rarity และทุกฮีโร่ (ปรับ alpha แบบ Bonferroni ตามจำนวนการทดสอบ)
+
+    Returns:
+        dict: ผลการทดสอบ ('flagged' = รายการที่ผิดปกติ)
+    """
+    hero_probs = expected_hero_probs(banner_key)
+    n = int(counts.sum())
+    rarity_counts = by_rarity(counts.astype(np.float64))
+    rarity_probs = by_rarity(hero_probs)
+
+    heroes = [i for i in range(len(hero_probs)) if hero_probs[i] > 0 or counts[i] > 0]
+    rarities = [i for i in range(len(RARITY_ORDER)) if rarity_probs[i] > 0 or rarity_counts[i] > 0]
+    threshold = alpha / max(1, len(heroes) + len(rarities))
+
+    rows = []
+    for kind, names, observed, probs in (
+        ('rarity', [RARITY_ORDER[i] for i in rarities], rarity_counts[rarities], rarity_probs[rarities]),
+        ('hero', [str(i) for i in heroes], counts[heroes], hero_probs[heroes]),
+    ):
+        for name, obs, p in zip(names, observed.tolist(), probs.tolist()):
+            z, p_value = binomial_z(obs, n, p)
+            rows.append({
+                'kind': kind, 'name': name, 'observed': int(obs),
+                'expected': n * p, 'rate': p, 'actual': obs / n if n else 0.0,
+                'z': z, 'p_value': p_value, 'flag': p_value < threshold,
+            })
+
+    chi2_hero = chi_square(counts.astype(np.float64), hero_probs)
+    chi2_rarity = chi_square(rarity_counts, rarity_probs)
+
+    return {
+        'banner': banner_key,
+        'pulls': n,
+        'alpha': alpha,
+        'chi2_rarity': chi2_rarity,
+        'chi2_hero': chi2_hero,
+        'rows': rows,
+        'flagged': [row for row in rows if row['flag']]
+                   + [{'kind': 'chi2', 'name': name} for name, (_, _, p) in
+                      (('rarity', chi2_rarity), ('hero', chi2_hero)) if p < alpha],
+    }
+
+
+def print_report(result, show_heroes=False):
+    """แสดงผลเป็นตาราง"""
+    print(f"\n{result['banner'].upper()} - {result['pulls']:,} pulls (alpha {result['alpha']:g})")
+    for name in ('rarity', 'hero'):
+        chi2, df, p = result[f'chi2_{name}']
+        print(f"  chi-square by {name:<6}: {chi2:12.3f}  df {df:>2}  p {p:.4g}")
+
+    print(f"  {'':>10} {'observed':>14} {'expected':>16} {'rate':>9} {'actual':>9} {'z':>8}")
+    for row in result['rows']:
+        if row['kind'] == 'hero' and not (show_heroes or row['flag']):
+            continue
+        label = row['name'] if row['kind'] == 'rarity' else f"hero {row['name']}"
+        mark = '  <-- FLAG' if row['flag'] else ''
+        print(f"  {label:>10} {row['observed']:>14,} {row['expected']:>16,.1f} "
+              f"{row['rate']:>9.4%} {row['actual']:>9.4%} {row['z']:>8.2f}{mark}")
+
+    print("  RESULT:", "FLAGGED" if result['flagged'] else "OK")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check observed drop rates against the configured banner rates")
+    parser.add_argument('--source', choices=('journal', 'simulate'), default='journal')
+    parser.add_argument('--journal', default=journal.JOURNAL_PATH, help="journal file (rotated files are included)")
+    parser.add_argument('--banner', choices=BANNER_KEYS + ['all'], default='all')
+    parser.add_argument('--pulls', type=int, default=10_000_000, help="pulls per banner when simulating")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--alpha', type=float, default=0.001)
+    parser.add_argument('--heroes', action='store_true', help="show every hero, not only flagged ones")
+    args = parser.parse_args(argv)
+
+    banners = BANNER_KEYS if args.banner == 'all' else [args.banner]
+    start = time.perf_counter()
+
+    if args.source == 'journal':
+        counts = count_journal(args.journal)
+        unknown = sorted(str(key) for key in counts if key not in BANNER_KEYS)
+        if unknown:
+            print(f"Skipping unknown banners in journal: {', '.join(unknown)}")
+        banners = [key for key in banners if key in counts]
+        if not banners:
+            print("No summon records found")
+            return 0
+    else:
+        if args.seed is None:
+            args.seed = rng_streams.new_seed()
+        print(f"seed: {args.seed}")
+        counts = {key: count_simulated(key, args.pulls, args.seed, args.workers) for key in banners}
+
+    flagged = False
+    for key in banners:
+        result = check(key, counts[key], args.alpha)
+        print_report(result, args.heroes)
+        flagged = flagged or bool(result['flagged'])
+
+    print(f"\n({time.perf_counter() - start:.2f}s)")
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
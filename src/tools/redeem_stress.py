@@ -0,0 +1,119 @@
+"""
+ทดสอบการใช้โค้ดพร้อมกันจากหลาย process (เหมือนตู้เกมหลายเครื่องใช้ data ร่วมกัน)
+
+ทุก process พยายาม claim โค้ดชุดเดียวกันทั้งหมด (สลับลำดับคนละแบบ) กับ slot เดียวกัน
+ผลที่ถูกต้อง: แต่ละโค้ดถูก claim สำเร็จ "ครั้งเดียว" พอดี รวมทุก process
+ใช้ไฟล์/ฐานข้อมูลชั่วคราว ไม่แตะข้อมูลเกมจริง
+
+วิธีใช้:
+    python -m src.tools.redeem_stress --backend json --workers 8 --codes 2000
+    python -m src.tools.redeem_stress --backend sqlite --workers 16 --codes 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from src.core.storage import JsonStorage, SqliteStorage
+
+
+SLOT = 1
+
+
+def open_storage(backend, directory):
+    if backend == 'json':
+        return JsonStorage(directory)
+    return SqliteStorage(os.path.join(directory, 'stress.db'))
+
+
+def hammer(backend, directory, codes, seed):
+    """
+    claim โค้ดทั้งหมดตามลำดับสุ่ม (ทำงานใน process ลูก)
+
+    Returns:
+        tuple: (โค้ดที่ claim สำเร็จ, จำนวนครั้งที่เรียก, เวลาที่ใช้)
+    """
+    storage = open_storage(backend, directory)
+    order = list(codes)
+    random.Random(seed).shuffle(order)
+
+    claimed = []
+    start = time.perf_counter()
+    for code in order:
+        if storage.claim_code(SLOT, code):
+            claimed.append(code)
+    elapsed = time.perf_counter() - start
+    storage.close()
+    return claimed, len(order), elapsed
+
+
+def run(backend, workers, count):
+    """
+    Returns:
+        dict: ผลการทดสอบ
+    """
+    codes = [f"STRESS{i:07d}" for i in range(count)]
+    with tempfile.TemporaryDirectory(prefix='redeem_stress_') as directory:
+        # สร้างไฟล์/schema ก่อน ไม่ให้ process ลูกแย่งกันสร้าง
+        open_storage(backend, directory).close()
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(hammer, [backend] * workers, [directory] * workers,
+                                    [codes] * workers, range(workers)))
+        wall = time.perf_counter() - start
+
+        stored = open_storage(backend, directory).load_used_codes(SLOT)
+
+    wins = Counter(code for claimed, _, _ in results for code in claimed)
+    attempts = sum(calls for _, calls, _ in results)
+    return {
+        'backend': backend,
+        'workers': workers,
+        'codes': count,
+        'attempts': attempts,
+        'wall': wall,
+        'duplicates': sorted(code for code, n in wins.items() if n > 1),
+        'missing': sorted(set(codes) - set(wins)),
+        'stored_mismatch': stored != set(codes),
+        'per_worker': [len(claimed) for claimed, _, _ in results],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stress concurrent code redemption and check exactly-once claims")
+    parser.add_argument('--backend', choices=('json', 'sqlite', 'all'), default='all')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--codes', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    backends = ('json', 'sqlite') if args.backend == 'all' else (args.backend,)
+    failed = False
+    for backend in backends:
+        result = run(backend, args.workers, args.codes)
+        ok = not result['duplicates'] and not result['missing'] and not result['stored_mismatch']
+        failed = failed or not ok
+
+        print(f"[{backend}] {result['workers']} workers x {result['codes']} codes: "
+              f"{result['attempts']} claims in {result['wall']:.2f}s "
+              f"({result['attempts'] / result['wall']:,.0f} claims/s)")
+        print(f"  wins per worker: {result['per_worker']}")
+        if result['duplicates']:
+            print(f"  FAIL: {len(result['duplicates'])} code(s) claimed more than once, e.g. {result['duplicates'][:5]}")
+        if result['missing']:
+            print(f"  FAIL: {len(result['missing'])} code(s) never claimed, e.g. {result['missing'][:5]}")
+        if result['stored_mismatch']:
+            print("  FAIL: stored used codes do not match the claimed set")
+        if ok:
+            print("  OK: every code claimed exactly once")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+เปรียบเทียบไฟล์ save แบบ JSON (snapshot เดิม) กับแบบ binary (save_format)
+
+วัดเวลา save (encode + เขียนไฟล์ + fsync), เวลา load (อ่าน + แปลงเป็น player_data พร้อมใช้
+รวมสร้าง HeroCollection) และขนาดไฟล์ ที่จำนวนฮีโร่ต่างๆ (ฮีโร่ซ้ำได้ เพื่อจำลอง collection ใหญ่)
+
+วิธีใช้:
+    python -m src.tools.save_bench
+    python -m src.tools.save_bench --sizes 21 1000 100000 --repeat 7
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.data.hero_collection import HeroCollection
+from src.data.hero_data import get_all_heroes
+from src.utils import save_format, wal
+from src.utils.player import create_player_data
+
+
+DEFAULT_SIZES = (21, 100, 1_000, 10_000, 100_000)
+
+
+def make_player(size, seed=0):
+    """ข้อมูลผู้เล่นที่มีฮีโร่ size ตัว"""
+    hero_ids = [hero.id for hero in get_all_heroes()]
+    rand = random.Random(seed)
+    data = create_player_data()
+    data['coins'] = 123456
+    data['rank'] = 42
+    data['owned_heroes'] = HeroCollection(
+        hero_ids[:size] if size <= len(hero_ids) else [rand.choice(hero_ids) for _ in range(size)])
+    return data
+
+
+def _best(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_json(data, filepath, repeat):
+    def save():
+        wal.write_snapshot(filepath, data, 0)
+
+    def load():
+        with open(filepath, 'r', encoding='utf-8') as f:
+            loaded = json.load(f)
+        loaded.pop(wal.SEQ_KEY, None)
+        save_format.upgrade(loaded, 0)
+
+    return _best(save, repeat), _best(load, repeat), os.path.getsize(filepath)
+
+
+def bench_binary(data, filepath, repeat):
+    def save():
+        tmp = f"{filepath}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(save_format.encode(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filepath)
+
+    def load():
+        with open(filepath, 'rb') as f:
+            save_format.decode(f.read())
+
+    return _best(save, repeat), _best(load, repeat), os.path.getsize(filepath)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare JSON and binary player save formats")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="hero counts to test")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per measurement (best is reported)")
+    args = parser.parse_args(argv)
+
+    print(f"{'heroes':>8} | {'json save':>10} {'json load':>10} {'json size':>11} | "
+          f"{'bin save':>10} {'bin load':>10} {'bin size':>11} | {'load x':>6} {'size x':>6}")
+    with tempfile.TemporaryDirectory(prefix='save_bench_') as directory:
+        for size in args.sizes:
+            data = make_player(size)
+            j_save, j_load, j_size = bench_json(data, os.path.join(directory, 'player.json'), args.repeat)
+            b_save, b_load, b_size = bench_binary(data, os.path.join(directory, 'player.sav'), args.repeat)
+            print(f"{size:>8} | {j_save * 1000:>8.2f}ms {j_load * 1000:>8.2f}ms {j_size:>10,}B | "
+                  f"{b_save * 1000:>8.2f}ms {b_load * 1000:>8.2f}ms {b_size:>10,}B | "
+                  f"{j_load / b_load:>5.1f}x {j_size / b_size:>5.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
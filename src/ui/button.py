@@ -1,5 +1,6 @@
 """Button UI component with click detection and hover effects"""
 import pygame
+from src.utils import assets
 
 
 class Button:
@@ -136,12 +137,12 @@ class Button:
                 if self.scale != 1.0:
                     scaled_img_width = int(self.rect.width * self.scale)
                     scaled_img_height = int(self.rect.height * self.scale)
-                    scaled_image = pygame.transform.scale(self.image, (scaled_img_width, scaled_img_height))
+                    scaled_image = assets.derive(self.image, ('scale', (scaled_img_width, scaled_img_height)))
                     img_x = scaled_rect.centerx - scaled_img_width // 2
                     img_y = scaled_rect.centery - scaled_img_height // 2
                     screen.blit(scaled_image, (img_x, img_y))
                 else:
-                    scaled_image = pygame.transform.scale(self.image, (self.rect.width, self.rect.height))
+                    scaled_image = assets.derive(self.image, ('scale', self.rect.size))
                     screen.blit(scaled_image, self.rect.topleft)
             else:
                 # Has text - image at top, text at bottom
@@ -151,12 +152,12 @@ class Button:
                 if self.scale != 1.0:
                     scaled_img_width = int(img_width * self.scale)
                     scaled_img_height = int(img_height * self.scale)
-                    scaled_image = pygame.transform.scale(self.image, (scaled_img_width, scaled_img_height))
+                    scaled_image = assets.derive(self.image, ('scale', (scaled_img_width, scaled_img_height)))
                     img_x = scaled_rect.centerx - scaled_img_width // 2
                     img_y = scaled_rect.top + 5
                     screen.blit(scaled_image, (img_x, img_y))
                 else:
-                    scaled_image = pygame.transform.scale(self.image, (img_width, img_height))
+                    scaled_image = assets.derive(self.image, ('scale', (img_width, img_height)))
                     img_x = self.rect.centerx - img_width // 2
                     img_y = self.rect.top + 5
                     screen.blit(scaled_image, (img_x, img_y))
@@ -185,10 +186,10 @@ class Button:
                 if self.text_surface:
                     # Single line text
                     if self.scale != 1.0:
-                        scaled_text = pygame.transform.scale(
+                        scaled_text = assets.derive(
                             self.text_surface,
-                            (int(self.text_surface.get_width() * self.scale),
-                             int(self.text_surface.get_height() * self.scale))
+                            ('scale', (int(self.text_surface.get_width() * self.scale),
+                                       int(self.text_surface.get_height() * self.scale)))
                         )
                         text_rect = scaled_text.get_rect(center=scaled_rect.center)
                         screen.blit(scaled_text, text_rect)
@@ -205,10 +206,10 @@ class Button:
                     
                     for i, surf in enumerate(self.text_surfaces):
                         if self.scale != 1.0:
-                            scaled_text = pygame.transform.scale(
+                            scaled_text = assets.derive(
                                 surf,
-                                (int(surf.get_width() * self.scale),
-                                 int(surf.get_height() * self.scale))
+                                ('scale', (int(surf.get_width() * self.scale),
+                                           int(surf.get_height() * self.scale)))
                             )
                             text_rect = scaled_text.get_rect(center=(scaled_rect.centerx, start_y + i * (surf.get_height() + line_spacing)))
                             screen.blit(scaled_text, text_rect)
@@ -1,15 +1,15 @@
 import pygame
+from src.utils import assets
 
 def _color_effect(src: pygame.Surface, mul=(230, 230, 230, 255)) -> pygame.Surface:
-    img = src.copy()
-    img.fill(mul, special_flags=pygame.BLEND_RGBA_MULT)
-    return img
+    # รูปเดิม + สีเดิม ได้ Surface เดิมจาก cache (ไม่ copy ใหม่ทุกครั้งที่สร้างปุ่ม)
+    return assets.derive(src, ('multiply', tuple(mul)))
 
 class _ImageButton:
     def __init__(self, base_img: pygame.Surface, center, on_click=None, scale=1.2, use_mask=True, text="", font=None):
         if scale != 1.0:
             w, h = base_img.get_size()
-            base_img = pygame.transform.smoothscale(base_img, (int(w * scale), int(h * scale)))
+            base_img = assets.derive(base_img, ('smoothscale', (int(w * scale), int(h * scale))))
 
         self.normal = base_img
         self.hover = _color_effect(base_img, (230, 240, 245, 255))
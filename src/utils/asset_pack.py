@@ -0,0 +1,207 @@
+"""
+ฟังก์ชันสำหรับ asset pack - รูปที่ถอดรหัสและปรับขนาดแล้ว (pixel ดิบ) รวมไว้ในไฟล์เดียว
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา (pack เป็น dict)
+
+สร้างไฟล์ด้วย: python -m src.tools.build_asset_pack
+ตอนเล่นเปิดไฟล์ด้วย mmap แล้วสร้าง Surface ด้วย pygame.image.frombuffer ชี้ไปที่ข้อมูลใน
+ไฟล์โดยตรง (ไม่ถอดรหัส PNG ไม่ copy - ระบบปฏิบัติการอ่านเฉพาะหน้าที่ใช้จริงจากดิสก์)
+
+รูปแบบไฟล์ (little-endian):
+    header  '<4sHHQ'  magic b'HGAP', version, flags (0), ความยาว index
+    index   JSON {"entries": [{"path", "scale", "size", "offset", "length", "source"}]}
+            source = {"size", "mtime_ns", "hash"} ของไฟล์ PNG ต้นฉบับ
+    data    pixel BGRA (รูปแบบเดียวกับ convert_alpha() บนจอ 32 bit) เริ่มที่ offset หาร ALIGN ลงตัว
+
+ถ้าไฟล์ต้นฉบับเปลี่ยน (ขนาด/mtime ไม่ตรง และ hash ไม่ตรง) จะไม่ใช้รูปนั้นจาก pack
+-> load_image กลับไปโหลด PNG ตามเดิม
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+import pygame
+
+
+MAGIC = b'HGAP'
+VERSION = 1
+PIXEL_FORMAT = 'BGRA'
+ALIGN = 64
+
+_HEADER = struct.Struct('<4sHHQ')
+
+
+def _key(path, scale):
+    if isinstance(scale, str):
+        return (path, scale)  # ชื่อ variant (ไม่มีใน pack)
+    return (path, tuple(scale) if scale else None)
+
+
+def file_hash(path):
+    """blake2b ของไฟล์ (hex)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_stamp(path):
+    """
+    ข้อมูลของไฟล์ต้นฉบับที่เก็บไว้ใน index
+
+    Returns:
+        dict: {'size', 'mtime_ns', 'hash'}
+    """
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'hash': file_hash(path)}
+
+
+def build(entries, pack_path, on_progress=None):
+    """
+    สร้างไฟล์ pack
+
+    Args:
+        entries: list ของ (path, scale) - scale = None คือขนาดเดิม
+        pack_path: ไฟล์ปลายทาง (เขียนไฟล์ชั่วคราวแล้ว replace)
+        on_progress: ฟังก์ชัน (index, total, path) เรียกทุกรูป (ถ้ามี)
+
+    Returns:
+        dict: {'entries', 'bytes', 'skipped'} - skipped คือ path ที่โหลดไม่ได้
+    """
+    index = []
+    skipped = []
+    stamps = {}
+    seen = set()
+    written = {}   # (path, ขนาด) -> (offset, length)
+    tmp = f"{pack_path}.tmp"
+    os.makedirs(os.path.dirname(pack_path) or '.', exist_ok=True)
+
+    with open(tmp, 'wb') as f:
+        # จองที่ header ไว้ก่อน (index อยู่ท้ายไฟล์ รู้ขนาดหลังเขียนข้อมูลครบ)
+        f.write(b'\0' * _HEADER.size)
+        offset = _HEADER.size
+        for i, (path, scale) in enumerate(entries):
+            key = _key(path, scale)
+            if key in seen:
+                continue
+            seen.add(key)
+            if on_progress:
+                on_progress(i, len(entries), path)
+            try:
+                if path not in stamps:
+                    stamps[path] = source_stamp(path)
+                surface = pygame.image.load(path)
+                if key[1]:
+                    # ใช้ scale แบบเดียวกับ load_image ให้ได้ผลเหมือนกันทุก pixel
+                    surface = pygame.transform.scale(surface, key[1])
+                pixels = pygame.image.tobytes(surface, PIXEL_FORMAT)
+            except (OSError, pygame.error) as e:
+                print(f"Skip {path}: {e}")
+                skipped.append(path)
+                continue
+
+            # ขนาดที่ scale แล้วเท่าเดิม (เช่นพื้นหลัง 1280x720) ใช้ข้อมูลชุดเดียวกัน
+            placed = written.get((path, surface.get_size()))
+            if placed is None:
+                padding = -offset % ALIGN
+                f.write(b'\0' * padding)
+                offset += padding
+                f.write(pixels)
+                placed = written[(path, surface.get_size())] = (offset, len(pixels))
+                offset += len(pixels)
+            index.append({
+                'path': path,
+                'scale': list(key[1]) if key[1] else None,
+                'size': list(surface.get_size()),
+                'offset': placed[0],
+                'length': placed[1],
+                'source': stamps[path],
+            })
+
+        index_bytes = json.dumps({'entries': index}, separators=(',', ':')).encode('utf-8')
+        f.write(index_bytes)
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(index_bytes)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, pack_path)
+    return {'entries': len(index), 'bytes': offset + len(index_bytes), 'skipped': skipped}
+
+
+def open_pack(pack_path):
+    """
+    เปิดไฟล์ pack (mmap)
+
+    Returns:
+        dict หรือ None ถ้าไม่มีไฟล์หรือไฟล์ใช้ไม่ได้
+    """
+    if not os.path.exists(pack_path):
+        return None
+    try:
+        with open(pack_path, 'rb') as f:
+            # ACCESS_COPY: Surface เขียนทับได้โดยไม่กระทบไฟล์ (copy เฉพาะหน้าที่ถูกเขียน)
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        magic, version, _flags, index_length = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an asset pack or unsupported version")
+        index = json.loads(data[len(data) - index_length:])
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Asset pack ignored ({pack_path}): {e}")
+        return None
+
+    entries = {}
+    for entry in index['entries']:
+        entries[_key(entry['path'], entry['scale'])] = entry
+    return {
+        'path': pack_path,
+        'data': data,
+        'entries': entries,
+        'sources': {},   # path -> True/False (ต้นฉบับยังตรงกับ pack หรือไม่) ตรวจครั้งแรกที่ใช้
+    }
+
+
+def _source_matches(pack, path, stamp):
+    valid = pack['sources'].get(path)
+    if valid is not None:
+        return valid
+    try:
+        st = os.stat(path)
+        if st.st_size != stamp['size']:
+            valid = False
+        elif st.st_mtime_ns == stamp['mtime_ns']:
+            valid = True
+        else:
+            # mtime เปลี่ยน (เช่น checkout ใหม่) แต่เนื้อไฟล์อาจเหมือนเดิม
+            valid = file_hash(path) == stamp['hash']
+    except OSError:
+        valid = False
+    if not valid:
+        print(f"Asset pack is stale for {path}, loading PNG")
+    pack['sources'][path] = valid
+    return valid
+
+
+def contains(pack, path, scale=None):
+    """มีรูปนี้ใน pack และต้นฉบับยังไม่เปลี่ยนหรือไม่"""
+    if pack is None:
+        return False
+    entry = pack['entries'].get(_key(path, scale))
+    return entry is not None and _source_matches(pack, path, entry['source'])
+
+
+def get_surface(pack, path, scale=None):
+    """
+    Surface จาก pack (ใช้ข้อมูลใน mmap โดยตรง ไม่ต้อง convert)
+
+    Returns:
+        pygame.Surface หรือ None ถ้าไม่มีใน pack / ต้นฉบับเปลี่ยน
+    """
+    if not contains(pack, path, scale):
+        return None
+    entry = pack['entries'][_key(path, scale)]
+    start = entry['offset']
+    view = memoryview(pack['data'])[start:start + entry['length']]
+    return pygame.image.frombuffer(view, tuple(entry['size']), PIXEL_FORMAT)
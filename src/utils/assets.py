@@ -1,16 +1,343 @@
 """
 ฟังก์ชันสำหรับโหลดและจัดการ assets (รูป, เสียง, ฟอนต์)
 ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+cache รูปเป็น LRU จำกัดขนาดรวม (IMAGE_CACHE_BYTES นับ width * height * bytesize ต่อรูป)
+เกินแล้วทิ้งรูปที่ไม่ได้ใช้นานสุด ยกเว้นรูปที่ pin ไว้:
+    - รูปที่โหลดระหว่างหน้าจอหนึ่งทำงาน (StateManager เปิด pin scope ตามชื่อหน้าจอ) ถูก pin
+      จนกว่าจะออกจากหน้าจอนั้น
+    - pin_image/unpin_image สำหรับ pin เอง
+
+preload: ถอดรหัส PNG ล่วงหน้าใน thread แยก (PRELOAD_WORKERS ตัว) ตามลำดับความสำคัญ
+    PRIORITY_NOW (หน้าจอปัจจุบัน) -> PRIORITY_NEXT (หน้าจอถัดไป) -> PRIORITY_IDLE (ว่างค่อยทำ)
+    thread ทำแค่ pygame.image.load + scale ส่วน convert_alpha (ต้องใช้ display) ทำใน
+    process_preloaded() ที่ Game.run เรียกทุก frame บน main thread
+    load_image ของรูปที่กำลังถอดรหัสอยู่จะรอผลนั้นแทนการถอดรหัสซ้ำ
+
+variant: load_image(path, 'ชื่อ') หรือขนาดที่ตรงกับ IMAGE_VARIANTS ได้รูปย่อที่สร้างไว้บนดิสก์
+    (smoothscale ครั้งเดียว) แทนการถอดรหัสรูปเต็มแล้วย่อ - ดู src/utils/variants.py
+
+derive: รูปที่แปลงจากรูปอื่น (ย่อ/ขยาย, ขาวดำ, คูณสี) cache ตาม (ต้นฉบับ, ขั้นตอน 1, 2, ...)
+    แบบ LRU จำกัดขนาด DERIVED_CACHE_BYTES - วาดทุก frame ได้โดยไม่ต้องแปลงรูปซ้ำ
+
+asset pack (ASSET_PACK_PATH ถ้ามีไฟล์): รูปที่อยู่ใน pack สร้าง Surface จาก mmap ทันที
+ไม่ต้องถอดรหัส/convert และไม่ต้อง preload - ดู src/utils/asset_pack.py
 """
 
 import pygame
 import os
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+from src.core.config import IMAGE_CACHE_BYTES, DERIVED_CACHE_BYTES, PRELOAD_WORKERS, ASSET_PACK_PATH
+from src.utils import asset_pack, variants
 
 # Cache สำหรับเก็บ assets ที่โหลดแล้ว
-_image_cache = {}
+_image_cache = OrderedDict()  # (path, scale) -> Surface เรียงจากใช้นานสุด -> ล่าสุด
+_image_sizes = {}             # (path, scale) -> bytes
 _font_cache = {}
 _sound_cache = {}
 
+# pin: key -> จำนวนครั้งที่ถูก pin / scope (ชื่อหน้าจอ) -> key ที่ pin ไว้
+_pins = {}
+_pin_scopes = {}
+_current_scope = None
+
+_image_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0, 'packed': 0, 'variants': 0}
+
+# รูปที่แปลงแล้ว: (ต้นฉบับ, ขั้นตอน...) -> Surface เรียงจากใช้นานสุด -> ล่าสุด
+_derived_cache = OrderedDict()
+_derived_sizes = {}
+_derived_by_source = {}       # id ของ Surface ต้นฉบับ -> set ของ key (ลบทิ้งเมื่อต้นฉบับถูกทิ้ง)
+_derived_stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'bytes': 0}
+
+# asset pack เปิดครั้งแรกที่ใช้ (None = ไม่มีไฟล์)
+_pack = None
+_pack_opened = False
+
+# ลำดับความสำคัญของ preload (เลขน้อยทำก่อน)
+PRIORITY_NOW = 0
+PRIORITY_NEXT = 1
+PRIORITY_IDLE = 2
+
+# งาน preload: key -> {'path', 'scale', 'priority', 'state', 'surface', 'done'}
+# state: 'queued' -> 'running' -> 'ready' (ถอดรหัสเสร็จ รอ convert บน main thread)
+_preload_jobs = {}
+_preload_heap = []            # (priority, ลำดับ, key) - รายการเก่าที่ priority ไม่ตรงกับงานจะถูกข้าม
+_preload_ready = deque()      # key ที่ถอดรหัสเสร็จแล้ว
+_preload_groups = {}          # group -> set ของ key
+_preload_lock = threading.Lock()
+_preload_wakeup = threading.Condition(_preload_lock)
+_preload_order = itertools.count()
+_preload_threads = []
+
+
+def surface_bytes(surface):
+    """หน่วยความจำของ surface (width * height * bytes ต่อ pixel)"""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def _image_key(path, scale):
+    if isinstance(scale, str):
+        return (path, scale)  # ชื่อ variant
+    return (path, tuple(scale) if scale else None)
+
+
+def _cache_image(key, image, pin=True):
+    """เก็บรูปลง cache แล้วทิ้งรูปเก่าจนไม่เกินงบ (pin=False: ไม่ pin กับหน้าจอปัจจุบัน)"""
+    size = surface_bytes(image)
+    _image_cache[key] = image
+    _image_sizes[key] = size
+    _image_stats['bytes'] += size
+    if pin and _current_scope is not None:
+        _pin_to_scope(_current_scope, key)
+    _evict()
+
+
+def _evict():
+    if _image_stats['bytes'] <= IMAGE_CACHE_BYTES:
+        return
+    for key in list(_image_cache):
+        if _image_stats['bytes'] <= IMAGE_CACHE_BYTES:
+            break
+        if key in _pins:
+            continue
+        del _image_cache[key]
+        _image_stats['bytes'] -= _image_sizes.pop(key)
+        _image_stats['evictions'] += 1
+
+
+def pin_image(path, scale=None):
+    """ห้ามทิ้งรูปนี้ออกจาก cache (จนกว่าจะ unpin_image จำนวนครั้งเท่ากัน)"""
+    key = _image_key(path, scale)
+    _pins[key] = _pins.get(key, 0) + 1
+
+
+def unpin_image(path, scale=None):
+    _unpin_key(_image_key(path, scale))
+
+
+def _unpin_key(key):
+    count = _pins.get(key, 0) - 1
+    if count > 0:
+        _pins[key] = count
+    else:
+        _pins.pop(key, None)
+
+
+def _pin_to_scope(scope, key):
+    keys = _pin_scopes.setdefault(scope, set())
+    if key not in keys:
+        keys.add(key)
+        _pins[key] = _pins.get(key, 0) + 1
+
+
+def begin_pin_scope(scope):
+    """
+    เริ่ม scope (เช่นชื่อหน้าจอ) - รูปที่โหลดหลังจากนี้จะถูก pin ไว้กับ scope นี้
+
+    Args:
+        scope: ชื่อ scope
+    """
+    global _current_scope
+    _current_scope = scope
+
+
+def end_pin_scope(scope):
+    """ปล่อยรูปทั้งหมดที่ pin ไว้กับ scope (ทิ้งได้ถ้า cache เกินงบ)"""
+    global _current_scope
+    for key in _pin_scopes.pop(scope, ()):
+        _unpin_key(key)
+    if _current_scope == scope:
+        _current_scope = None
+    _evict()
+
+
+def image_cache_stats():
+    """
+    สถิติของ cache รูป
+
+    Returns:
+        dict: {'hits', 'misses', 'evictions', 'bytes', 'packed', 'variants', 'budget', 'entries', 'pinned'}
+    """
+    stats = dict(_image_stats)
+    stats.update({
+        'budget': IMAGE_CACHE_BYTES,
+        'entries': len(_image_cache),
+        'pinned': len(_pins),
+    })
+    return stats
+
+
+def _get_pack():
+    global _pack, _pack_opened
+    if not _pack_opened:
+        _pack_opened = True
+        _pack = asset_pack.open_pack(ASSET_PACK_PATH)
+    return _pack
+
+
+# ---------- preload ----------
+
+def _start_preload_workers():
+    while len(_preload_threads) < max(1, PRELOAD_WORKERS):
+        thread = threading.Thread(target=_preload_worker, name=f'preload-{len(_preload_threads)}', daemon=True)
+        _preload_threads.append(thread)
+        thread.start()
+
+
+def _preload_worker():
+    while True:
+        with _preload_wakeup:
+            while True:
+                while _preload_heap:
+                    priority, _order, key = heapq.heappop(_preload_heap)
+                    job = _preload_jobs.get(key)
+                    if job is not None and job['state'] == 'queued' and job['priority'] == priority:
+                        job['state'] = 'running'
+                        break
+                else:
+                    _preload_wakeup.wait()
+                    continue
+                break
+
+        # ถอดรหัสนอก lock (ส่วนที่ช้า)
+        try:
+            if job['variant']:
+                surface = variants.load_variant(job['path'], job['variant'])
+            else:
+                surface = pygame.image.load(job['path'])
+                if job['scale']:
+                    surface = pygame.transform.scale(surface, job['scale'])
+        except Exception as e:
+            print(f"Error preloading image {job['path']}: {e}")
+            surface = None
+
+        with _preload_lock:
+            job['surface'] = surface
+            job['state'] = 'ready'
+            _preload_ready.append(key)
+        job['done'].set()
+
+
+def preload(items, priority=PRIORITY_IDLE, group=None):
+    """
+    สั่งถอดรหัสรูปล่วงหน้าใน thread แยก (รูปที่อยู่ใน cache แล้วหรือสั่งไว้แล้วไม่ทำซ้ำ
+    แต่ถ้าสั่งซ้ำด้วย priority ที่สูงกว่าจะถูกเลื่อนขึ้นมาทำก่อน)
+
+    Args:
+        items: iterable ของ path หรือ (path, scale) - scale เป็นชื่อ variant ได้เหมือน load_image
+        priority: PRIORITY_NOW / PRIORITY_NEXT / PRIORITY_IDLE
+        group: ชื่อกลุ่ม สำหรับดูความคืบหน้าด้วย preload_progress(group)
+    """
+    # ตรวจ pack / ไฟล์ก่อนล็อก (contains อาจ stat + hash ไฟล์ต้นฉบับ - ไม่ให้ worker ต้องรอ)
+    keys = []
+    wanted = []
+    for item in items:
+        path, scale = (item, None) if isinstance(item, str) else item
+        key = _image_key(path, scale)
+        keys.append(key)
+        if key in _image_cache:
+            continue
+        variant = variants.resolve(path, scale)
+        if variant is None and asset_pack.contains(_get_pack(), path, scale):
+            continue
+        if not os.path.exists(path):
+            continue  # load_image จะแจ้งเตือนเองเมื่อใช้จริง
+        wanted.append((key, path, variant))
+
+    with _preload_lock:
+        if group is not None:
+            _preload_groups.setdefault(group, set()).update(keys)
+        for key, path, variant in wanted:
+            job = _preload_jobs.get(key)
+            if job is None:
+                job = {'path': path, 'scale': key[1], 'variant': variant, 'priority': priority,
+                       'state': 'queued', 'surface': None, 'done': threading.Event()}
+                _preload_jobs[key] = job
+            elif job['state'] != 'queued' or job['priority'] <= priority:
+                continue
+            job['priority'] = priority
+            heapq.heappush(_preload_heap, (priority, next(_preload_order), key))
+        _start_preload_workers()
+        _preload_wakeup.notify_all()
+
+
+def _finish_preload(key, pin):
+    """เอารูปที่ถอดรหัสเสร็จแล้วเข้า cache (main thread) - คืน None ถ้าถอดรหัสไม่สำเร็จ"""
+    job = _preload_jobs.pop(key, None)
+    if job is None or job['surface'] is None:
+        return None
+    image = job['surface']
+    try:
+        image = image.convert_alpha()
+    except pygame.error:
+        pass
+    _cache_image(key, image, pin=pin)
+    return image
+
+
+def process_preloaded(budget=0.004):
+    """
+    convert รูปที่ thread ถอดรหัสเสร็จแล้วเข้า cache (เรียกบน main thread ทุก frame)
+
+    Args:
+        budget: เวลาสูงสุด (วินาที) ที่ใช้ต่อครั้ง ที่เหลือทำ frame ถัดไป
+
+    Returns:
+        int: จำนวนรูปที่เข้า cache
+    """
+    deadline = time.perf_counter() + budget
+    count = 0
+    while _preload_ready:
+        with _preload_lock:
+            key = _preload_ready.popleft()
+            job = _preload_jobs.get(key)
+            if job is None or job['state'] != 'ready':
+                continue
+        if _finish_preload(key, pin=False) is not None:
+            count += 1
+        if time.perf_counter() >= deadline:
+            break
+    return count
+
+
+def preload_progress(group):
+    """
+    ความคืบหน้าของ preload ในกลุ่ม
+
+    Returns:
+        tuple: (จำนวนที่เสร็จแล้ว, จำนวนทั้งหมด)
+    """
+    with _preload_lock:
+        keys = _preload_groups.get(group, ())
+        pending = sum(1 for key in keys if key in _preload_jobs)
+        return len(keys) - pending, len(keys)
+
+
+def _take_preloaded(key):
+    """
+    รูปที่ preload ไว้สำหรับ load_image: รอถ้ากำลังถอดรหัส, ยกเลิกถ้ายังไม่เริ่ม
+
+    Returns:
+        pygame.Surface หรือ None (ให้ load_image โหลดเอง)
+    """
+    with _preload_lock:
+        job = _preload_jobs.get(key)
+        if job is None:
+            return None
+        if job['state'] == 'queued':
+            # ยังไม่มี thread หยิบไป - โหลดเองเลยเร็วกว่ารอคิว
+            del _preload_jobs[key]
+            return None
+    job['done'].wait()
+    return _finish_preload(key, pin=True)
+
 
 def load_image(path, scale=None):
     """
@@ -18,17 +345,47 @@ def load_image(path, scale=None):
     
     Args:
         path: path ของรูป
-        scale: (width, height) ถ้าต้องการปรับขนาด
+        scale: (width, height) ถ้าต้องการปรับขนาด หรือชื่อ variant ใน IMAGE_VARIANTS (เช่น 'book_list')
     
     Returns:
         pygame.Surface
     """
     # สร้าง cache key
-    cache_key = f"{path}_{scale}" if scale else path
+    cache_key = _image_key(path, scale)
     
-    # ถ้ามีใน cache แล้ว ใช้เลย
-    if cache_key in _image_cache:
-        return _image_cache[cache_key]
+    # ถ้ามีใน cache แล้ว ใช้เลย (ย้ายไปท้ายสุด = ใช้ล่าสุด)
+    image = _image_cache.get(cache_key)
+    if image is not None:
+        _image_cache.move_to_end(cache_key)
+        _image_stats['hits'] += 1
+        if _current_scope is not None:
+            _pin_to_scope(_current_scope, cache_key)
+        return image
+    _image_stats['misses'] += 1
+
+    # ถ้าสั่ง preload ไว้แล้ว ใช้ผลจาก thread
+    image = _take_preloaded(cache_key)
+    if image is not None:
+        return image
+
+    # รูปย่อที่ประกาศไว้ใน IMAGE_VARIANTS โหลดจาก cache บนดิสก์ (อยู่ในรูปแบบที่ convert แล้ว)
+    variant = variants.resolve(path, scale)
+    if variant is not None:
+        image = variants.load_variant(path, variant)
+        if image is not None:
+            _image_stats['variants'] += 1
+            _cache_image(cache_key, image)
+            return image
+    elif isinstance(scale, str):
+        print(f"Warning: Unknown image variant '{scale}' for {path}")
+        scale = None
+
+    # ถ้ามีใน asset pack ใช้ pixel จาก pack เลย (อยู่ในรูปแบบที่ convert แล้ว)
+    image = asset_pack.get_surface(_get_pack(), path, scale)
+    if image is not None:
+        _image_stats['packed'] += 1
+        _cache_image(cache_key, image)
+        return image
     
     # ตรวจสอบว่าไฟล์มีจริง
     if not os.path.exists(path):
@@ -53,7 +410,7 @@ def load_image(path, scale=None):
             pass
         
         # เก็บใน cache
-        _image_cache[cache_key] = image
+        _cache_image(cache_key, image)
         
         return image
     except Exception as e:
@@ -64,6 +421,111 @@ def load_image(path, scale=None):
         return surface
 
 
+# ---------- derived ----------
+
+def _apply_op(surface, op):
+    name, *args = op
+    if name == 'scale':
+        return pygame.transform.scale(surface, args[0])
+    if name == 'smoothscale':
+        if surface.get_bitsize() < 24:
+            surface = surface.convert(32, pygame.SRCALPHA)  # smoothscale รับเฉพาะรูป 24/32 bit
+        return pygame.transform.smoothscale(surface, args[0])
+    if name == 'grayscale':
+        return pygame.transform.grayscale(surface)
+    if name == 'multiply':
+        image = surface.copy()
+        image.fill(args[0], special_flags=pygame.BLEND_RGBA_MULT)
+        return image
+    raise ValueError(f"Unknown image operation: {name}")
+
+
+def _forget_source(source_id):
+    """ต้นฉบับ (Surface) ถูกทิ้งแล้ว - ลบรูปที่แปลงจากมันทั้งหมด"""
+    for key in _derived_by_source.pop(source_id, ()):
+        if key in _derived_cache:
+            del _derived_cache[key]
+            _derived_stats['bytes'] -= _derived_sizes.pop(key)
+
+
+def _cache_derived(key, image, source):
+    size = surface_bytes(image)
+    _derived_cache[key] = image
+    _derived_sizes[key] = size
+    _derived_stats['bytes'] += size
+    if isinstance(source, pygame.Surface):
+        keys = _derived_by_source.get(key[1])
+        if keys is None:
+            keys = _derived_by_source[key[1]] = set()
+            weakref.finalize(source, _forget_source, key[1])
+        keys.add(key)
+
+    while _derived_stats['bytes'] > DERIVED_CACHE_BYTES and len(_derived_cache) > 1:
+        old_key, _old = _derived_cache.popitem(last=False)
+        _derived_stats['bytes'] -= _derived_sizes.pop(old_key)
+        _derived_stats['evictions'] += 1
+        if old_key[0] == 'surface':
+            _derived_by_source.get(old_key[1], set()).discard(old_key)
+
+
+def _derive(source, source_key, ops):
+    if not ops:
+        if isinstance(source, pygame.Surface):
+            return source
+        return load_image(*source)
+
+    key = source_key + ops
+    image = _derived_cache.get(key)
+    if image is not None:
+        _derived_cache.move_to_end(key)
+        _derived_stats['hits'] += 1
+        return image
+    _derived_stats['misses'] += 1
+
+    # ขั้นตอนก่อนหน้าก็ cache ไว้ (chain ที่ขึ้นต้นเหมือนกันใช้ผลร่วมกัน)
+    base = _derive(source, source_key, ops[:-1])
+    image = _apply_op(base, ops[-1])
+    _cache_derived(key, image, source)
+    return image
+
+
+def derive(source, *ops):
+    """
+    รูปที่แปลงจากรูปต้นฉบับ (cache ไว้ - เรียกซ้ำด้วยค่าเดิมได้ Surface เดิม)
+    ห้ามวาดทับ Surface ที่ได้ (ใช้ร่วมกันทุกที่)
+
+    Args:
+        source: path ของรูป, (path, scale) แบบเดียวกับ load_image หรือ pygame.Surface
+        ops: ขั้นตอนแปลงรูปตามลำดับ แต่ละขั้นเป็น tuple
+            ('scale', (w, h)), ('smoothscale', (w, h)), ('grayscale',), ('multiply', (r, g, b, a))
+
+    Returns:
+        pygame.Surface
+
+    ตัวอย่าง:
+        derive((hero.portrait_path, 'book_list'), ('grayscale',))
+        derive(button_img, ('scale', (134, 48)), ('multiply', (230, 240, 245, 255)))
+    """
+    ops = tuple(tuple(tuple(arg) if isinstance(arg, list) else arg for arg in op) for op in ops)
+    if isinstance(source, pygame.Surface):
+        return _derive(source, ('surface', id(source)), ops)
+
+    path, scale = (source, None) if isinstance(source, str) else source
+    return _derive((path, scale), ('image',) + _image_key(path, scale), ops)
+
+
+def derived_cache_stats():
+    """
+    สถิติของ cache รูปที่แปลงแล้ว
+
+    Returns:
+        dict: {'hits', 'misses', 'evictions', 'bytes', 'budget', 'entries'}
+    """
+    stats = dict(_derived_stats)
+    stats.update({'budget': DERIVED_CACHE_BYTES, 'entries': len(_derived_cache)})
+    return stats
+
+
 def load_font(path, size):
     """
     โหลดฟอนต์
@@ -122,6 +584,12 @@ def load_sound(path):
 def clear_cache():
     """ล้าง cache ทั้งหมด"""
     _image_cache.clear()
+    _image_sizes.clear()
+    _image_stats['bytes'] = 0
+    _derived_cache.clear()
+    _derived_sizes.clear()
+    _derived_by_source.clear()
+    _derived_stats['bytes'] = 0
     _font_cache.clear()
     _sound_cache.clear()
 
@@ -0,0 +1,106 @@
+"""
+ฟังก์ชันสำหรับ Bloom filter - ตอบได้ว่า "ไม่มีแน่นอน" โดยไม่ต้องค้นข้อมูลจริง
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา (filter เป็น dict)
+
+might_contain() = False -> ไม่มีแน่นอน
+might_contain() = True  -> อาจมี (ผิดได้ประมาณ error_rate) ต้องตรวจกับข้อมูลจริงต่อ
+
+ตำแหน่ง bit ใช้ double hashing จาก blake2b 128 bit: h1 + i * h2 (mod m)
+"""
+
+import hashlib
+import math
+import struct
+
+
+_HEADER = struct.Struct('<QQQQ')  # m, k, count, capacity
+
+
+def create(capacity, error_rate=0.01):
+    """
+    สร้าง filter ว่าง
+
+    Args:
+        capacity: จำนวนสมาชิกที่คาดว่าจะใส่ (ใส่เกินได้ แต่ error จะสูงขึ้น)
+        error_rate: โอกาสตอบ "อาจมี" ผิด ที่ต้องการเมื่อใส่ครบ capacity
+
+    Returns:
+        dict: {'bits', 'm', 'k', 'count', 'capacity'}
+    """
+    capacity = max(1, int(capacity))
+    m = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+    k = max(1, round(m / capacity * math.log(2)))
+    return {
+        'bits': bytearray((m + 7) // 8),
+        'm': m,
+        'k': k,
+        'count': 0,
+        'capacity': capacity,
+    }
+
+
+def _positions(bloom, item):
+    digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'little')
+    h2 = int.from_bytes(digest[8:], 'little') | 1
+    m = bloom['m']
+    return [(h1 + i * h2) % m for i in range(bloom['k'])]
+
+
+def add(bloom, item):
+    """ใส่ item (str) ลงใน filter"""
+    bits = bloom['bits']
+    for pos in _positions(bloom, item):
+        bits[pos >> 3] |= 1 << (pos & 7)
+    bloom['count'] += 1
+
+
+def add_all(bloom, items):
+    """ใส่ item หลายตัว"""
+    for item in items:
+        add(bloom, item)
+
+
+def might_contain(bloom, item):
+    """
+    Returns:
+        bool: False = ไม่มีแน่นอน, True = อาจมี
+    """
+    bits = bloom['bits']
+    for pos in _positions(bloom, item):
+        if not bits[pos >> 3] & (1 << (pos & 7)):
+            return False
+    return True
+
+
+def is_saturated(bloom):
+    """ใส่เกิน capacity แล้วหรือยัง (ควรสร้างใหม่ให้ใหญ่ขึ้น)"""
+    return bloom['count'] > bloom['capacity']
+
+
+def build(items, count, error_rate=0.01, headroom=2):
+    """
+    สร้าง filter จาก items ทั้งหมด
+
+    Args:
+        items: สมาชิกทั้งหมด (iterable)
+        count: จำนวนสมาชิก (ใช้กำหนดขนาด)
+        headroom: เผื่อขนาดไว้กี่เท่า (ใส่เพิ่มทีหลังได้โดยไม่ต้องสร้างใหม่ทันที)
+    """
+    bloom = create(max(count, 1) * headroom, error_rate)
+    add_all(bloom, items)
+    return bloom
+
+
+def to_bytes(bloom):
+    """แปลงเป็น bytes (เก็บลงไฟล์/ฐานข้อมูล)"""
+    return _HEADER.pack(bloom['m'], bloom['k'], bloom['count'], bloom['capacity']) + bytes(bloom['bits'])
+
+
+def from_bytes(data):
+    """สร้าง filter จาก to_bytes()"""
+    m, k, count, capacity = _HEADER.unpack_from(data, 0)
+    bits = bytearray(data[_HEADER.size:])
+    if len(bits) != (m + 7) // 8:
+        raise ValueError("Bloom filter data is truncated")
+    return {'bits': bits, 'm': m, 'k': k, 'count': count, 'capacity': capacity}
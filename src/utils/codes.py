@@ -1,11 +1,21 @@
 """
 ฟังก์ชันสำหรับจัดการโค้ดแลกรางวัล
 ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+โค้ดทั้งหมดอยู่ใน CodeStore (SQLite + Bloom filter + LRU) - codes.json ถูกนำเข้าใหม่อัตโนมัติเมื่อไฟล์เปลี่ยน
+โค้ดที่ผู้เล่นใช้แล้วมี Bloom filter แยกต่อ slot - โค้ดที่ไม่เคยใช้แน่นอนไม่ต้องตรวจกับ storage ก่อน claim
 """
 
 import json
-import os
 from pathlib import Path
+from src.core.code_store import get_code_store
+from src.core.config import CODES_JSON_PATH, CODE_BLOOM_ERROR_RATE
+from src.core.storage import get_storage
+from src.utils import bloom, journal, wal
+
+
+# Bloom filter ของโค้ดที่ใช้แล้ว {slot: filter}
+_used_filters = {}
 
 
 # โค้ดเริ่มต้น
@@ -18,36 +28,36 @@ DEFAULT_CODES = {
 }
 
 
+def get_codes():
+    """
+    CodeStore ที่ sync กับ codes.json แล้ว (ถ้าไม่มีไฟล์จะสร้างด้วยโค้ดเริ่มต้น)
+    
+    Returns:
+        CodeStore: ที่เก็บโค้ด
+    """
+    store = get_code_store()
+    store.sync_json(DEFAULT_CODES)
+    return store
+
+
 def load_available_codes():
     """
-    โหลดโค้ดที่มีทั้งหมด
+    โหลดโค้ดที่มีทั้งหมด (อ่านทั้งตาราง - ใช้กับ admin เท่านั้น ตอนแลกโค้ดใช้ get_codes().get)
     
     Returns:
         dict: โค้ดทั้งหมด
     """
-    filepath = "data/json/codes.json"
-    
-    if not os.path.exists(filepath):
-        # สร้างไฟล์ใหม่ด้วยโค้ดเริ่มต้น
-        save_available_codes(DEFAULT_CODES)
-        return DEFAULT_CODES.copy()
-    
-    try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error loading codes: {e}")
-        return DEFAULT_CODES.copy()
+    return get_codes().all_codes()
 
 
 def save_available_codes(codes):
-    """บันทึกโค้ดทั้งหมด"""
-    filepath = "data/json/codes.json"
+    """บันทึกโค้ดทั้งหมดลง codes.json (นำเข้า CodeStore ตอนใช้ครั้งถัดไป)"""
+    filepath = CODES_JSON_PATH
     
     try:
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(codes, f, indent=2)
+        # เขียนไฟล์ใหม่แบบ atomic - CodeStore ไม่มีทางอ่านเจอไฟล์ที่เขียนไม่ครบ
+        wal.write_atomic(filepath, json.dumps(codes, indent=2))
         return True
     except Exception as e:
         print(f"Error saving codes: {e}")
@@ -59,37 +69,22 @@ def load_used_codes(player_slot):
     โหลดโค้ดที่ใช้แล้วของผู้เล่น
     
     Args:
-        player_slot: slot ของผู้เล่น (1 หรือ 2)
+        player_slot: slot ของผู้เล่น
     
     Returns:
         set: โค้ดที่ใช้แล้ว
     """
-    filepath = f"data/json/used_codes_player{player_slot}.json"
-    
-    if not os.path.exists(filepath):
-        return set()
-    
-    try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            return set(data.get('codes', []))
-    except Exception as e:
-        print(f"Error loading used codes: {e}")
-        return set()
+    return get_storage().load_used_codes(player_slot)
 
 
-def save_used_codes(used_codes, player_slot):
-    """บันทึกโค้ดที่ใช้แล้ว"""
-    filepath = f"data/json/used_codes_player{player_slot}.json"
-    
-    try:
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump({'codes': list(used_codes)}, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving used codes: {e}")
-        return False
+def _used_filter(player_slot):
+    """Bloom filter ของโค้ดที่ผู้เล่นใช้แล้ว (สร้างจาก storage ครั้งแรก / เมื่อเต็ม)"""
+    used = _used_filters.get(player_slot)
+    if used is None or bloom.is_saturated(used):
+        used_codes = load_used_codes(player_slot)
+        used = bloom.build(used_codes, max(len(used_codes), 64), CODE_BLOOM_ERROR_RATE)
+        _used_filters[player_slot] = used
+    return used
 
 
 def redeem_code(code, player_slot):
@@ -108,44 +103,55 @@ def redeem_code(code, player_slot):
     if not code:
         return False, "Please enter a code", 0
     
-    # โหลดโค้ดที่มี
-    available_codes = load_available_codes()
+    # ค้นหาโค้ด (index lookup + LRU ไม่ได้โหลดโค้ดทั้งหมด)
+    code_data = get_codes().get(code)
     
-    if code not in available_codes:
+    if code_data is None:
         return False, "Invalid code", 0
     
-    # โหลดโค้ดที่ใช้แล้ว
-    used_codes = load_used_codes(player_slot)
+    # filter บอกว่าอาจใช้แล้ว -> ยืนยันกับ storage (ใช้แล้วจริงไม่ต้องล็อกเพื่อ claim)
+    storage = get_storage()
+    used = _used_filter(player_slot)
+    if bloom.might_contain(used, code) and storage.is_code_used(player_slot, code):
+        return False, "Code already used", 0
+    
+    # ตรวจ + บันทึกว่าใช้แล้วในขั้นตอนเดียว (กันหลาย process ใช้โค้ดเดียวกันซ้ำ)
+    try:
+        claimed = storage.claim_code(player_slot, code)
+    except Exception as e:
+        print(f"Error saving used codes: {e}")
+        return False, "Please try again", 0
+    
+    # ใช้แล้ว (โดยครั้งนี้ หรือ process อื่นก่อนหน้า) - จำไว้ใน filter
+    bloom.add(used, code)
     
-    if code in used_codes:
+    if not claimed:
         return False, "Code already used", 0
     
     # ใช้โค้ด
-    code_data = available_codes[code]
     coins = code_data.get('coins', 0)
     description = code_data.get('description', 'Bonus')
     
-    # บันทึกว่าใช้แล้ว
-    used_codes.add(code)
-    save_used_codes(used_codes, player_slot)
+    journal.log_event('redeem', player_slot, code=code, coins=coins)
     
     return True, f"{description}: +{coins} coins!", coins
 
 
 def add_code(code, coins, description="Bonus"):
-    """เพิ่มโค้ดใหม่ (สำหรับ admin)"""
-    code = code.strip().upper()
-    
-    available_codes = load_available_codes()
-    
-    if code in available_codes:
-        return False
+    """เพิ่มโค้ดใหม่ (สำหรับ admin) - เพิ่มแถวเดียว ไม่เขียนไฟล์ทั้งไฟล์ใหม่"""
+    return get_codes().add(code, coins, description)
+
+
+def import_codes(rows, source='batch'):
+    """
+    นำเข้าโค้ดจำนวนมาก (สำหรับ admin)
     
-    available_codes[code] = {
-        'coins': coins,
-        'description': description
-    }
+    Args:
+        rows: (code, coins, description) ทีละแถว
+        source: ชื่อชุดโค้ด
     
-    save_available_codes(available_codes)
-    return True
+    Returns:
+        int: จำนวนโค้ดที่เพิ่มจริง (โค้ดที่มีอยู่แล้วจะถูกข้าม)
+    """
+    return get_codes().import_codes(rows, source)
 
@@ -0,0 +1,221 @@
+"""
+ฟังก์ชันคำนวณโอกาสสะสมฮีโร่ครบแบบแม่นยำ (coupon collector)
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+ใช้ Markov chain บน state = จำนวนฮีโร่ที่มีแล้วในแต่ละ rarity
+ผลลัพธ์ถูก cache ตาม config ของกล่อง (อัตรา + ขนาด pool) จึงเรียกซ้ำได้ทันที
+"""
+
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+from src.data.hero_data import get_heroes_by_rarity
+
+
+# ลำดับ rarity (เหมือน gacha.RARITY_ORDER)
+RARITY_ORDER = ('rare', 'epic', 'legendary', 'extreme')
+
+# หยุดคำนวณ distribution เมื่อความน่าจะเป็นที่เหลือน้อยกว่านี้
+DEFAULT_TAIL = 1e-9
+
+
+def banner_config(rates):
+    """
+    แปลงอัตราของกล่องเป็น config ที่ hash ได้ ((probability, pool_size), ...)
+
+    rarity ที่ไม่มีฮีโร่ใน pool จะถูกนับเป็น rare (เหมือน gacha.summon_batch)
+    rarity ที่อัตราเป็น 0 จะถูกตัดทิ้ง
+
+    Args:
+        rates: dict ของอัตรา {rarity: probability}
+
+    Returns:
+        tuple: ((p, n), ...) เรียงตาม RARITY_ORDER
+    """
+    return _banner_config(tuple(sorted(rates.items())))
+
+
+@lru_cache(maxsize=None)
+def _banner_config(rate_items):
+    rates = dict(rate_items)
+    probs = {rarity: rates.get(rarity, 0.0) for rarity in RARITY_ORDER}
+    sizes = {rarity: len(get_heroes_by_rarity(rarity)) for rarity in RARITY_ORDER}
+
+    for rarity in RARITY_ORDER[1:]:
+        if sizes[rarity] == 0:
+            probs['rare'] += probs[rarity]
+            probs[rarity] = 0.0
+
+    return tuple(
+        (float(probs[rarity]), sizes[rarity])
+        for rarity in RARITY_ORDER
+        if probs[rarity] > 0 and sizes[rarity] > 0
+    )
+
+
+def reachable_heroes(rates):
+    """จำนวนฮีโร่ที่มีโอกาสได้จากกล่องนี้"""
+    return sum(n for _, n in banner_config(rates))
+
+
+@lru_cache(maxsize=None)
+def _chain(config):
+    """
+    สร้าง Markov chain ของ config (state, ความน่าจะเป็นได้ตัวใหม่ในแต่ละ rarity)
+
+    Returns:
+        tuple: (states, totals, moves, stay)
+            states: list ของ tuple (จำนวนที่มีในแต่ละ rarity)
+            totals: numpy array จำนวนที่มีรวมของแต่ละ state
+            moves: list ของ (src_index, dst_index, probability) ต่อ rarity
+            stay: numpy array ความน่าจะเป็นที่ได้ตัวซ้ำ
+    """
+    sizes = [n for _, n in config]
+    states = list(product(*[range(n + 1) for n in sizes]))
+    index = {state: i for i, state in enumerate(states)}
+
+    totals = np.array([sum(state) for state in states], dtype=np.int64)
+    stay = np.ones(len(states), dtype=np.float64)
+    moves = []
+
+    for r, (p, n) in enumerate(config):
+        src, dst, prob = [], [], []
+        for i, state in enumerate(states):
+            if state[r] < n:
+                q = p * (n - state[r]) / n
+                nxt = state[:r] + (state[r] + 1,) + state[r + 1:]
+                src.append(i)
+                dst.append(index[nxt])
+                prob.append(q)
+                stay[i] -= q
+        moves.append((np.array(src, dtype=np.int64), np.array(dst, dtype=np.int64),
+                      np.array(prob, dtype=np.float64)))
+
+    return states, totals, moves, stay
+
+
+@lru_cache(maxsize=None)
+def _expected(config, k):
+    """ค่าคาดหวังของจำนวนครั้งที่สุ่มจนมีฮีโร่ k ตัว (แก้สมการย้อนจาก state ท้าย)"""
+    states, totals, moves, stay = _chain(config)
+    expected = np.zeros(len(states), dtype=np.float64)
+
+    # state เรียงแบบ product จึงวนจากท้ายไปหน้าได้ (state ถัดไปอยู่หลังเสมอ)
+    outgoing = [[] for _ in states]
+    for src, dst, prob in moves:
+        for s, d, q in zip(src.tolist(), dst.tolist(), prob.tolist()):
+            outgoing[s].append((d, q))
+
+    for i in range(len(states) - 1, -1, -1):
+        if totals[i] >= k:
+            continue
+        leave = 1.0 - stay[i]
+        expected[i] = (1.0 + sum(q * expected[d] for d, q in outgoing[i])) / leave
+
+    return float(expected[0])
+
+
+@lru_cache(maxsize=None)
+def _distribution(config, k, tail):
+    """
+    P(มีฮีโร่ครบ k ตัวภายใน t ครั้ง) สำหรับ t = 0, 1, 2, ...
+
+    Returns:
+        numpy.ndarray: cdf (read-only) ยาวจนความน่าจะเป็นที่เหลือ < tail
+    """
+    states, totals, moves, stay = _chain(config)
+    alive = totals < k
+
+    prob = np.zeros(len(states), dtype=np.float64)
+    prob[0] = 1.0
+    cdf = [0.0 if alive[0] else 1.0]
+
+    while 1.0 - cdf[-1] > tail:
+        # แต่ละ rarity ย้าย state ไปคนละตัวเสมอ จึงบวกด้วย fancy index ได้
+        nxt = prob * stay
+        for src, dst, q in moves:
+            nxt[dst] += prob[src] * q
+        nxt[~alive] = 0.0
+        prob = nxt
+        cdf.append(1.0 - prob.sum())
+
+    result = np.array(cdf, dtype=np.float64)
+    result.flags.writeable = False
+    return result
+
+
+def _resolve_k(rates, k):
+    config = banner_config(rates)
+    total = sum(n for _, n in config)
+    if k is None:
+        k = total
+    if k < 0 or k > total:
+        raise ValueError(f"k must be between 0 and {total} for this banner (got {k})")
+    return config, k
+
+
+def expected_pulls(rates, k=None):
+    """
+    ค่าคาดหวังของจำนวนครั้งที่สุ่มจนมีฮีโร่ต่างกัน k ตัว
+
+    Args:
+        rates: dict ของอัตรา
+        k: จำนวนฮีโร่ที่ต้องการ (ถ้าไม่ระบุ = ครบทุกตัวที่สุ่มได้)
+
+    Returns:
+        float: จำนวนครั้งที่คาดว่าจะต้องสุ่ม
+    """
+    config, k = _resolve_k(rates, k)
+    return _expected(config, k)
+
+
+def pull_cdf(rates, k=None, tail=DEFAULT_TAIL):
+    """
+    Distribution ของจำนวนครั้งที่สุ่มจนมีฮีโร่ k ตัว
+
+    Args:
+        rates: dict ของอัตรา
+        k: จำนวนฮีโร่ที่ต้องการ (ถ้าไม่ระบุ = ครบทุกตัวที่สุ่มได้)
+        tail: หยุดเมื่อความน่าจะเป็นที่เหลือน้อยกว่านี้
+
+    Returns:
+        numpy.ndarray: cdf[t] = P(ครบภายใน t ครั้ง)
+    """
+    config, k = _resolve_k(rates, k)
+    return _distribution(config, k, tail)
+
+
+def pull_percentile(rates, q, k=None):
+    """
+    จำนวนครั้งที่น้อยที่สุดที่ผู้เล่นสัดส่วน q (0-1) สะสมครบ k ตัว
+
+    Returns:
+        int: จำนวนครั้งที่สุ่ม
+    """
+    cdf = pull_cdf(rates, k)
+    return int(min(np.searchsorted(cdf, q - 1e-12), len(cdf) - 1))
+
+
+def expected_coins(rates, cost, k=None, pack_size=1):
+    """
+    ค่าคาดหวังของเหรียญที่ใช้จนมีฮีโร่ k ตัว
+
+    Args:
+        rates: dict ของอัตรา
+        cost: ราคาต่อการซื้อ 1 ครั้ง (เช่น SUMMON_COSTS['mystic_x10'])
+        k: จำนวนฮีโร่ที่ต้องการ
+        pack_size: จำนวนครั้งที่สุ่มต่อการซื้อ (1 หรือ 10)
+
+    Returns:
+        float: เหรียญที่คาดว่าจะต้องใช้
+    """
+    if pack_size == 1:
+        return expected_pulls(rates, k) * cost
+
+    # ซื้อเป็นชุด: ต้องซื้อ ceil(T / pack_size) ชุด
+    cdf = pull_cdf(rates, k)
+    pmf = np.diff(cdf, prepend=0.0)
+    packs = -(-np.arange(len(cdf)) // pack_size)
+    return float((pmf * packs).sum() * cost)
@@ -0,0 +1,61 @@
+"""
+ฟังก์ชันล็อกไฟล์ข้าม process (หลายเกมเปิดพร้อมกันบนเครื่องเดียวใช้ data/json ร่วมกัน)
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+ใช้ fcntl.flock (Linux/macOS) หรือ msvcrt.locking (Windows) กับไฟล์ <path>.lock
+ล็อกจะถูกปล่อยอัตโนมัติถ้า process ตาย (ไม่มีล็อกค้าง)
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+# ล็อกภายใน process เดียวกัน (flock ไม่กัน thread ใน process เดียวกันที่เปิดไฟล์คนละ fd บนบางระบบ)
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+def lock_path(path):
+    return f"{path}.lock"
+
+
+def _thread_lock(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(path, threading.Lock())
+
+
+@contextmanager
+def locked(path):
+    """
+    ล็อก path แบบ exclusive ระหว่างอยู่ใน with (รอจนได้ล็อก)
+
+    Args:
+        path: ไฟล์ที่ต้องการล็อก (ล็อกจริงที่ <path>.lock)
+    """
+    filepath = lock_path(path)
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    with _thread_lock(filepath):
+        fd = os.open(filepath, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
@@ -3,35 +3,151 @@
 ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
 """
 
+import math
 import random
-from src.data.hero_data import get_heroes_by_rarity
+import numpy as np
+from src.data.hero_data import get_heroes_by_rarity, get_hero
 from src.core.config import RARITY_RATES
 
 
-def calculate_rarity(rates=None):
+# ลำดับ rarity ที่ใช้เป็น index ของ array ในการสุ่มแบบ batch
+RARITY_ORDER = ('rare', 'epic', 'legendary', 'extreme')
+
+# pool ของฮีโร่แยกตาม rarity (สร้างครั้งเดียว ไม่ต้อง scan CHARACTER ทุกครั้งที่สุ่ม)
+_HERO_POOLS = {rarity: get_heroes_by_rarity(rarity) for rarity in RARITY_ORDER}
+
+# id ของฮีโร่ทุกตัวเรียงต่อกันตาม RARITY_ORDER + offset/ขนาดของแต่ละ rarity
+_POOL_IDS = np.array(
+    [hero.id for rarity in RARITY_ORDER for hero in _HERO_POOLS[rarity]],
+    dtype=np.int16
+)
+_POOL_SIZES = np.array([len(_HERO_POOLS[rarity]) for rarity in RARITY_ORDER], dtype=np.int64)
+_POOL_OFFSETS = np.concatenate(([0], np.cumsum(_POOL_SIZES)[:-1]))
+
+# rarity ที่ไม่มีฮีโร่ใน pool ให้ใช้ rare แทน (index ตาม RARITY_ORDER)
+_POOL_FALLBACK = np.array([i if size else 0 for i, size in enumerate(_POOL_SIZES)], dtype=np.int64)
+
+# RNG สำหรับการสุ่มแบบ batch
+_rng = np.random.default_rng()
+
+# ความคลาดเคลื่อนที่ยอมรับได้ของผลรวมอัตรา
+RATE_TOLERANCE = 1e-9
+
+# sampler ที่ compile แล้ว แยกตามตารางอัตรา
+_sampler_cache = {}
+
+
+def build_sampler(rates):
     """
-    สุ่ม rarity ตามอัตราที่กำหนด
+    Compile ตารางอัตราเป็นตาราง alias (Walker/Vose) สำหรับสุ่มแบบ O(1)
+    
+    Args:
+        rates: dict ของอัตรา {rarity: probability}
+    
+    Returns:
+        dict: sampler ที่มี 'rarities', 'prob', 'alias' (list) และ
+              'index', 'prob_array', 'alias_array' (numpy สำหรับ summon_batch)
+    
+    Raises:
+        ValueError: ถ้าตารางว่าง มีอัตราติดลบ หรือผลรวมไม่เท่ากับ 1
+    """
+    if not rates:
+        raise ValueError("Rate table is empty")
+    
+    rarities = tuple(rates)
+    for rarity in rarities:
+        if rarity not in RARITY_ORDER:
+            raise ValueError(f"Unknown rarity in rate table: {rarity!r}")
+        if rates[rarity] < 0:
+            raise ValueError(f"Negative rate for {rarity!r}: {rates[rarity]}")
+    
+    total = math.fsum(rates.values())
+    if abs(total - 1.0) > RATE_TOLERANCE:
+        raise ValueError(f"Rates must sum to 1.0 (got {total!r}): {rates}")
+    
+    # Vose's alias method
+    n = len(rarities)
+    scaled = [rates[rarity] * n for rarity in rarities]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] = (scaled[more] + scaled[less]) - 1.0
+        if scaled[more] < 1.0:
+            small.append(more)
+        else:
+            large.append(more)
+    
+    # ที่เหลือ (จาก floating point) ให้มีความน่าจะเป็นเต็มช่อง
+    for i in small + large:
+        prob[i] = 1.0
+    
+    return {
+        'rarities': rarities,
+        'prob': prob,
+        'alias': alias,
+        'index': np.array([RARITY_ORDER.index(rarity) for rarity in rarities], dtype=np.int64),
+        'prob_array': np.array(prob, dtype=np.float64),
+        'alias_array': np.array(alias, dtype=np.int64),
+    }
+
+
+def get_sampler(rates=None):
+    """
+    ดึง sampler ที่ compile แล้วของตารางอัตรา (compile ครั้งแรกครั้งเดียว)
     
     Args:
         rates: dict ของอัตรา (ถ้าไม่ระบุจะใช้ค่าเริ่มต้น)
     
     Returns:
-        str: rarity ('rare', 'epic', 'legendary', 'extreme')
+        dict: sampler จาก build_sampler
     """
     if rates is None:
         rates = RARITY_RATES
     
-    roll = random.random()
-    cumulative = 0.0
+    key = tuple(sorted(rates.items()))
+    sampler = _sampler_cache.get(key)
+    if sampler is None:
+        sampler = build_sampler(rates)
+        _sampler_cache[key] = sampler
+    return sampler
+
+
+def draw_rarity(sampler, rng=random):
+    """
+    สุ่ม rarity จาก sampler (ใช้ random 1 ครั้ง ไม่ต้องวน cumulative)
+    
+    Args:
+        sampler: sampler จาก build_sampler/get_sampler
+        rng: object ที่มี random() (ค่าเริ่มต้นคือโมดูล random)
+    
+    Returns:
+        str: rarity ที่สุ่มได้
+    """
+    u = rng.random() * len(sampler['rarities'])
+    i = int(u)
+    if u - i >= sampler['prob'][i]:
+        i = sampler['alias'][i]
+    return sampler['rarities'][i]
+
+
+def calculate_rarity(rates=None):
+    """
+    สุ่ม rarity ตามอัตราที่กำหนด
     
-    # เรียงจากหายากที่สุดไปหายากน้อยสุด
-    for rarity in ['extreme', 'legendary', 'epic', 'rare']:
-        if rarity in rates:
-            cumulative += rates[rarity]
-            if roll <= cumulative:
-                return rarity
+    Args:
+        rates: dict ของอัตรา (ถ้าไม่ระบุจะใช้ค่าเริ่มต้น)
     
-    return 'rare'  # fallback
+    Returns:
+        str: rarity ('rare', 'epic', 'legendary', 'extreme')
+    """
+    return draw_rarity(get_sampler(rates))
 
 
 def random_hero(rarity=None, rates=None):
@@ -50,16 +166,44 @@ def random_hero(rarity=None, rates=None):
         rarity = calculate_rarity(rates)
     
     # หาตัวละครที่มี rarity นี้
-    heroes = get_heroes_by_rarity(rarity)
+    heroes = _HERO_POOLS.get(rarity)
     
     if not heroes:
         # ถ้าไม่มี ให้ใช้ rare แทน
-        heroes = get_heroes_by_rarity('rare')
+        heroes = _HERO_POOLS['rare']
     
     # สุ่มตัวละคร
     return random.choice(heroes)
 
 
+def summon_batch(count=1, rates=None, rng=None):
+    """
+    สุ่มตัวละครหลายตัวในครั้งเดียวด้วย NumPy (สำหรับ audit/simulation จำนวนมาก)
+    
+    Args:
+        count: จำนวนที่ต้องการสุ่ม
+        rates: อัตราการสุ่ม (ถ้าไม่ระบุจะใช้ค่าเริ่มต้น)
+        rng: numpy.random.Generator (ถ้าไม่ระบุจะใช้ของโมดูล)
+    
+    Returns:
+        numpy.ndarray: id ของตัวละครที่สุ่มได้ (int16, ยาว count)
+    """
+    if rng is None:
+        rng = _rng
+    sampler = get_sampler(rates)
+    
+    # สุ่ม rarity ทั้งหมดทีเดียวด้วยตาราง alias
+    u = rng.random(count) * len(sampler['rarities'])
+    column = u.astype(np.int64)
+    use_alias = (u - column) >= sampler['prob_array'][column]
+    column = np.where(use_alias, sampler['alias_array'][column], column)
+    rarity_idx = _POOL_FALLBACK[sampler['index'][column]]
+    
+    # สุ่มตำแหน่งใน pool ของแต่ละ rarity
+    local_idx = (rng.random(count) * _POOL_SIZES[rarity_idx]).astype(np.int64)
+    return _POOL_IDS[_POOL_OFFSETS[rarity_idx] + local_idx]
+
+
 def summon(count=1, rates=None):
     """
     สุ่มตัวละครหลายตัว
@@ -71,11 +215,13 @@ def summon(count=1, rates=None):
     Returns:
         list: list ของตัวละครที่สุ่มได้
     """
-    heroes = []
-    for _ in range(count):
-        hero = random_hero(rates=rates)
-        heroes.append(hero)
-    return heroes
+    return [get_hero(hero_id) for hero_id in summon_batch(count, rates).tolist()]
+
+
+def _banner_rates(key):
+    """อัตราปัจจุบันของกล่อง (จากไฟล์ตั้งค่าที่โหลดใหม่ได้)"""
+    from src.data.banner_data import get_banner
+    return get_banner(key).rates
 
 
 def summon_mystic(count=1):
@@ -88,12 +234,7 @@ def summon_mystic(count=1):
     Returns:
         list: list ของตัวละครที่สุ่มได้
     """
-    mystic_rates = {
-        'rare': 0.70,
-        'epic': 0.25,
-        'legendary': 0.05
-    }
-    return summon(count, mystic_rates)
+    return summon(count, _banner_rates('mystic'))
 
 
 def summon_celestial(count=1):
@@ -106,5 +247,5 @@ def summon_celestial(count=1):
     Returns:
         list: list ของตัวละครที่สุ่มได้
     """
-    return summon(count, RARITY_RATES)
+    return summon(count, _banner_rates('celestial'))
 
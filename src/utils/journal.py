@@ -0,0 +1,146 @@
+"""
+ฟังก์ชันสำหรับบันทึกเหตุการณ์ (summon / redeem / battle) แบบต่อท้ายไฟล์อย่างเดียว
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+เก็บเป็น JSONL (1 บรรทัด = 1 เหตุการณ์) ใน data/journal/events.jsonl
+เหตุการณ์จะพักใน buffer ก่อน แล้วเขียนลงไฟล์ทีเดียวเมื่อ:
+    - ขนาดใน buffer เกิน JOURNAL_FLUSH_BYTES
+    - ผ่านไป JOURNAL_FLUSH_SECONDS นับจากเหตุการณ์แรกที่ยังไม่ได้เขียน (เช็คใน game loop)
+    - ออกจากเกม (atexit)
+ไฟล์ใหญ่เกิน JOURNAL_MAX_BYTES จะถูกหมุนเป็น events.jsonl.1, .2, ... (เก็บไว้ JOURNAL_KEEP ไฟล์)
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from src.core.config import (JOURNAL_PATH, JOURNAL_FLUSH_BYTES, JOURNAL_FLUSH_SECONDS,
+                             JOURNAL_MAX_BYTES, JOURNAL_KEEP)
+
+
+# buffer ของบรรทัดที่ยังไม่ได้เขียน
+_buffer = []
+_buffer_bytes = 0
+_first_pending = None  # เวลาของเหตุการณ์แรกใน buffer
+_lock = threading.Lock()
+
+
+def log_event(event, player_slot=None, **fields):
+    """
+    บันทึกเหตุการณ์ 1 รายการ (เขียนลงไฟล์ตามรอบ ไม่ใช่ทุกครั้ง)
+
+    Args:
+        event: ชนิดเหตุการณ์ ('summon', 'redeem', 'battle')
+        player_slot: slot ของผู้เล่น
+        **fields: ข้อมูลของเหตุการณ์ (ต้องแปลงเป็น JSON ได้)
+    """
+    global _buffer_bytes, _first_pending
+
+    record = {'ts': round(time.time(), 3), 'event': event, 'slot': player_slot}
+    record.update(fields)
+    line = json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n'
+
+    with _lock:
+        _buffer.append(line)
+        _buffer_bytes += len(line)
+        if _first_pending is None:
+            _first_pending = time.monotonic()
+        full = _buffer_bytes >= JOURNAL_FLUSH_BYTES
+
+    if full:
+        flush()
+
+
+def flush_if_due():
+    """เขียน buffer ถ้าค้างนานเกิน JOURNAL_FLUSH_SECONDS (เรียกทุกเฟรมได้ ถ้าไม่ถึงเวลาแทบไม่เสียอะไร)"""
+    pending = _first_pending
+    if pending is not None and time.monotonic() - pending >= JOURNAL_FLUSH_SECONDS:
+        flush()
+
+
+def flush(filepath=JOURNAL_PATH):
+    """
+    เขียนทุกอย่างใน buffer ลงไฟล์ (append ครั้งเดียว)
+
+    Returns:
+        bool: สำเร็จหรือไม่ (ถ้าไม่สำเร็จจะเก็บไว้ใน buffer เขียนรอบหน้า)
+    """
+    global _buffer, _buffer_bytes, _first_pending
+
+    with _lock:
+        if not _buffer:
+            return True
+
+        data = ''.join(_buffer)
+        try:
+            Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+            _rotate_if_needed(filepath, len(data.encode('utf-8')))
+            with open(filepath, 'a', encoding='utf-8') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"Error writing journal: {e}")
+            return False
+
+        _buffer = []
+        _buffer_bytes = 0
+        _first_pending = None
+        return True
+
+
+def _rotate_if_needed(filepath, incoming):
+    """หมุนไฟล์ถ้าเขียนเพิ่มแล้วจะเกิน JOURNAL_MAX_BYTES (events.jsonl -> .1 -> .2 ...)"""
+    try:
+        size = os.path.getsize(filepath)
+    except OSError:
+        return
+    if size == 0 or size + incoming <= JOURNAL_MAX_BYTES:
+        return
+
+    oldest = f"{filepath}.{JOURNAL_KEEP}"
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for i in range(JOURNAL_KEEP - 1, 0, -1):
+        src = f"{filepath}.{i}"
+        if os.path.exists(src):
+            os.replace(src, f"{filepath}.{i + 1}")
+    os.replace(filepath, f"{filepath}.1")
+
+
+def journal_files(filepath=JOURNAL_PATH):
+    """
+    ไฟล์ journal ทั้งหมดเรียงจากเก่าไปใหม่
+
+    Returns:
+        list: path ของไฟล์ที่มีอยู่
+    """
+    files = [f"{filepath}.{i}" for i in range(JOURNAL_KEEP, 0, -1)] + [filepath]
+    return [path for path in files if os.path.exists(path)]
+
+
+def read_events(filepath=JOURNAL_PATH, event=None):
+    """
+    อ่านเหตุการณ์ทีละรายการจากทุกไฟล์ (รวมไฟล์ที่หมุนแล้ว) แบบ generator
+
+    Args:
+        filepath: path ของไฟล์ journal
+        event: ถ้าระบุ จะคืนเฉพาะเหตุการณ์ชนิดนี้
+
+    Yields:
+        dict: เหตุการณ์
+    """
+    for path in journal_files(filepath):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # บรรทัดที่เขียนไม่จบ (เช่นไฟดับ)
+                if event is None or record.get('event') == event:
+                    yield record
+
+
+# เขียนที่ค้างอยู่ตอนปิดโปรแกรม
+atexit.register(flush)
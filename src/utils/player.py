@@ -2,10 +2,42 @@
 ฟังก์ชันสำหรับจัดการข้อมูลผู้เล่น
 """
 
-import json
-import os
-from pathlib import Path
-from src.core.config import STARTING_COINS
+from src.core.config import STARTING_COINS, SAVE_IN_BACKGROUND
+from src.utils.rng import create_rng_state
+from src.core.storage import get_storage
+from src.core.player_repository import PlayerRepository
+from src.core.save_worker import SaveWorker
+from src.data.hero_collection import HeroCollection
+from src.utils import save_format
+
+
+_repository = None
+
+
+def get_repository():
+    """
+    PlayerRepository ที่ใช้ร่วมกันทั้งเกม (สร้างครั้งแรกครั้งเดียว)
+    
+    Returns:
+        PlayerRepository: cache ข้อมูลผู้เล่นทุก slot
+    """
+    global _repository
+    
+    if _repository is None:
+        storage = get_storage()
+        worker = SaveWorker(storage) if SAVE_IN_BACKGROUND else None
+        _repository = PlayerRepository(storage, read_player_data, worker)
+    return _repository
+
+
+def flush_all():
+    """บันทึกทุก slot ที่ค้างอยู่แล้วรอจนเขียนเสร็จ (ใช้ตอนปิดเกม)"""
+    return get_repository().flush(wait=True)
+
+
+def touch(player_data, *fields):
+    """บอก repository ว่า field เหล่านี้ของผู้เล่นเปลี่ยน (บันทึกตอน flush)"""
+    get_repository().touch(player_data, *fields)
 
 
 def create_player_data():
@@ -17,69 +49,69 @@ def create_player_data():
     """
     return {
         'coins': STARTING_COINS,
-        'owned_heroes': [],
+        'owned_heroes': HeroCollection(),
         'settings': {
             'volume': 10,
             'sound_enabled': True
         },
-        'rank': 0
+        'rank': 0,
+        'rng': create_rng_state()
     }
 
 
-def save_player_data(player_data, player_slot):
+def save_player_data(player_data, player_slot, wait=True):
     """
-    บันทึกข้อมูลผู้เล่น
+    บันทึกข้อมูลผู้เล่น (flush field ที่เปลี่ยนใน repository)
     
     Args:
         player_data: dict ข้อมูลผู้เล่น
-        player_slot: slot ของผู้เล่น (1 หรือ 2)
+        player_slot: slot ของผู้เล่น
+        wait: รอจนเขียนเสร็จหรือไม่ (False = เขียนใน thread แยก ใช้ระหว่างเล่น)
     
     Returns:
         bool: สำเร็จหรือไม่
     """
-    filepath = f"data/json/save_data_player{player_slot}.json"
-    
-    try:
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            json.dump(player_data, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving player data: {e}")
-        return False
+    repository = get_repository()
+    if repository.slot_of(player_data) != player_slot:
+        # dict ที่ไม่ได้มาจาก repository - ใช้แทนข้อมูลเดิมของ slot นี้
+        repository.adopt(player_slot, player_data)
+    # json: บันทึกเฉพาะส่วนที่เปลี่ยนต่อท้าย log / sqlite: update แถวของผู้เล่น
+    return repository.flush(player_slot, wait=wait)
 
 
 def load_player_data(player_slot):
     """
-    โหลดข้อมูลผู้เล่น
+    ข้อมูลผู้เล่นจาก repository - ทุกหน้าจอได้ dict ตัวเดียวกัน (โหลดจาก storage ครั้งเดียว)
     
     Args:
-        player_slot: slot ของผู้เล่น (1 หรือ 2)
+        player_slot: slot ของผู้เล่น
     
     Returns:
         dict: ข้อมูลผู้เล่น (ถ้าไม่มีจะสร้างใหม่)
     """
-    filepath = f"data/json/save_data_player{player_slot}.json"
+    return get_repository().get(player_slot)
+
+
+def read_player_data(player_slot):
+    """
+    อ่านข้อมูลผู้เล่นจาก storage โดยตรง (ไม่ผ่าน cache)
     
-    if not os.path.exists(filepath):
-        print(f"No save file found for Player {player_slot} - creating new")
-        return create_player_data()
+    Args:
+        player_slot: slot ของผู้เล่น
     
+    Returns:
+        dict: ข้อมูลผู้เล่น (ถ้าไม่มีจะสร้างใหม่)
+    """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        storage = get_storage()
+        data = storage.load_player(player_slot)
         
-        # ตรวจสอบว่ามีข้อมูลครบ
-        if 'coins' not in data:
-            data['coins'] = STARTING_COINS
-        if 'owned_heroes' not in data:
-            data['owned_heroes'] = []
-        if 'settings' not in data:
-            data['settings'] = {'volume': 50, 'sound_enabled': True}
-        if 'rank' not in data:
-            data['rank'] = 0
+        if data is None:
+            print(f"No save file found for Player {player_slot} - creating new")
+            return create_player_data()
         
-        return data
+        # เติมข้อมูลที่ขาดตาม migration ของเวอร์ชันที่ backend เก็บ + owned_heroes เป็น HeroCollection
+        return save_format.upgrade(data, storage.schema_version)
     except Exception as e:
         print(f"Error loading player data: {e}")
         return create_player_data()
@@ -89,6 +121,7 @@ def add_coins(player_data, amount):
     """เพิ่มเหรียญ"""
     if amount > 0:
         player_data['coins'] += amount
+        touch(player_data, 'coins')
 
 
 def spend_coins(player_data, amount):
@@ -103,6 +136,7 @@ def spend_coins(player_data, amount):
     
     if player_data['coins'] >= amount:
         player_data['coins'] -= amount
+        touch(player_data, 'coins')
         return True
     return False
 
@@ -116,6 +150,7 @@ def add_hero(player_data, hero_id):
     """
     if hero_id not in player_data['owned_heroes']:
         player_data['owned_heroes'].append(hero_id)
+        touch(player_data, 'owned_heroes')
         return True
     return False
 
@@ -125,14 +160,57 @@ def has_hero(player_data, hero_id):
     return hero_id in player_data['owned_heroes']
 
 
+def owned_collection(player_data):
+    """owned_heroes ของผู้เล่นเป็น HeroCollection (แปลงให้ถ้ายังเป็น list ธรรมดา)"""
+    owned = player_data['owned_heroes']
+    if not isinstance(owned, HeroCollection):
+        owned = player_data['owned_heroes'] = HeroCollection(owned)
+    return owned
+
+
+def count_collected(player_data):
+    """จำนวนฮีโร่ (ไม่ซ้ำ) ที่ผู้เล่นมี"""
+    return owned_collection(player_data).unique_count()
+
+
+def top_heroes(player_data, count):
+    """
+    ฮีโร่ที่แรร์สุดของผู้เล่น (rarity เท่ากันเอาพลังมากกว่าก่อน)
+    
+    Args:
+        count: จำนวนที่ต้องการ
+    
+    Returns:
+        list: hero id
+    """
+    return owned_collection(player_data).top(count)
+
+
+def list_player_slots():
+    """slot ของผู้เล่นทั้งหมดที่มีข้อมูล"""
+    return get_storage().list_slots()
+
+
+def get_leaderboard(order='rank', limit=None):
+    """
+    อันดับผู้เล่นทุก slot (มากไปน้อย)
+    
+    Args:
+        order: 'rank' (แต้มชนะ) หรือ 'total_power' (พลังรวม)
+        limit: จำนวนอันดับที่ต้องการ (ไม่ระบุ = ทั้งหมด)
+    
+    Returns:
+        list: dict {'slot', 'name', 'rank', 'heroes', 'coins', 'total_power'}
+    """
+    return get_repository().leaderboard(order, limit)
+
+
 def get_total_power(player_data):
-    """คำนวณพลังรวม"""
-    from src.data.hero_data import get_hero
-    
-    total = 0
-    for hero_id in player_data['owned_heroes']:
-        hero = get_hero(hero_id)
-        if hero:
-            total += hero.power
-    return total
+    """พลังรวม (HeroCollection อัปเดตไว้ตอนเพิ่มฮีโร่แล้ว ไม่ต้องวนคำนวณ)"""
+    return owned_collection(player_data).total_power
+
+
+def get_rarity_counts(player_data):
+    """จำนวนฮีโร่ตาม rarity {'rare': n, 'epic': n, ...}"""
+    return dict(owned_collection(player_data).rarity_counts)
 
@@ -0,0 +1,78 @@
+"""
+ฟังก์ชันสำหรับ RNG แบบ counter-based (Philox) แยกตามผู้เล่นและจุดประสงค์
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+ทุกการสุ่ม (summon / แจกการ์ด battle) สร้างใหม่ได้จาก (seed, player slot, purpose, counter):
+    - key ของ Philox = (seed, slot + purpose)
+    - counter ของ Philox = เลขลำดับเหตุการณ์ (อยู่ใน word บนสุด)
+เหตุการณ์แต่ละครั้งจึงได้ stream ของตัวเองที่ไม่ทับกัน และ simulator กระโดดไปเหตุการณ์ไหนก็ได้
+โดยไม่ต้องแชร์ state
+"""
+
+import secrets
+import numpy as np
+
+
+# จุดประสงค์ของ stream (ห้ามเปลี่ยนเลข ไม่งั้นสุ่มซ้ำย้อนหลังไม่ได้)
+PURPOSES = {
+    'summon': 1,
+    'deal': 2,
+    'sim': 3,
+}
+
+_MASK64 = (1 << 64) - 1
+
+
+def new_seed():
+    """สุ่ม seed ใหม่ (63 bit เก็บใน JSON ได้)"""
+    return secrets.randbits(63)
+
+
+def create_rng_state():
+    """
+    สร้างข้อมูล RNG ของผู้เล่นใหม่ (เก็บใน player_data['rng'])
+
+    Returns:
+        dict: {'seed': int, <purpose>: counter ถัดไป, ...}
+    """
+    return {'seed': new_seed(), 'summon': 0, 'deal': 0}
+
+
+def stream(seed, player_slot, purpose, counter=0):
+    """
+    สร้าง generator ของเหตุการณ์ที่ counter (สร้างซ้ำได้ผลเหมือนเดิมเสมอ)
+
+    Args:
+        seed: seed ของผู้เล่น (หรือของการ simulation)
+        player_slot: slot ของผู้เล่น (simulator ใช้เป็นเลข worker ได้)
+        purpose: จุดประสงค์ ('summon', 'deal', 'sim')
+        counter: เลขลำดับเหตุการณ์
+
+    Returns:
+        numpy.random.Generator
+    """
+    key = np.array([seed & _MASK64, (int(player_slot) << 8) | PURPOSES[purpose]], dtype=np.uint64)
+    start = np.array([0, 0, 0, counter & _MASK64], dtype=np.uint64)
+    return np.random.Generator(np.random.Philox(key=key, counter=start))
+
+
+def next_stream(player_data, player_slot, purpose):
+    """
+    ดึง generator ของเหตุการณ์ถัดไปของผู้เล่น แล้วเลื่อน counter
+
+    Args:
+        player_data: dict ข้อมูลผู้เล่น
+        player_slot: slot ของผู้เล่น
+        purpose: จุดประสงค์ ('summon', 'deal')
+
+    Returns:
+        tuple: (generator, counter ที่ใช้) - counter ใช้บันทึกไว้สุ่มซ้ำภายหลัง
+    """
+    state = player_data.get('rng')
+    if not state:
+        state = create_rng_state()
+        player_data['rng'] = state
+
+    counter = state.get(purpose, 0)
+    state[purpose] = counter + 1
+    return stream(state['seed'], player_slot, purpose, counter), counter
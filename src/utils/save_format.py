@@ -0,0 +1,176 @@
+"""
+ฟังก์ชันสำหรับไฟล์ save แบบ binary (มีเลขเวอร์ชัน + ตาราง migration)
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+รูปแบบเวอร์ชัน 1 (little-endian):
+    header   '<4sHH'    magic b'HGSV', version, flags (0)
+    fixed    '<qqQQQI'  coins, rank, rng seed, rng summon, rng deal, จำนวนฮีโร่
+    heroes   uint32 x จำนวนฮีโร่ (อ่านเป็น array ตรงๆ ไม่ต้อง parse ทีละตัว)
+    extra    uint32 ความยาว + JSON (settings และ key อื่นๆ ที่ไม่มีช่องเฉพาะ)
+    trailer  uint32 crc32 ของทุกอย่างก่อนหน้า (ไฟล์เสีย -> ValueError)
+
+เวอร์ชัน 0 = dict จากไฟล์ JSON เดิม (key อาจไม่ครบ) - upgrade() เติมให้ครบตาม MIGRATIONS
+"""
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+from src.core.config import STARTING_COINS
+from src.data.hero_collection import HeroCollection
+from src.utils.rng import create_rng_state
+
+
+MAGIC = b'HGSV'
+SCHEMA_VERSION = 1
+
+_HEADER = struct.Struct('<4sHH')
+_FIXED = struct.Struct('<qqQQQI')
+_LENGTH = struct.Struct('<I')
+
+# key ที่มีช่องเฉพาะใน binary (ที่เหลือเก็บใน extra)
+_FIXED_KEYS = ('coins', 'rank', 'owned_heroes', 'rng')
+_RNG_KEYS = ('seed', 'summon', 'deal')
+
+
+# ---------- migration ----------
+
+def _v0_to_v1(data):
+    """JSON เดิม -> v1: เติม key ที่ขาด (ค่าเดียวกับที่ load_player_data เคยเติม)"""
+    data.setdefault('coins', STARTING_COINS)
+    data.setdefault('owned_heroes', [])
+    data.setdefault('settings', {'volume': 50, 'sound_enabled': True})
+    data.setdefault('rank', 0)
+    if not data.get('rng'):
+        data['rng'] = create_rng_state()
+    return data
+
+
+# MIGRATIONS[v] แปลงข้อมูลเวอร์ชัน v -> v + 1
+MIGRATIONS = {
+    0: _v0_to_v1,
+}
+
+
+def upgrade(data, version=0):
+    """
+    แปลงข้อมูลผู้เล่นจากเวอร์ชันเก่าเป็นเวอร์ชันปัจจุบัน
+
+    Args:
+        data: dict ข้อมูลผู้เล่น
+        version: เวอร์ชันของ data (0 = JSON เดิม)
+
+    Returns:
+        dict: ข้อมูลเวอร์ชัน SCHEMA_VERSION (owned_heroes เป็น HeroCollection)
+
+    Raises:
+        ValueError: ถ้าเป็นเวอร์ชันที่ใหม่กว่าที่รู้จัก
+    """
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Save version {version} is newer than supported version {SCHEMA_VERSION}")
+    while version < SCHEMA_VERSION:
+        data = MIGRATIONS[version](data)
+        version += 1
+
+    if not isinstance(data['owned_heroes'], HeroCollection):
+        data['owned_heroes'] = HeroCollection(data['owned_heroes'])
+    return data
+
+
+# ---------- encode / decode ----------
+
+def _hero_array(hero_ids):
+    heroes = array('I', hero_ids)
+    if sys.byteorder == 'big':
+        heroes.byteswap()
+    return heroes
+
+
+def encode(data):
+    """
+    แปลงข้อมูลผู้เล่น (เวอร์ชันปัจจุบัน) เป็น bytes
+
+    Returns:
+        bytes: ไฟล์ save ทั้งไฟล์
+    """
+    rng = data.get('rng') or {}
+    extra = {key: value for key, value in data.items() if key not in _FIXED_KEYS}
+    rng_extra = {key: value for key, value in rng.items() if key not in _RNG_KEYS}
+    if rng_extra:
+        extra['_rng'] = rng_extra
+    extra_bytes = json.dumps(extra, separators=(',', ':')).encode('utf-8')
+
+    heroes = _hero_array(data.get('owned_heroes', []))
+    parts = [
+        _HEADER.pack(MAGIC, SCHEMA_VERSION, 0),
+        _FIXED.pack(data.get('coins', 0), data.get('rank', 0), rng.get('seed', 0),
+                    rng.get('summon', 0), rng.get('deal', 0), len(heroes)),
+        heroes.tobytes(),
+        _LENGTH.pack(len(extra_bytes)),
+        extra_bytes,
+    ]
+    body = b''.join(parts)
+    return body + _LENGTH.pack(zlib.crc32(body))
+
+
+def _decode_v1(view, offset):
+    coins, rank, seed, summon, deal, count = _FIXED.unpack_from(view, offset)
+    offset += _FIXED.size
+
+    heroes = array('I')
+    heroes.frombytes(view[offset:offset + count * heroes.itemsize])
+    if sys.byteorder == 'big':
+        heroes.byteswap()
+    offset += count * heroes.itemsize
+
+    (length,) = _LENGTH.unpack_from(view, offset)
+    offset += _LENGTH.size
+    extra = json.loads(bytes(view[offset:offset + length]))
+
+    rng = {'seed': seed, 'summon': summon, 'deal': deal}
+    rng.update(extra.pop('_rng', {}))
+    data = extra
+    data.update({
+        'coins': coins,
+        'owned_heroes': HeroCollection(heroes),
+        'rank': rank,
+        'rng': rng,
+    })
+    return data
+
+
+# ตัวอ่านของแต่ละเวอร์ชันของรูปแบบ binary (ผลลัพธ์ถูก upgrade ต่อเป็นเวอร์ชันปัจจุบัน)
+_DECODERS = {
+    1: _decode_v1,
+}
+
+
+def decode(blob):
+    """
+    แปลง bytes จาก encode() กลับเป็นข้อมูลผู้เล่น (เวอร์ชันปัจจุบัน)
+
+    Raises:
+        ValueError: ถ้าไม่ใช่ไฟล์ save, ไฟล์เสีย หรือเวอร์ชันไม่รู้จัก
+    """
+    view = memoryview(blob)
+    if len(view) < _HEADER.size + _LENGTH.size:
+        raise ValueError("Save file is truncated")
+
+    magic, version, _flags = _HEADER.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a binary save file")
+
+    (crc,) = _LENGTH.unpack_from(view, len(view) - _LENGTH.size)
+    if zlib.crc32(view[:-_LENGTH.size]) != crc:
+        raise ValueError("Save file is corrupted (checksum mismatch)")
+
+    decoder = _DECODERS.get(version)
+    if decoder is None:
+        raise ValueError(f"Unsupported save version {version}")
+    try:
+        data = decoder(view[:-_LENGTH.size], _HEADER.size)
+    except (struct.error, ValueError) as e:
+        raise ValueError(f"Save file is corrupted: {e}") from e
+    return upgrade(data, version)
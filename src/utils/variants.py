@@ -0,0 +1,194 @@
+"""
+ฟังก์ชันสำหรับรูปย่อที่สร้างไว้ล่วงหน้า (variant) เช่นการ์ด 100x140 หรือ portrait สูง 300px
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+variant ประกาศไว้ใน IMAGE_VARIANTS (config) แยกตามกลุ่มรูป (prefix ของ path)
+    {'size': (w, h)}   ขนาดตายตัว
+    {'height': h}      สูง h px รักษาอัตราส่วน
+    {'factor': f}      ย่อ/ขยาย f เท่า
+สร้างครั้งแรกที่ใช้ด้วย smoothscale (คุณภาพดีกว่า transform.scale) แล้วเก็บลงดิสก์ใน
+VARIANT_CACHE_DIR ชื่อไฟล์มี mtime และขนาดของไฟล์ต้นฉบับ และ hash ของ spec + วิธีย่อ
+- ต้นฉบับเปลี่ยนหรือแก้ spec ใน config ก็สร้างใหม่เอง
+สร้างทั้งหมดล่วงหน้าได้ด้วย: python -m src.tools.build_variants
+
+ไฟล์ variant: header '<4sII' (magic b'HGVR', width, height) + pixel BGRA
+(รูปแบบเดียวกับ convert_alpha() บนจอ 32 bit จึงไม่ต้อง convert)
+"""
+
+import hashlib
+import os
+import struct
+import threading
+
+import pygame
+
+from src.core.config import IMAGE_VARIANTS, VARIANT_CACHE_DIR
+
+
+MAGIC = b'HGVR'
+PIXEL_FORMAT = 'BGRA'
+FILTER = 'smoothscale'  # วิธีย่อ (เป็นส่วนหนึ่งของชื่อไฟล์ cache - เปลี่ยนแล้วสร้างใหม่หมด)
+
+_HEADER = struct.Struct('<4sII')
+
+
+def asset_class(path):
+    """
+    กลุ่มของรูป (prefix ใน IMAGE_VARIANTS)
+
+    Returns:
+        str หรือ None ถ้ารูปนี้ไม่มี variant
+    """
+    for prefix in IMAGE_VARIANTS:
+        if path.startswith(prefix):
+            return prefix
+    return None
+
+
+def resolve(path, scale):
+    """
+    ชื่อ variant ที่ตรงกับ load_image(path, scale)
+
+    Args:
+        path: path ของรูป
+        scale: ชื่อ variant หรือ (width, height)
+
+    Returns:
+        str หรือ None ถ้าไม่มี variant ที่ตรง
+    """
+    prefix = asset_class(path)
+    if prefix is None or not scale:
+        return None
+    variants = IMAGE_VARIANTS[prefix]
+    if isinstance(scale, str):
+        return scale if scale in variants else None
+    size = tuple(scale)
+    for name, spec in variants.items():
+        if spec.get('size') == size:
+            return name
+    return None
+
+
+def variant_size(spec, source_size):
+    """
+    ขนาดของ variant จากขนาดรูปต้นฉบับ (คำนวณแบบเดียวกับที่หน้าจอต่างๆ เคยทำเอง)
+
+    Returns:
+        tuple: (width, height)
+    """
+    width, height = source_size
+    if 'size' in spec:
+        return tuple(spec['size'])
+    if 'height' in spec:
+        scale = spec['height'] / height
+    else:
+        scale = spec['factor']
+    return int(width * scale), int(height * scale)
+
+
+def spec_digest(spec):
+    """hash สั้นๆ ของ spec + วิธีย่อ (แก้ size/height/factor ใน config -> ได้ชื่อไฟล์ใหม่)"""
+    text = repr((FILTER, sorted((key, tuple(value) if isinstance(value, (list, tuple)) else value)
+                                for key, value in spec.items())))
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=4).hexdigest()
+
+
+def cache_path(path, variant, st=None):
+    """
+    ไฟล์ใน VARIANT_CACHE_DIR ของ variant นี้ (ผูกกับ mtime และขนาดของต้นฉบับ และ spec ของ variant)
+
+    Raises:
+        OSError: ถ้าไม่มีไฟล์ต้นฉบับ
+    """
+    if st is None:
+        st = os.stat(path)
+    spec = IMAGE_VARIANTS[asset_class(path)][variant]
+    digest = hashlib.blake2b(path.encode('utf-8'), digest_size=8).hexdigest()
+    return os.path.join(VARIANT_CACHE_DIR, variant,
+                        f"{digest}_{spec_digest(spec)}_{st.st_mtime_ns}_{st.st_size}.bgra")
+
+
+def _read(filepath):
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    magic, width, height = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or len(data) - _HEADER.size != width * height * 4:
+        raise ValueError(f"Invalid variant file {filepath}")
+    return pygame.image.frombytes(data[_HEADER.size:], (width, height), PIXEL_FORMAT)
+
+
+def _write(filepath, surface):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    # ชื่อไฟล์ชั่วคราวแยกตาม thread (preload หลาย thread อาจสร้าง variant เดียวกันพร้อมกัน)
+    tmp = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, *surface.get_size()))
+        f.write(pygame.image.tobytes(surface, PIXEL_FORMAT))
+    os.replace(tmp, filepath)
+
+
+def generate(path, variant):
+    """
+    สร้าง variant จากรูปต้นฉบับ (ไม่เขียนลงดิสก์)
+
+    Returns:
+        pygame.Surface
+    """
+    spec = IMAGE_VARIANTS[asset_class(path)][variant]
+    source = pygame.image.load(path)
+    if source.get_bitsize() < 24:
+        source = source.convert(32, pygame.SRCALPHA)  # smoothscale รับเฉพาะรูป 24/32 bit
+    return pygame.transform.smoothscale(source, variant_size(spec, source.get_size()))
+
+
+def load_variant(path, variant):
+    """
+    โหลด variant จาก cache บนดิสก์ (ไม่มีหรือต้นฉบับเปลี่ยน -> สร้างใหม่แล้วเก็บ)
+    เรียกจาก thread อื่นได้ (ไม่ต้องใช้ display)
+
+    Returns:
+        pygame.Surface หรือ None ถ้าโหลดต้นฉบับไม่ได้
+    """
+    try:
+        filepath = cache_path(path, variant)
+    except OSError:
+        return None  # ไม่มีต้นฉบับ - load_image จะแจ้งเตือนเอง
+
+    if os.path.exists(filepath):
+        try:
+            return _read(filepath)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Rebuilding variant {variant} of {path}: {e}")
+
+    try:
+        surface = generate(path, variant)
+    except (OSError, pygame.error) as e:
+        print(f"Error creating variant {variant} of {path}: {e}")
+        return None
+    try:
+        _write(filepath, surface)
+    except OSError as e:
+        print(f"Cannot cache variant {variant} of {path}: {e}")
+    return surface
+
+
+def prune(keep=None):
+    """
+    ลบไฟล์ variant ที่ต้นฉบับหรือ spec เปลี่ยนไปแล้ว (ไม่มีใครใช้อีก)
+
+    Args:
+        keep: set ของไฟล์ที่ยังใช้อยู่ (None = ไม่ลบอะไร)
+
+    Returns:
+        int: จำนวนไฟล์ที่ลบ
+    """
+    removed = 0
+    if keep is None or not os.path.isdir(VARIANT_CACHE_DIR):
+        return removed
+    for root, _dirs, files in os.walk(VARIANT_CACHE_DIR):
+        for name in files:
+            filepath = os.path.join(root, name)
+            if filepath not in keep:
+                os.remove(filepath)
+                removed += 1
+    return removed
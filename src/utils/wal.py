@@ -0,0 +1,257 @@
+"""
+ฟังก์ชันสำหรับบันทึกไฟล์แบบ write-ahead log (WAL) - บันทึกเฉพาะส่วนที่เปลี่ยน และไม่มีวันเสียหาย
+ไม่ใช้ OOP - เขียนแบบฟังก์ชันธรรมดา
+
+ไฟล์ 1 ชุดประกอบด้วย:
+    - snapshot: <file>.json  (ข้อมูลเต็ม + '_wal_seq' = record สุดท้ายที่รวมไว้แล้ว)
+    - log:      <file>.json.wal  (JSONL: {'seq': n, 'ops': [...]} ต่อท้ายอย่างเดียว)
+
+การ save 1 ครั้ง = diff กับข้อมูลที่ save ล่าสุด -> เขียน 1 record + fsync 1 ครั้ง (O(สิ่งที่เปลี่ยน))
+เมื่อ log ยาวเกิน SAVE_COMPACT_RECORDS จะรวมเป็น snapshot ใหม่ใน thread แยก
+(เขียนไฟล์ชั่วคราว -> fsync -> os.replace) แล้วตัด record ที่รวมแล้วออกจาก log
+
+ตอนโหลด: อ่าน snapshot แล้วเล่น record ที่ seq มากกว่า '_wal_seq' ต่อ
+record สุดท้ายที่เขียนไม่จบ (ไฟดับกลางทาง) จะถูกข้าม
+"""
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+
+from src.core.config import SAVE_COMPACT_RECORDS
+
+
+SEQ_KEY = '_wal_seq'
+
+# สถานะของแต่ละไฟล์ {filepath: {'data': dict ที่ save ล่าสุด, 'seq': int, 'records': int}}
+_files = {}
+_locks = {}
+_locks_guard = threading.Lock()
+
+# seq ล่าสุดที่รวมเป็น snapshot แล้ว (กัน compaction ที่เริ่มก่อนแต่จบทีหลังเขียนทับ snapshot ใหม่)
+_compacted = {}
+
+
+def _lock_for(filepath, kind='log'):
+    with _locks_guard:
+        return _locks.setdefault((filepath, kind), threading.Lock())
+
+
+def wal_path(filepath):
+    return f"{filepath}.wal"
+
+
+# ---------- diff / apply ----------
+
+def diff(old, new):
+    """
+    หาส่วนที่เปลี่ยนระหว่าง dict 2 ตัว (ระดับ key บนสุด)
+
+    - ตัวเลข -> {'op': 'add', 'value': ผลต่าง}
+    - list ที่ต่อท้ายอย่างเดียว -> {'op': 'extend', 'values': ส่วนที่เพิ่ม}
+    - dict -> {'op': 'update', 'values': key ที่เปลี่ยน} (ถ้ามี key หายใช้ 'set')
+    - อื่นๆ -> {'op': 'set', 'value': ค่าใหม่}, key ที่หาย -> {'op': 'del'}
+
+    Returns:
+        list: รายการ op (ว่าง = ไม่มีอะไรเปลี่ยน)
+    """
+    ops = []
+    for key, value in new.items():
+        if key in old and old[key] == value:
+            continue
+        before = old.get(key)
+
+        if (isinstance(value, (int, float)) and isinstance(before, (int, float))
+                and not isinstance(value, bool) and not isinstance(before, bool)):
+            ops.append({'op': 'add', 'key': key, 'value': value - before})
+        elif (isinstance(value, list) and isinstance(before, list)
+              and len(value) > len(before) and value[:len(before)] == before):
+            ops.append({'op': 'extend', 'key': key, 'values': value[len(before):]})
+        elif isinstance(value, dict) and isinstance(before, dict) and before.keys() <= value.keys():
+            changed = {k: v for k, v in value.items() if k not in before or before[k] != v}
+            ops.append({'op': 'update', 'key': key, 'values': changed})
+        else:
+            ops.append({'op': 'set', 'key': key, 'value': value})
+
+    for key in old:
+        if key not in new:
+            ops.append({'op': 'del', 'key': key})
+    return ops
+
+
+def apply(data, ops):
+    """เล่น op จาก diff ลงบน data (แก้ใน dict เดิม)"""
+    for op in ops:
+        key = op['key']
+        kind = op['op']
+        if kind == 'add':
+            data[key] = data.get(key, 0) + op['value']
+        elif kind == 'extend':
+            data.setdefault(key, []).extend(op['values'])
+        elif kind == 'update':
+            data.setdefault(key, {}).update(op['values'])
+        elif kind == 'set':
+            data[key] = op['value']
+        elif kind == 'del':
+            data.pop(key, None)
+    return data
+
+
+# ---------- อ่าน / เขียนไฟล์ ----------
+
+def _read_records(filepath, repair=False):
+    """
+    อ่าน record ทั้งหมดใน log
+
+    record ท้ายที่เขียนไม่จบ (ไฟดับกลางทาง) จะถูกข้าม ถ้า repair=True จะตัดออกจากไฟล์ด้วย
+    (ไม่งั้น record ถัดไปจะถูกเขียนต่อบรรทัดที่เสีย)
+    """
+    path = wal_path(filepath)
+    if not os.path.exists(path):
+        return []
+    records = []
+    good = 0
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                break  # ที่เหลือหลังจากนี้ไม่น่าเชื่อถือ
+            good += len(line)
+
+    if repair and good < os.path.getsize(path):
+        print(f"Warning: Dropping torn record at the end of {path}")
+        with open(path, 'r+b') as f:
+            f.truncate(good)
+    return records
+
+
+def write_atomic(filepath, text):
+    """เขียนไฟล์ใหม่ทั้งไฟล์แบบ atomic (tmp -> fsync -> os.replace)"""
+    tmp = f"{filepath}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filepath)
+
+
+def load(filepath):
+    """
+    โหลดข้อมูล (snapshot + เล่น log ต่อ)
+
+    Returns:
+        dict: ข้อมูล (None ถ้าไม่มีทั้ง snapshot และ log)
+
+    Raises:
+        ValueError: ถ้า snapshot เสียหาย
+    """
+    data = None
+    if os.path.exists(filepath):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    records = _read_records(filepath, repair=True)
+    if data is None and not records:
+        return None
+
+    data = data or {}
+    seq = data.pop(SEQ_KEY, 0)
+    pending = 0
+    for record in records:
+        if record['seq'] > seq:
+            apply(data, record['ops'])
+            seq = record['seq']
+            pending += 1
+
+    _files[filepath] = {'data': copy.deepcopy(data), 'seq': seq, 'records': pending}
+    return data
+
+
+def save(filepath, data):
+    """
+    บันทึกข้อมูล - ต่อท้าย log เฉพาะส่วนที่เปลี่ยน (fsync ครั้งเดียว)
+
+    ถ้ายังไม่เคยโหลด/บันทึกไฟล์นี้ จะเขียน snapshot เต็มแทน
+
+    Returns:
+        bool: สำเร็จหรือไม่
+    """
+    state = _files.get(filepath)
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+    if state is None:
+        seq = _last_seq(filepath)
+        write_snapshot(filepath, data, seq)
+        _files[filepath] = {'data': copy.deepcopy(data), 'seq': seq, 'records': 0}
+        return True
+
+    ops = diff(state['data'], data)
+    if not ops:
+        return True
+
+    seq = state['seq'] + 1
+    line = json.dumps({'seq': seq, 'ops': ops}, separators=(',', ':')) + '\n'
+    with _lock_for(filepath):
+        with open(wal_path(filepath), 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    apply(state['data'], copy.deepcopy(ops))
+    state['seq'] = seq
+    state['records'] += 1
+
+    if state['records'] >= SAVE_COMPACT_RECORDS:
+        state['records'] = 0
+        start_compaction(filepath, copy.deepcopy(state['data']), seq)
+    return True
+
+
+def _last_seq(filepath):
+    records = _read_records(filepath, repair=True)
+    return records[-1]['seq'] if records else 0
+
+
+def write_snapshot(filepath, data, seq):
+    """เขียน snapshot แบบ atomic (มี '_wal_seq' บอกว่ารวม log ถึง record ไหนแล้ว)"""
+    snapshot = dict(data)
+    snapshot[SEQ_KEY] = seq
+    write_atomic(filepath, json.dumps(snapshot, indent=2))
+
+
+def compact(filepath, data, seq):
+    """
+    รวม log ถึง seq เข้า snapshot แล้วตัด record เหล่านั้นออกจาก log
+
+    Args:
+        data: สำเนาของข้อมูล ณ seq (ห้ามเป็น dict ที่ยังถูกแก้อยู่)
+    """
+    with _lock_for(filepath, 'compact'):
+        if seq <= _compacted.get(filepath, -1):
+            return
+        write_snapshot(filepath, data, seq)
+        _compacted[filepath] = seq
+
+        # ระหว่างนี้ save อาจต่อท้าย log อยู่ จึงต้องล็อกตอนเขียน log ใหม่
+        with _lock_for(filepath):
+            remaining = [r for r in _read_records(filepath) if r['seq'] > seq]
+            text = ''.join(json.dumps(r, separators=(',', ':')) + '\n' for r in remaining)
+            write_atomic(wal_path(filepath), text)
+
+
+def start_compaction(filepath, data, seq):
+    """รวม snapshot ใน thread แยก (ไม่บล็อก game loop)"""
+    def run():
+        try:
+            compact(filepath, data, seq)
+        except Exception as e:
+            print(f"Error compacting {filepath}: {e}")
+
+    thread = threading.Thread(target=run, name=f'compact-{os.path.basename(filepath)}', daemon=True)
+    thread.start()
+    return thread